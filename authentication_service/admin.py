@@ -3,7 +3,7 @@ from django.contrib import admin
 from django.conf import settings
 
 # Account Service Imports
-from authentication_service.models import AccountUser
+from authentication_service.models import AccountUser, EmailOutbox, RevokedToken
 
 
 # register user if set in the settings, otherwise don't.
@@ -16,4 +16,19 @@ if settings.REGISTER_USER_MODEL:
             "email", "username", "is_active", "is_email_active", 
             "is_suspended", 
         )
-        list_filter = ("id", "email", "username")
\ No newline at end of file
+        list_filter = ("id", "email", "username")
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = (
+        "id", "subject", "to_email", "status", 
+        "attempts", "next_attempt_at", "date_sent", 
+    )
+    list_filter = ("status",)
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ("id", "jti", "token_type", "user_id", "expires_at", "date_revoked")
+    search_fields = ("jti",)
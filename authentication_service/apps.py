@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AuthenticationServiceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication_service"
+    
+    def ready(self) -> None:
+        from authentication_service import signals  # noqa: F401
@@ -0,0 +1,48 @@
+# Python Imports
+import asyncio
+
+# Rest Framework Imports
+from rest_framework import views
+
+# Account Service Imports
+from authentication_service.services.instrumentation.profiling import sync_to_async
+
+
+class AsyncViewMixin:
+    """
+    Runs the `async def` handlers of a DRF view natively under ASGI.
+
+    Authentication, permissions and throttles may query the database,
+    so they run in a thread; the handlers await their own I/O.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+
+            # OPTIONS and the not allowed methods are handled synchronously
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncAPIView(AsyncViewMixin, views.APIView):
+    pass
@@ -0,0 +1,112 @@
+# Django Imports
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+# SimpleJWT Imports
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+# Account Service Imports
+from authentication_service.routers import use_primary
+from authentication_service.services.users.cache import cache_user, get_cached_user
+from authentication_service.services.users.epochs import epoch_table
+from authentication_service.services.users.identity import get_user
+
+
+class IdentityMapJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user through the request identity map,
+    so the views reuse the authenticated user instead of querying it again.
+    """
+    
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        
+        try:
+            user = get_user(**{api_settings.USER_ID_FIELD: user_id})
+        except (TypeError, ValueError):
+            user = None
+            
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+
+class CachedJWTAuthentication(IdentityMapJWTAuthentication):
+    """
+    JWT authentication that resolves the user from a process LRU, then the
+    Django cache, and only queries the database on a miss. Entries are
+    invalidated when the user's active, suspended or staff status or
+    password changes.
+    """
+    
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        
+        user = get_cached_user(user_id)
+        
+        if user is None:
+            # A lagging replica would cache a user invalidated since
+            with use_primary():
+                user = super().get_user(validated_token)
+            cache_user(user)
+            
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        
+        return user
+
+
+class AccountTokenUser(TokenUser):
+    """The user of a token, built from its claims without a query"""
+    
+    @cached_property
+    def is_suspended(self):
+        return self.token.get("is_suspended", False)
+    
+    @cached_property
+    def credential_epoch(self):
+        return self.token["epoch"]
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that never loads the user. The claims of the token
+    are trusted as long as its credential epoch matches the in-memory
+    epoch table, so a password change, a suspension or a change of staff
+    status rejects the older tokens within `credential_epoch_refresh_interval`
+    seconds.
+    """
+    
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+            epoch = validated_token["epoch"]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        
+        state = epoch_table.get(user_id)
+        
+        if state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        
+        if not state.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        
+        # A demoted admin mustn't keep the permissions of its staff claim
+        if state.is_suspended or state.epoch != epoch or state.is_staff != validated_token.get("is_staff", False):
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+        
+        return AccountTokenUser(validated_token)
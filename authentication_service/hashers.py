@@ -0,0 +1,135 @@
+# Standard Library Imports
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+# Typing Imports
+from typing import List
+
+# Django Imports
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    get_hasher,
+    get_hashers,
+    get_hashers_by_algorithm,
+)
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+logger = logging.getLogger(__name__)
+
+# Django's parameters, which a calibration never goes below: stored hashes
+# are rehashed with the calibrated parameters on the next login
+MINIMUM_PARAMS = {
+    PBKDF2PasswordHasher.algorithm: {"iterations": PBKDF2PasswordHasher.iterations},
+    Argon2PasswordHasher.algorithm: {
+        "time_cost": Argon2PasswordHasher.time_cost,
+        "memory_cost": Argon2PasswordHasher.memory_cost,
+    },
+    ScryptPasswordHasher.algorithm: {
+        "work_factor": ScryptPasswordHasher.work_factor,
+        "block_size": ScryptPasswordHasher.block_size,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def load_calibration(path: str) -> dict:
+    """Reads the file written by `manage.py calibrate_hashers`"""
+
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def get_calibration() -> dict:
+    path = settings.AUTHENTICATION_SERVICE.get("password_hasher_calibration")
+
+    if not path:
+        return {}
+    return load_calibration(str(path))
+
+
+def get_weaker_params(algorithm: str, params: dict) -> List[str]:
+    """The names of the parameters below Django's for the algorithm"""
+
+    return [
+        name for name, minimum in MINIMUM_PARAMS.get(algorithm, {}).items()
+        if params.get(name, minimum) < minimum
+    ]
+
+
+def get_calibrated_params(algorithm: str) -> dict:
+    params = get_calibration().get("hashers", {}).get(algorithm, {}).get("params", {})
+    weaker = get_weaker_params(algorithm, params)
+
+    if weaker:
+        logger.warning("Ignored the %s calibration, its %s are below Django's.", algorithm, ", ".join(weaker))
+        return {}
+    return params
+
+
+def get_preferred_hasher():
+    """
+    The hasher new passwords are hashed with: the one picked by
+    `calibrate_hashers`, or the first of `PASSWORD_HASHERS`.
+    """
+
+    algorithm = get_calibration().get("preferred")
+
+    if algorithm:
+        try:
+            return get_hasher(algorithm)
+        except ValueError:
+            # the calibrated hasher isn't in PASSWORD_HASHERS
+            pass
+    return get_hasher("default")
+
+
+def clear_calibration() -> None:
+    """Reloads the calibration and the hashers built from it"""
+
+    load_calibration.cache_clear()
+    get_hashers.cache_clear()
+    get_hashers_by_algorithm.cache_clear()
+
+
+@receiver(setting_changed)
+def reset_calibration(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        clear_calibration()
+
+
+class CalibratedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2 with the number of iterations picked by `calibrate_hashers`"""
+
+    def __init__(self) -> None:
+        params = get_calibrated_params(self.algorithm)
+        self.iterations = params.get("iterations", self.iterations)
+
+
+class CalibratedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2 with the time and memory cost picked by `calibrate_hashers`"""
+
+    def __init__(self) -> None:
+        params = get_calibrated_params(self.algorithm)
+        self.time_cost = params.get("time_cost", self.time_cost)
+        self.memory_cost = params.get("memory_cost", self.memory_cost)
+        self.parallelism = params.get("parallelism", self.parallelism)
+
+
+class CalibratedScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with the work factor picked by `calibrate_hashers`"""
+
+    def __init__(self) -> None:
+        params = get_calibrated_params(self.algorithm)
+        self.work_factor = params.get("work_factor", self.work_factor)
+        self.block_size = params.get("block_size", self.block_size)
+        self.parallelism = params.get("parallelism", self.parallelism)
+        self.maxmem = params.get("maxmem", self.maxmem)
@@ -0,0 +1,38 @@
+# Python Imports
+import threading
+
+# Typing Imports
+from typing import Callable
+
+# Django Imports
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+
+
+def lazy_view(dotted_path: str) -> Callable[..., HttpResponse]:
+    """
+    A view imported on its first request, so that every worker doesn't
+    import the modules of a rarely used route when it starts.
+
+    The CSRF middleware checks the view before it is imported, so only
+    use it for views that aren't `csrf_exempt`, or only serve safe methods.
+    """
+
+    view = None
+    lock = threading.Lock()
+
+    def load() -> Callable[..., HttpResponse]:
+        nonlocal view
+
+        if view is None:
+            with lock:
+                if view is None:
+                    view = import_string(dotted_path)
+        return view
+
+    def lazy(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return load()(request, *args, **kwargs)
+
+    lazy.__name__ = lazy.__qualname__ = dotted_path.rpartition(".")[2]
+    lazy.__module__ = dotted_path.rpartition(".")[0]
+    return lazy
@@ -0,0 +1,207 @@
+# Standard Library Imports
+import hashlib
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Account Service Imports
+from authentication_service.hashers import (
+    CalibratedArgon2PasswordHasher,
+    CalibratedPBKDF2PasswordHasher,
+    CalibratedScryptPasswordHasher,
+    MINIMUM_PARAMS,
+    clear_calibration,
+    get_weaker_params,
+)
+
+
+# Hashers in order of preference
+ALGORITHMS = ("argon2", "scrypt", "pbkdf2_sha256")
+
+PASSWORD = "calibrate_hashers-password"
+
+
+def measure_verify(hasher, samples: int) -> float:
+    """Median verify latency of the hasher in milliseconds"""
+
+    encoded = hasher.encode(PASSWORD, hasher.salt())
+    timings = []
+
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        hasher.verify(PASSWORD, encoded)
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(timings)
+
+
+def is_available(algorithm: str) -> bool:
+    if algorithm == "argon2":
+        try:
+            import argon2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    if algorithm == "scrypt":
+        return hasattr(hashlib, "scrypt")
+
+    return True
+
+
+def calibrate_pbkdf2(target_ms: float, samples: int) -> dict:
+    """PBKDF2 runtime is linear in the number of iterations"""
+
+    minimum = MINIMUM_PARAMS[CalibratedPBKDF2PasswordHasher.algorithm]["iterations"]
+    hasher = CalibratedPBKDF2PasswordHasher()
+    hasher.iterations = minimum
+
+    for _ in range(2):
+        elapsed = measure_verify(hasher, samples)
+        hasher.iterations = max(int(round(hasher.iterations * target_ms / elapsed, -3)), minimum)
+
+    return {"iterations": hasher.iterations}
+
+
+def calibrate_scrypt(target_ms: float, samples: int) -> dict:
+    """Scrypt work factors are powers of two, keep the closest to the target"""
+
+    hasher = CalibratedScryptPasswordHasher()
+    hasher.work_factor = MINIMUM_PARAMS[CalibratedScryptPasswordHasher.algorithm]["work_factor"]
+    best = None
+
+    while hasher.work_factor <= 2 ** 22:
+        hasher.maxmem = 2 * 128 * hasher.work_factor * hasher.block_size * hasher.parallelism
+        elapsed = measure_verify(hasher, samples)
+
+        if best is None or abs(elapsed - target_ms) < abs(best[1] - target_ms):
+            best = (hasher.work_factor, elapsed)
+
+        if elapsed >= target_ms:
+            break
+        hasher.work_factor *= 2
+
+    work_factor = best[0]
+    return {
+        "work_factor": work_factor,
+        "block_size": hasher.block_size,
+        "parallelism": hasher.parallelism,
+        "maxmem": 2 * 128 * work_factor * hasher.block_size * hasher.parallelism,
+    }
+
+
+def calibrate_argon2(target_ms: float, samples: int) -> dict:
+    """Argon2 runtime is linear in the time cost at a fixed memory cost"""
+
+    minimum = MINIMUM_PARAMS[CalibratedArgon2PasswordHasher.algorithm]
+    hasher = CalibratedArgon2PasswordHasher()
+    hasher.time_cost = minimum["time_cost"]
+
+    for _ in range(2):
+        elapsed = measure_verify(hasher, samples)
+        hasher.time_cost = max(round(hasher.time_cost * target_ms / elapsed), minimum["time_cost"])
+
+    return {
+        "time_cost": hasher.time_cost,
+        "memory_cost": hasher.memory_cost,
+        "parallelism": hasher.parallelism,
+    }
+
+
+CALIBRATORS = {
+    "argon2": (calibrate_argon2, CalibratedArgon2PasswordHasher),
+    "scrypt": (calibrate_scrypt, CalibratedScryptPasswordHasher),
+    "pbkdf2_sha256": (calibrate_pbkdf2, CalibratedPBKDF2PasswordHasher),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the available password hashers on this host and writes "
+        "the parameters that hit the target verify latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms", type=float, default=250.0,
+            help="Target verify latency of a password in milliseconds."
+        )
+        parser.add_argument(
+            "--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS,
+            help="Hashers to calibrate."
+        )
+        parser.add_argument(
+            "--preferred", choices=ALGORITHMS,
+            help="Hasher new passwords are hashed with, defaults to the strongest available."
+        )
+        parser.add_argument(
+            "--samples", type=int, default=5,
+            help="Verify calls timed per measurement."
+        )
+        parser.add_argument(
+            "--output",
+            default=settings.AUTHENTICATION_SERVICE.get("password_hasher_calibration"),
+            help="Calibration file, defaults to AUTHENTICATION_SERVICE['password_hasher_calibration']."
+        )
+
+    def handle(self, *args, **options):
+        if not options["output"]:
+            raise CommandError("Set AUTHENTICATION_SERVICE['password_hasher_calibration'] or pass --output.")
+
+        target_ms = options["target_ms"]
+        samples = options["samples"]
+        hashers = {}
+
+        for algorithm in options["algorithms"]:
+            if not is_available(algorithm):
+                self.stdout.write(f"{algorithm}: not available on this host, skipped.")
+                continue
+
+            calibrate, hasher_class = CALIBRATORS[algorithm]
+            params = calibrate(target_ms, samples)
+
+            # Logins would rehash the stored passwords with them
+            weaker = get_weaker_params(algorithm, params)
+            if weaker:
+                raise CommandError(f"{algorithm}: {', '.join(weaker)} below Django's, the calibration wasn't written.")
+
+            # Measure the picked parameters once more to report them
+            hasher = hasher_class()
+            for name, value in params.items():
+                setattr(hasher, name, value)
+            verify_ms = measure_verify(hasher, samples)
+
+            hashers[algorithm] = {"params": params, "verify_ms": round(verify_ms, 2)}
+            self.stdout.write(f"{algorithm}: {params} -> {verify_ms:.1f} ms per verify")
+
+            if verify_ms > target_ms * 1.5:
+                self.stdout.write(f"{algorithm}: slower than the target, Django's parameters are the minimum.")
+
+        if not hashers:
+            raise CommandError("None of the requested hashers is available.")
+
+        preferred = options["preferred"] or next(a for a in ALGORITHMS if a in hashers)
+
+        if preferred not in hashers:
+            raise CommandError(f"{preferred} was not calibrated.")
+
+        calibration = {
+            "preferred": preferred,
+            "target_ms": target_ms,
+            "calibrated_at": datetime.now(timezone.utc).isoformat(),
+            "hashers": hashers,
+        }
+
+        Path(options["output"]).write_text(json.dumps(calibration, indent=4))
+        clear_calibration()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {options['output']}, new passwords will be hashed with {preferred}. "
+            "Restart the workers to load it; stored hashes are upgraded on the next login."
+        ))
@@ -0,0 +1,35 @@
+# Standard Library Imports
+from pathlib import Path
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Account Service Imports
+from authentication_service import schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the OpenAPI schema in every format, e.g. at build time, to the api_schema_path "
+        "setting. The workers serve it until the URLconf changes, instead of generating it again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", "-o", default=None,
+            help="File the schema is written to, defaults to the api_schema_path setting."
+        )
+        parser.add_argument("--api-version", default="", help="API version of the schema.")
+
+    def handle(self, *args, **options):
+        from core.docs import schema_view
+
+        output = options["output"] or schema.api_schema_path
+        if not output:
+            raise CommandError("Set AUTHENTICATION_SERVICE['api_schema_path'] or pass --output.")
+
+        errors = schema.save_documents(Path(output), schema_view, options["api_version"])
+
+        for format, error in errors.items():
+            self.stderr.write(f"Skipped the {format} schema: {error}")
+        self.stdout.write(f"Wrote the schema of URLconf {schema.urlconf_fingerprint()} to {output}.")
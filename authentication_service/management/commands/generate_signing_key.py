@@ -0,0 +1,66 @@
+# Standard Library Imports
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Cryptography Imports
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+
+def generate_private_key(algorithm: str):
+    if algorithm.startswith("RS"):
+        return rsa.generate_private_key(public_exponent=65537, key_size=3072)
+
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a JWT signing key. Put it first in AUTHENTICATION_SERVICE['jwt_signing_keys'] "
+        "to rotate keys, and keep the previous keys until the tokens they signed expire."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--algorithm", choices=("RS256", "ES256", "EdDSA"), default="RS256",
+            help="Signing algorithm of the key."
+        )
+        parser.add_argument(
+            "--kid", default=datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S"),
+            help="Key id tagged on the tokens, defaults to the current time."
+        )
+        parser.add_argument(
+            "--output-dir", default="keys",
+            help="Directory the private key is written to."
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["output_dir"]) / f"{options['kid']}.pem"
+
+        if path.exists():
+            raise CommandError(f"{path} already exists.")
+
+        private_key = generate_private_key(options["algorithm"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Readable by the owner only
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as key_file:
+            key_file.write(private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            ))
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}, add it to the signing keys:"))
+        self.stdout.write(
+            f'    {{"kid": "{options["kid"]}", "algorithm": "{options["algorithm"]}", '
+            f'"private_key_path": "{path}"}}'
+        )
@@ -0,0 +1,54 @@
+# Standard Library Imports
+import subprocess
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Account Service Imports
+from authentication_service.services.instrumentation.importtime import (
+    ENTRYPOINTS,
+    measure_imports,
+    package_import_times,
+    total_import_time
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports the modules a worker imports before its first request, timed with `python -X importtime`, "
+        "and fails when they take longer than --budget milliseconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entrypoint", choices=tuple(ENTRYPOINTS), default="wsgi",
+            help="Application the worker imports."
+        )
+        parser.add_argument("--top", type=int, default=20, help="Number of modules and packages listed.")
+        parser.add_argument(
+            "--budget", type=float, default=None,
+            help="Milliseconds the imports may take, e.g. in CI."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            records = measure_imports(options["entrypoint"])
+        except subprocess.CalledProcessError as exc:
+            raise CommandError(f"The {options['entrypoint']} application failed to import:\n{exc.stderr}")
+
+        total = total_import_time(records) / 1000
+        top = options["top"]
+
+        self.stdout.write(f"{'package':<40} {'ms':>9} {'share':>7}")
+        for package, self_us in list(package_import_times(records).items())[:top]:
+            self.stdout.write(f"{package:<40} {self_us / 1000:>9.1f} {self_us / 1000 / total:>7.1%}")
+
+        # A module's time includes the modules it imported first
+        self.stdout.write(f"\n{'module, with its imports':<40} {'ms':>9}")
+        for record in sorted(records, key=lambda record: record.cumulative_us, reverse=True)[:top]:
+            self.stdout.write(f"{'  ' * record.depth + record.module:<40} {record.cumulative_us / 1000:>9.1f}")
+
+        self.stdout.write(f"\n{len(records)} modules imported in {total:.1f} ms")
+
+        if options["budget"] is not None and total > options["budget"]:
+            raise CommandError(f"The imports took {total:.1f} ms, over the budget of {options['budget']:.1f} ms.")
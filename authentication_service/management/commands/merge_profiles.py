@@ -0,0 +1,55 @@
+# Standard Library Imports
+import pstats
+from pathlib import Path
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Account Service Imports
+from authentication_service.services.instrumentation import profiling
+
+
+class Command(BaseCommand):
+    help = (
+        "Merges the profiles of the profiled requests: the sampled stacks into one collapsed "
+        "file for flamegraph.pl or speedscope, or the cProfile runs into one pstats file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir", default=None,
+            help="Directory the profiles are read from, defaults to the profiling_dir setting."
+        )
+        parser.add_argument(
+            "--view", default="",
+            help="Only merges the profiles of the views whose name contains this, e.g. login."
+        )
+        parser.add_argument(
+            "--format", choices=("collapsed", "pstats"), default="collapsed",
+            help="Profiles merged: sampled stacks or cProfile runs."
+        )
+        parser.add_argument(
+            "--output", "-o", required=True,
+            help="File the merged profile is written to."
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"] or profiling.profiling_dir)
+        paths = sorted(
+            path for path in profiling.iter_profiles(directory, suffixes=(f".{options['format']}",))
+            if options["view"] in path.stem.split("-", 2)[-1]
+        )
+
+        if not paths:
+            raise CommandError(f"No {options['format']} profiles in {directory}.")
+
+        output = Path(options["output"])
+
+        if options["format"] == "pstats":
+            stats = pstats.Stats(*map(str, paths))
+            stats.dump_stats(output)
+        else:
+            stacks = profiling.merge_collapsed(paths)
+            output.write_text("".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items())))
+
+        self.stdout.write(f"Merged {len(paths)} profile(s) into {output}.")
@@ -0,0 +1,66 @@
+# Standard Library Imports
+import time
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Account Service Imports
+from authentication_service.services.emails.outbox import (
+    deliver_outbox,
+    outbox_batch_size,
+    outbox_max_attempts,
+    outbox_retry_delay
+)
+
+
+class Command(BaseCommand):
+    help = "Delivers the queued verification and reset password emails in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=outbox_batch_size,
+            help="Number of emails sent over one connection."
+        )
+        parser.add_argument(
+            "--max-attempts", type=int, default=outbox_max_attempts,
+            help="Number of attempts before an email is marked as failed."
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=1.0,
+            help="Seconds to wait when the outbox is empty."
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Drain the outbox once and exit."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        max_attempts = options["max_attempts"]
+        poll_interval = options["poll_interval"]
+
+        try:
+            while True:
+                try:
+                    sent, failed = deliver_outbox(batch_size=batch_size, max_attempts=max_attempts)
+
+                except Exception as exc:
+                    # The connection could not be opened, back off and try again
+                    self.stderr.write(f"Email outbox delivery failed: {exc!r}")
+
+                    if options["once"]:
+                        return
+                    time.sleep(outbox_retry_delay)
+                    continue
+
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent} email(s), {failed} failed.")
+
+                # Keep draining while full batches are coming in
+                if sent + failed < batch_size:
+                    if options["once"]:
+                        return
+                    time.sleep(poll_interval)
+
+        except KeyboardInterrupt:
+            return
@@ -0,0 +1,19 @@
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Account Service Imports
+from authentication_service.services.instrumentation.profiling import (
+    PROFILING_HEADER,
+    make_profiling_token,
+    profiling_token_max_age
+)
+
+
+class Command(BaseCommand):
+    help = (
+        f"Prints a signed {PROFILING_HEADER} header, the requests sent with it "
+        f"are profiled for the next {profiling_token_max_age} seconds."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{PROFILING_HEADER}: {make_profiling_token()}")
@@ -0,0 +1,22 @@
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Account Service Imports
+from authentication_service.services.tokens.revocation import (
+    purge_expired_tokens,
+    token_revocation_purge_batch_size
+)
+
+
+class Command(BaseCommand):
+    help = "Deletes the revoked tokens that have expired, run it periodically e.g. from cron."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=token_revocation_purge_batch_size,
+            help="Number of tokens deleted per statement."
+        )
+
+    def handle(self, *args, **options):
+        purged = purge_expired_tokens(batch_size=options["batch_size"])
+        self.stdout.write(f"Purged {purged} expired token(s).")
@@ -1,11 +1,35 @@
+# Python Imports
+import unicodedata
+
 # Django Imports
 from django.contrib.auth.models import BaseUserManager
 from django.db import transaction
 
 
+def canonical_email(email: str) -> str:
+    """
+    The form emails are stored and looked up in, so that lookups 
+    can use the unique index on email instead of `email__iexact`
+    """
+    if email is None:
+        return email
+    return email.strip().lower()
+
+
+def canonical_username(username: str) -> str:
+    """Usernames keep their case; they are unique by `Lower(username)`"""
+    if username is None:
+        return username
+    return unicodedata.normalize("NFKC", username).strip()
+
+
 class UserManager(BaseUserManager):
     use_in_migrations: bool = True
     
+    def get_by_natural_key(self, username: str):
+        """Looks up the user to log in by their canonical email"""
+        return self.get(**{self.model.USERNAME_FIELD: canonical_email(username)})
+    
     def create_user(
         self,
         firstname: str,
@@ -31,8 +55,8 @@ class UserManager(BaseUserManager):
         user = self.model(
             firstname=firstname,
             lastname=lastname,
-            username=username,
-            email=self.normalize_email(email),
+            username=canonical_username(username),
+            email=canonical_email(email),
             phone_number="",
         )
         user.set_password(password)
@@ -0,0 +1,200 @@
+# Python Imports
+import time
+
+# Typing Imports
+from typing import Callable
+
+# Django Imports
+from django.http import HttpRequest, HttpResponse
+
+# ASGI Imports
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+# Account Service Imports
+from authentication_service.routers import database_scope
+from authentication_service.services.instrumentation.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+from authentication_service.services.instrumentation.profiling import profile_request, should_profile
+from authentication_service.services.instrumentation.timings import (
+    install_query_timers,
+    report_timings,
+    request_timings_scope,
+    should_time
+)
+from authentication_service.services.users.identity import user_identity_scope
+
+
+class UserIdentityMapMiddleware:
+    """
+    Opens a user identity map for every request, so that each 
+    user is loaded from the database at most once per request.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        
+        # Under ASGI, the request stays on the event loop
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        with user_identity_scope():
+            return self.get_response(request)
+        
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with user_identity_scope():
+            return await self.get_response(request)
+
+
+class ServerTimingMiddleware:
+    """
+    Times a sample of the API requests: in total, in the database, hashing
+    passwords, queueing emails and calling the OAuth providers. The timings
+    are logged, and sent back in a Server-Timing header.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        
+        # Connections opened later get their timer when they connect
+        install_query_timers()
+        
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        if not should_time(request):
+            return self.get_response(request)
+        
+        with request_timings_scope() as timings:
+            started_at = time.perf_counter()
+            response = self.get_response(request)
+            
+        report_timings(request, response, timings, time.perf_counter() - started_at)
+        return response
+        
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not should_time(request):
+            return await self.get_response(request)
+        
+        with request_timings_scope() as timings:
+            started_at = time.perf_counter()
+            response = await self.get_response(request)
+            
+        report_timings(request, response, timings, time.perf_counter() - started_at)
+        return response
+
+
+
+class RequestMetricsMiddleware:
+    """
+    Counts the requests of each view by status code, and
+    observes their latency, for the /metrics endpoint.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        
+        self.observe(request, response, time.perf_counter() - started_at)
+        return response
+        
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started_at = time.perf_counter()
+        response = await self.get_response(request)
+        
+        self.observe(request, response, time.perf_counter() - started_at)
+        return response
+    
+    def observe(self, request: HttpRequest, response: HttpResponse, duration: float) -> None:
+        # The view name rather than the path, which may carry uid and tokens
+        resolver_match = getattr(request, "resolver_match", None)
+        view = resolver_match.view_name if resolver_match is not None else "unresolved"
+        
+        HTTP_REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        HTTP_REQUEST_DURATION.observe(duration, view=view, method=request.method)
+
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a sample of the API requests, and the requests sent with a
+    valid signed X-Profile-Request header, to `profiling_dir`.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        if not should_profile(request):
+            return self.get_response(request)
+        
+        with profile_request(request):
+            return self.get_response(request)
+        
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not should_profile(request):
+            return await self.get_response(request)
+        
+        with profile_request(request, asynchronous=True):
+            return await self.get_response(request)
+
+
+
+class DatabaseRoutingMiddleware:
+    """
+    Keeps the reads of a request on the primary database once it wrote,
+    so that it reads its own writes instead of a lagging replica.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        with database_scope():
+            return self.get_response(request)
+        
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with database_scope():
+            return await self.get_response(request)
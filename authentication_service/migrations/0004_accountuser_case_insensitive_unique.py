@@ -0,0 +1,22 @@
+# Generated by Django 4.1 on 2026-10-18 10:56
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_service', '0003_emailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='accountuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='users_email_ci_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='accountuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='users_username_ci_unique'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def canonicalize_emails(apps, schema_editor):
+    """
+    Stores every email in lower case. The case-insensitive unique
+    constraint on email guarantees that this can't create duplicates.
+    """
+    AccountUser = apps.get_model("authentication_service", "AccountUser")
+    AccountUser.objects.update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_service', '0004_accountuser_case_insensitive_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1 on 2026-10-18 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_service', '0005_canonicalize_accountuser_email'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='accountuser',
+            name='users_usernam_3053c0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='accountuser',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['email'], name='users_active_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountuser',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['email'], name='users_inactive_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountuser',
+            index=models.Index(condition=models.Q(('is_suspended', True)), fields=['email'], name='users_suspended_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountuser',
+            index=models.Index(fields=['date_created'], name='users_date_created_idx'),
+        ),
+    ]
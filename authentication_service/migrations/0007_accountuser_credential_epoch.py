@@ -0,0 +1,22 @@
+# Generated by Django 4.1 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_service', '0006_accountuser_workload_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountuser',
+            name='credential_epoch',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='accountuser',
+            index=models.Index(fields=['date_modified'], name='users_date_modified_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1 on 2026-10-18 12:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_service', '0008_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='accountuser',
+            name='users_active_email_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='accountuser',
+            name='users_inactive_email_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='accountuser',
+            name='users_suspended_email_idx',
+        ),
+    ]
@@ -4,13 +4,26 @@ from uuid import uuid4
 
 # Django Imports
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
 from django.contrib.auth.models import (
     AbstractBaseUser, 
     PermissionsMixin, 
 )
 
 # Account Service Imports
-from authentication_service.managers import UserManager
+from authentication_service.managers import (
+    UserManager,
+    canonical_email,
+    canonical_username
+)
+from authentication_service.services.instrumentation.profiling import sync_to_async
+from authentication_service.services.passwords.hashing import (
+    ahash_password,
+    averify_password,
+    check_password,
+    hash_password
+)
 
 
 class AccountUser(AbstractBaseUser, PermissionsMixin):
@@ -37,6 +50,10 @@ class AccountUser(AbstractBaseUser, PermissionsMixin):
     is_suspended = models.BooleanField(default=False)
     is_email_active = models.BooleanField(default=False)
     
+    # Bumped when the password changes or the user is suspended,
+    # access tokens issued with an older epoch are rejected
+    credential_epoch = models.PositiveIntegerField(default=0)
+    
     # Timestamp information
     date_created = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
@@ -52,15 +69,141 @@ class AccountUser(AbstractBaseUser, PermissionsMixin):
         permissions = [
             ("can_suspend_user", "Can suspend user"),
         ]
+        constraints = [
+            # Duplicate registrations are detected by these constraints
+            models.UniqueConstraint(Lower("email"), name="users_email_ci_unique"),
+            models.UniqueConstraint(Lower("username"), name="users_username_ci_unique"),
+        ]
+        # Email lookups, whatever the status they filter on, use the unique index of `email`
         indexes = [
-            models.Index(fields=[
-                "username", "email", "is_active", 
-                "date_created", "date_modified"
-            ])
+            # signups over a period of time
+            models.Index(fields=["date_created"], name="users_date_created_idx"),
+            
+            # incremental refresh of the credential epoch table
+            models.Index(fields=["date_modified"], name="users_date_modified_idx"),
         ]
         
     def __str__(self) -> str:
         return self.username
     
+    def save(self, *args, **kwargs) -> None:
+        # Canonicalize at write time, so that every lookup is an indexed equality
+        self.email = canonical_email(self.email)
+        self.username = canonical_username(self.username)
+        
+        # Partial saves bump date_modified too, the credential
+        # epoch table reads the users changed since its last refresh
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "date_modified"}
+            
+        super().save(*args, **kwargs)
+    
     def fullname(self) -> str:
-        return f"{self.firstname} {self.lastname}"
\ No newline at end of file
+        return f"{self.firstname} {self.lastname}"
+    
+    def set_password(self, raw_password:str) -> None:
+        """Hashes the password in the password hashing process pool"""
+        self.password = hash_password(raw_password)
+        self._password = raw_password
+        
+    def check_password(self, raw_password:str) -> bool:
+        """Verifies the password in the password hashing process pool"""
+        
+        def setter(raw_password):
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            self.save(update_fields=["password"])
+            
+        return check_password(raw_password, self.password, setter)
+    
+    async def aset_password(self, raw_password:str) -> None:
+        """Same as `set_password`, awaiting the process pool"""
+        self.password = await ahash_password(raw_password)
+        self._password = raw_password
+        
+    async def acheck_password(self, raw_password:str) -> bool:
+        """Same as `check_password`, awaiting the process pool"""
+        
+        is_correct, must_update = await averify_password(raw_password, self.password)
+        
+        if is_correct and must_update:
+            await self.aset_password(raw_password)
+            self._password = None
+            await sync_to_async(self.save)(update_fields=["password"])
+            
+        return is_correct
+
+
+class EmailOutbox(models.Model):
+    """Emails waiting to be delivered by the `process_email_outbox` worker"""
+    
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES = (
+        (PENDING, "Pending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    )
+    
+    # Primary Key
+    id = models.BigAutoField(primary_key=True, unique=True)
+    
+    # Message information
+    subject = models.CharField(max_length=255)
+    from_email = models.CharField(max_length=255)
+    to_email = models.EmailField(max_length=255)
+    text_content = models.TextField()
+    html_content = models.TextField(blank=True, default="")
+    
+    # Delivery information
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    
+    # Timestamp information
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_sent = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        verbose_name_plural = "email outbox"
+        db_table = "email_outbox"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"])
+        ]
+        
+    def __str__(self) -> str:
+        return f"{self.subject} -> {self.to_email}"
+
+
+class RevokedToken(models.Model):
+    """Tokens revoked before they expire, e.g. on logout"""
+    
+    # Primary Key
+    id = models.BigAutoField(primary_key=True, unique=True)
+    
+    # Token information
+    jti = models.CharField(max_length=255, unique=True)
+    token_type = models.CharField(max_length=20)
+    user_id = models.BigIntegerField(blank=True, null=True)
+    
+    # Timestamp information
+    expires_at = models.DateTimeField()
+    date_revoked = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name_plural = "revoked tokens"
+        db_table = "revoked_tokens"
+        indexes = [
+            # incremental rebuild of the revocation filters
+            models.Index(fields=["date_revoked"], name="revoked_tokens_revoked_idx"),
+            
+            # purge of the expired tokens
+            models.Index(fields=["expires_at"], name="revoked_tokens_expires_idx"),
+        ]
+        
+    def __str__(self) -> str:
+        return self.jti
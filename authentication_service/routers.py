@@ -0,0 +1,120 @@
+# Python Imports
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Typing Imports
+from typing import Iterator, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.dispatch import receiver
+
+
+# Global initialization
+database_replicas = list(settings.AUTHENTICATION_SERVICE.get("database_replicas", []))
+
+PRIMARY = DEFAULT_DB_ALIAS
+
+
+class DatabaseScope:
+    """Whether the request wrote to the primary, its later reads stay there"""
+
+    __slots__ = ("wrote",)
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_database_scope: ContextVar[Optional[DatabaseScope]] = ContextVar("database_scope", default=None)
+_use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
+
+@contextmanager
+def database_scope() -> Iterator[DatabaseScope]:
+    """Sends the reads that follow a write inside the block to the primary"""
+
+    token = _database_scope.set(DatabaseScope())
+
+    try:
+        yield _database_scope.get()
+    finally:
+        _database_scope.reset(token)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Sends every read of the block to the primary, for reads that can't be stale"""
+
+    token = _use_primary.set(True)
+
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    if _use_primary.get():
+        return True
+
+    scope = _database_scope.get()
+    if scope is not None and scope.wrote:
+        return True
+
+    # A transaction must read its own writes, and lock on the primary
+    return connections[PRIMARY].in_atomic_block
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes go to the primary, and reads to one of `database_replicas`,
+    unless they are pinned to the primary: inside `transaction.atomic`,
+    after a write in the same request, or inside `use_primary()`.
+    """
+
+    def db_for_read(self, model, **hints) -> str:
+        if not database_replicas or is_pinned_to_primary():
+            return PRIMARY
+
+        # Related objects and deferred fields are read from the database of
+        # their instance, the primary for an instance saved or read there
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db in (PRIMARY, *database_replicas):
+            return instance._state.db
+
+        return random.choice(database_replicas)
+
+    def db_for_write(self, model, **hints) -> str:
+        scope = _database_scope.get()
+        if scope is not None:
+            scope.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        databases = {PRIMARY, *database_replicas}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str = None, **hints) -> Optional[bool]:
+        # Replicas get the schema from the primary
+        if db in database_replicas:
+            return False
+        return None
+
+
+def configure(*, replicas) -> None:
+    """Sends the reads to the `replicas` database aliases from now on"""
+
+    global database_replicas
+    database_replicas = list(replicas)
+
+
+@receiver(setting_changed)
+def reset_router(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        configure(replicas=settings.AUTHENTICATION_SERVICE.get("database_replicas", []))
@@ -0,0 +1,214 @@
+# Python Imports
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+# Typing Imports
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.urls import URLResolver, get_resolver
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+# DRF YASG Imports
+from drf_yasg.renderers import _SpecRenderer
+from drf_yasg.views import SPEC_RENDERERS, get_schema_view
+
+
+# Global initialization
+api_schema_path = settings.AUTHENTICATION_SERVICE.get("api_schema_path")
+
+
+class SchemaDocument(NamedTuple):
+    body: bytes
+    etag: str
+
+
+_fingerprint: Tuple[Optional[URLResolver], str] = (None, "")
+_documents: Dict[Tuple[str, str], SchemaDocument] = {}
+_schemas: Dict[str, Any] = {}
+_documents_fingerprint = ""
+_documents_lock = threading.Lock()
+
+
+def iter_routes(patterns, prefix: str = "") -> Iterator[str]:
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+            continue
+
+        view = getattr(pattern.callback, "cls", None) or getattr(pattern.callback, "view_class", pattern.callback)
+        serializer = getattr(view, "serializer_class", None)
+        yield " ".join((
+            prefix + str(pattern.pattern),
+            f"{view.__module__}.{view.__qualname__}",
+            f"{serializer.__module__}.{serializer.__qualname__}" if serializer else "",
+        ))
+
+
+def urlconf_fingerprint() -> str:
+    """
+    A hash of the routes, their views and serializers. It is computed once
+    per resolver, and Django builds a new resolver when the URLconf changes.
+    """
+
+    global _fingerprint
+
+    resolver = get_resolver()
+    cached_resolver, fingerprint = _fingerprint
+
+    if cached_resolver is not resolver:
+        fingerprint = hashlib.sha256("\n".join(iter_routes(resolver.url_patterns)).encode()).hexdigest()[:16]
+        _fingerprint = (resolver, fingerprint)
+
+    return fingerprint
+
+
+def make_document(body: bytes) -> SchemaDocument:
+    return SchemaDocument(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def generate_schema(view_class, version: str = ""):
+    """The schema, generated without a request so it doesn't depend on the host"""
+
+    generator = view_class.generator_class(view_class.schema_info, version, view_class.schema_url)
+    return generator.get_schema(None, public=True)
+
+
+def encode_schema(schema, format: str) -> bytes:
+    renderer_class = next(renderer for renderer in SPEC_RENDERERS if renderer.format == format)
+    body = renderer_class().render(schema)
+    return body if isinstance(body, bytes) else body.encode()
+
+
+def load_document(fingerprint: str, version: str, format: str) -> Optional[bytes]:
+    """A document written by `generate_api_schema`, if it was generated from this URLconf"""
+
+    if not api_schema_path:
+        return None
+
+    try:
+        saved = json.loads(Path(api_schema_path).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if saved.get("fingerprint") != fingerprint or saved.get("version") != version:
+        return None
+
+    body = saved["documents"].get(format)
+    return body.encode() if body is not None else None
+
+
+def save_documents(path: Path, view_class, version: str = "") -> Dict[str, str]:
+    """
+    Writes the schema in every spec format to `path`.
+
+    :return: The error of each format that couldn't be encoded
+    """
+
+    schema, documents, errors = generate_schema(view_class, version), {}, {}
+
+    for renderer_class in SPEC_RENDERERS:
+        try:
+            documents[renderer_class.format] = encode_schema(schema, renderer_class.format).decode()
+        except Exception as exc:
+            errors[renderer_class.format] = repr(exc)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"fingerprint": urlconf_fingerprint(), "version": version, "documents": documents}))
+    return errors
+
+
+def get_document(view_class, format: str, version: str = "") -> SchemaDocument:
+    """
+    The schema document in `format`: from memory, then from `api_schema_path`,
+    and only generated when neither was built from the current URLconf.
+    """
+
+    global _documents_fingerprint
+
+    fingerprint = urlconf_fingerprint()
+    document = _documents.get((version, format))
+
+    if document is not None and _documents_fingerprint == fingerprint:
+        return document
+
+    with _documents_lock:
+        if _documents_fingerprint != fingerprint:
+            _documents.clear()
+            _schemas.clear()
+            _documents_fingerprint = fingerprint
+
+        if (version, format) not in _documents:
+            body = load_document(fingerprint, version, format)
+
+            if body is None:
+                if version not in _schemas:
+                    _schemas[version] = generate_schema(view_class, version)
+                body = encode_schema(_schemas[version], format)
+
+            _documents[version, format] = make_document(body)
+
+        return _documents[version, format]
+
+
+def clear_schema_cache() -> None:
+    global _documents_fingerprint
+
+    with _documents_lock:
+        _documents.clear()
+        _schemas.clear()
+        _documents_fingerprint = ""
+
+
+def get_cached_schema_view(info, **kwargs):
+    """
+    Same as drf_yasg's `get_schema_view`, with the spec formats generated once
+    per URLconf and served from memory with an ETag. The Swagger and ReDoc
+    pages don't embed the schema, they fetch it from the cached view.
+    """
+
+    schema_view = get_schema_view(info, **kwargs)
+
+    class CachedSchemaView(schema_view):
+
+        def get(self, request, version="", format=None):
+            """
+            :param request: The request object
+            :type request: Request
+            :param version: The API version
+            :param format: The format suffix of the spec
+            :return: The schema, or a 304 when the client's copy is current.
+            """
+            renderer = request.accepted_renderer
+
+            if not isinstance(renderer, _SpecRenderer):
+                return super().get(request, version, format)
+
+            document = get_document(self.__class__, renderer.format, request.version or version or "")
+            response = get_conditional_response(request, etag=document.etag) or HttpResponse(
+                document.body, content_type=f"{renderer.media_type}; charset=utf-8"
+            )
+
+            response["ETag"] = document.etag
+            patch_cache_control(response, public=True, no_cache=True)
+            return response
+
+    CachedSchemaView.schema_info = info
+    CachedSchemaView.schema_url = kwargs.get("url")
+    return CachedSchemaView
+
+
+@receiver(setting_changed)
+def reset_schema_cache(*, setting: str, **kwargs) -> None:
+    global api_schema_path
+
+    if setting == "AUTHENTICATION_SERVICE":
+        api_schema_path = settings.AUTHENTICATION_SERVICE.get("api_schema_path")
+    if setting in ("AUTHENTICATION_SERVICE", "ROOT_URLCONF", "SWAGGER_SETTINGS"):
+        clear_schema_cache()
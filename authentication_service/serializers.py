@@ -1,14 +1,21 @@
 # Rest Framework Imports
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.settings import api_settings
 
 # Django Imports
-from django.db.models import Q
+from django.db import IntegrityError
 
 # SimpleJWT Imports
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 
 # Account Service Imports
+from authentication_service.managers import canonical_email
 from authentication_service.models import AccountUser
+from authentication_service.services.instrumentation.metrics import LOGINS
+from authentication_service.services.tokens.jwt import RevocableRefreshToken
+from authentication_service.services.users.epochs import add_account_claims
+from authentication_service.services.users.identity import get_user
 
 # Third Party Imports
 from rest_api_payload import success_response, error_response
@@ -21,31 +28,54 @@ class RegisterUserSerializer(serializers.ModelSerializer):
         fields = ("firstname", "lastname", "username", "email", "password")
         extra_kwargs = {
             "password": {"write_only": True},
+            
+            # Uniqueness is enforced by the case-insensitive unique 
+            # constraints on insert, not by a query per field
+            "email": {"validators": []},
+            "username": {"validators": []},
         }
         
-    def validate(self, attrs):
+    def create(self, validated_data):
+        """
+        Hashes the password first and inserts the user in a single statement.
         
-        # Get email and username from attrs
-        email = attrs.get("email")
-        username = attrs.get("username")
+        A user with the same email or username (in any case) is 
+        rejected by the unique constraints of the users table.
+        """
         
-        # Check if a user with the username or email exists
-        if AccountUser.objects.filter(
-            Q(email__iexact=email) | Q(username__iexact=username)  
-        ).exists():
-            raise serializers.ValidationError("User exits. Please try again!")
+        password = validated_data.pop("password")
         
-        return super().validate(attrs)
+        user = AccountUser(**validated_data)
+        user.set_password(password)
+        
+        try:
+            user.save(force_insert=True)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: ["User exits. Please try again!"]}
+            )
+        
+        return user
     
     
 class UserLoginObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RevocableRefreshToken
+    
+    @classmethod
+    def get_token(cls, user):
+        return add_account_claims(super().get_token(user), user)
     
     def validate(self, attrs):
         """The default result (access/refresh tokens)"""
-        data = super(UserLoginObtainPairSerializer, self).validate(attrs)
+        try:
+            data = super(UserLoginObtainPairSerializer, self).validate(attrs)
+        except AuthenticationFailed:
+            LOGINS.inc(outcome="failure")
+            raise
         
         # check if user is not active
         if self.user.is_active is False:
+            LOGINS.inc(outcome="inactive")
             
             payload = error_response(
                 status=False,
@@ -55,6 +85,7 @@ class UserLoginObtainPairSerializer(TokenObtainPairSerializer):
         
         # check if user is suspended
         if self.user.is_suspended is True:
+            LOGINS.inc(outcome="suspended")
             
             payload = success_response(
                 status=True,
@@ -69,6 +100,7 @@ class UserLoginObtainPairSerializer(TokenObtainPairSerializer):
         data.update({"username": self.user.username})
         data.update({"email": self.user.email})
         data.update({"id": self.user.id})
+        LOGINS.inc(outcome="success")
 
         payload = success_response(
             status=True, 
@@ -78,18 +110,23 @@ class UserLoginObtainPairSerializer(TokenObtainPairSerializer):
         return payload
     
 
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RevocableRefreshToken
+    
+
 class UserEmailSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
     
+    def validate_email(self, value):
+        return canonical_email(value)
+    
     def validate(self, attrs):
         
         # Get email from attrs
         email = attrs.get("email")
         
         # Check if a user with the email does not exist
-        if not AccountUser.objects.filter(
-                Q(email__iexact=email)
-            ).exists():
+        if get_user(email=email) is None:
             raise serializers.ValidationError("User does not exist.")
         
         return super().validate(attrs)
@@ -140,6 +177,9 @@ class UserChangePasswordSerializer(serializers.Serializer):
         style={"input_type": "password", "placeholder": "Repeat New Password"},
     )
     
+    def validate_email(self, value):
+        return canonical_email(value)
+    
     def validate(self, attrs):
         
         # Get email and pwds from attrs
@@ -148,9 +188,7 @@ class UserChangePasswordSerializer(serializers.Serializer):
         re_new_password = attrs.get("repeat_new_password")
         
         # Check if a user with the email does not exist
-        if not AccountUser.objects.filter(
-                Q(email__iexact=email)
-            ).exists():
+        if get_user(email=email) is None:
             raise serializers.ValidationError("User does not exist.")
 
         # Check if both password are not equal
@@ -163,6 +201,6 @@ class UserChangePasswordSerializer(serializers.Serializer):
     
 
 class GoogleOAuth2Serializer(serializers.Serializer):
-    email = serializers.EmailField(required=True)
-    first_name = serializers.CharField(required=False, default='')
-    last_name = serializers.CharField(required=False, default='')
\ No newline at end of file
+    # The user is read from the verified token, 
+    # the Id-Token header is still accepted
+    id_token = serializers.CharField(required=False)
\ No newline at end of file
@@ -0,0 +1,253 @@
+# Standard Library Imports
+import atexit
+import os
+import queue
+import smtplib
+import ssl
+import threading
+import time
+
+# Typing Imports
+from typing import Dict, List, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+
+
+# Global initialization
+email_pool_size = settings.AUTHENTICATION_SERVICE.get("email_pool_size", 4)
+email_pool_max_idle = settings.AUTHENTICATION_SERVICE.get("email_pool_max_idle", 60)
+email_pool_max_messages = settings.AUTHENTICATION_SERVICE.get("email_pool_max_messages", 100)
+
+
+class PooledConnection:
+    """An authenticated SMTP connection along with its throughput counters"""
+
+    def __init__(self, connection: smtplib.SMTP) -> None:
+        self.connection = connection
+        self.opened_at = time.monotonic()
+        self.last_used_at = self.opened_at
+        self.messages_sent = 0
+        self.send_time = 0.0
+        self.healthy = True
+
+    def record_send(self, elapsed: float) -> None:
+        self.messages_sent += 1
+        self.send_time += elapsed
+        self.last_used_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "id": id(self),
+            "messages_sent": self.messages_sent,
+            "send_time": self.send_time,
+            "messages_per_second": (
+                self.messages_sent / self.send_time if self.send_time else 0.0
+            ),
+            "age": time.monotonic() - self.opened_at,
+        }
+
+
+class PooledSMTPEmailBackend(EmailBackend):
+    """
+    SMTP email backend that keeps a small pool of authenticated connections
+    alive between messages, so the TCP connection, STARTTLS and login are
+    only paid once per connection instead of once per email.
+
+    Connections are returned to the pool on `close()`, checked with a `NOOP`
+    when they have been idle for too long, retired after `max_messages`
+    messages, and reopened once when the server drops them mid-send.
+    """
+
+    _pools: Dict[Tuple, queue.LifoQueue] = {}
+    _connections: Dict[int, PooledConnection] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, pool_size=None, max_idle=None, max_messages=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool_size = pool_size or email_pool_size
+        self.max_idle = email_pool_max_idle if max_idle is None else max_idle
+        self.max_messages = max_messages or email_pool_max_messages
+        self.pooled = None
+
+    @property
+    def pool_key(self) -> Tuple:
+        # connections must never be shared with a forked worker process
+        return (os.getpid(), self.host, self.port, self.username, self.use_tls, self.use_ssl)
+
+    def get_pool(self) -> queue.LifoQueue:
+        with self._pools_lock:
+            pool = self._pools.get(self.pool_key)
+
+            if pool is None:
+                pool = self._pools[self.pool_key] = queue.LifoQueue(maxsize=self.pool_size)
+            return pool
+
+    def is_usable(self, pooled: PooledConnection) -> bool:
+        """Checks that a pooled connection can still be used to send messages"""
+
+        if pooled.messages_sent >= self.max_messages:
+            return False
+
+        if time.monotonic() - pooled.last_used_at < self.max_idle:
+            return True
+
+        try:
+            return pooled.connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def open(self):
+        if self.connection:
+            return False
+
+        pool = self.get_pool()
+
+        # Borrow the most recently used connection from the pool
+        while True:
+            try:
+                pooled = pool.get_nowait()
+            except queue.Empty:
+                break
+
+            if self.is_usable(pooled):
+                self.pooled = pooled
+                self.connection = pooled.connection
+                return True
+
+            self.discard(pooled)
+
+        opened = super().open()
+
+        if self.connection is not None:
+            self.pooled = PooledConnection(self.connection)
+            self._connections[id(self.pooled)] = self.pooled
+        return opened
+
+    def close(self):
+        if self.connection is None:
+            return
+
+        pooled, self.pooled = self.pooled, None
+        self.connection = None
+
+        if pooled is None:
+            return
+
+        if pooled.healthy and pooled.messages_sent < self.max_messages:
+            try:
+                self.get_pool().put_nowait(pooled)
+                return
+            except queue.Full:
+                pass
+
+        self.discard(pooled)
+
+    def discard(self, pooled: PooledConnection) -> None:
+        """Quits a connection that is not going back to the pool"""
+
+        self._connections.pop(id(pooled), None)
+
+        try:
+            pooled.connection.quit()
+        except (ssl.SSLError, smtplib.SMTPException, OSError):
+            try:
+                pooled.connection.close()
+            except OSError:
+                pass
+
+    def reconnect(self) -> None:
+        """Replaces the current connection with a fresh one"""
+
+        pooled, self.pooled = self.pooled, None
+        self.connection = None
+
+        if pooled is not None:
+            pooled.healthy = False
+            self.discard(pooled)
+
+        super().open()
+        self.pooled = PooledConnection(self.connection)
+        self._connections[id(self.pooled)] = self.pooled
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+
+        with self._lock:
+            new_conn_created = self.open()
+
+            if not self.connection or new_conn_created is None:
+                return 0
+
+            num_sent = 0
+
+            try:
+                for message in email_messages:
+                    if self._send(message):
+                        num_sent += 1
+
+            finally:
+                # Hand the connection back to the pool even if a message failed
+                if new_conn_created:
+                    self.close()
+        return num_sent
+
+    def _send(self, email_message):
+        fail_silently, self.fail_silently = self.fail_silently, False
+        started_at = time.perf_counter()
+
+        try:
+            try:
+                sent = super()._send(email_message)
+
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # The server dropped a connection we got from the pool
+                self.reconnect()
+                started_at = time.perf_counter()
+                sent = super()._send(email_message)
+
+        except (smtplib.SMTPException, OSError):
+            if self.pooled is not None:
+                self.pooled.healthy = False
+
+            if not fail_silently:
+                raise
+            return False
+
+        finally:
+            self.fail_silently = fail_silently
+
+        if sent and self.pooled is not None:
+            self.pooled.record_send(time.perf_counter() - started_at)
+        return sent
+
+    @classmethod
+    def connection_stats(cls) -> List[dict]:
+        """Throughput of every connection opened by this process"""
+
+        return [pooled.stats() for pooled in list(cls._connections.values())]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Quits every pooled connection"""
+
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+
+        for pool in pools:
+            while True:
+                try:
+                    pooled = pool.get_nowait()
+                except queue.Empty:
+                    break
+                cls._connections.pop(id(pooled), None)
+
+                try:
+                    pooled.connection.quit()
+                except (ssl.SSLError, smtplib.SMTPException, OSError):
+                    pass
+
+
+atexit.register(PooledSMTPEmailBackend.close_all)
@@ -0,0 +1,130 @@
+# Python Imports
+import time
+
+# Datetime Imports
+from datetime import timedelta
+
+# Typing Imports
+from typing import Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+
+# Account Service Imports
+from authentication_service.models import EmailOutbox
+from authentication_service.services.instrumentation.metrics import EMAILS, SMTP_SEND_DURATION
+from authentication_service.services.users.timestamps import get_now
+
+
+# Global initialization
+outbox_batch_size = settings.AUTHENTICATION_SERVICE.get("email_outbox_batch_size", 50)
+outbox_max_attempts = settings.AUTHENTICATION_SERVICE.get("email_outbox_max_attempts", 5)
+outbox_retry_delay = settings.AUTHENTICATION_SERVICE.get("email_outbox_retry_delay", 30)
+outbox_max_retry_delay = settings.AUTHENTICATION_SERVICE.get("email_outbox_max_retry_delay", 3600)
+
+
+def queue_email(*, subject: str, to_email: str, text_content: str, html_content: str = "") -> EmailOutbox:
+    """
+    Store an email in the outbox.
+
+    This runs inside the caller's transaction, so the email is only
+    delivered if the request that queued it is committed.
+    """
+
+    return EmailOutbox.objects.create(
+        subject=subject,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to_email=to_email,
+        text_content=text_content,
+        html_content=html_content,
+    )
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for the given number of failed attempts"""
+
+    delay = outbox_retry_delay * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(delay, outbox_max_retry_delay))
+
+
+def build_outbox_message(email: EmailOutbox, connection=None) -> EmailMultiAlternatives:
+    """Rebuild the email message stored in the outbox"""
+
+    msg = EmailMultiAlternatives(
+        email.subject,
+        email.text_content,
+        email.from_email,
+        [email.to_email],
+        connection=connection
+    )
+
+    if email.html_content:
+        msg.attach_alternative(email.html_content, "text/html")
+    return msg
+
+
+def deliver_outbox(*, batch_size: int = None, max_attempts: int = None) -> Tuple[int, int]:
+    """
+    Deliver a batch of due emails over a single email connection.
+
+    Rows are locked with `SKIP LOCKED` (where the database supports it) so
+    that several workers can drain the outbox at the same time. Failed emails
+    are rescheduled with an exponential backoff until `max_attempts` is reached.
+
+    :return: The number of sent and failed emails
+    """
+
+    batch_size = batch_size or outbox_batch_size
+    max_attempts = max_attempts or outbox_max_attempts
+    sent = failed = 0
+
+    with transaction.atomic():
+        emails = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status=EmailOutbox.PENDING, next_attempt_at__lte=get_now())
+            .order_by("next_attempt_at")[:batch_size]
+        )
+
+        if not emails:
+            return sent, failed
+
+        connection = get_connection()
+
+        try:
+            connection.open()
+
+            for email in emails:
+                email.attempts += 1
+                started_at = time.perf_counter()
+
+                try:
+                    connection.send_messages([build_outbox_message(email, connection=connection)])
+
+                except Exception as exc:
+                    failed += 1
+                    email.last_error = repr(exc)
+                    SMTP_SEND_DURATION.observe(time.perf_counter() - started_at, outcome="error")
+
+                    if email.attempts >= max_attempts:
+                        email.status = EmailOutbox.FAILED
+                        EMAILS.inc(outcome="failed")
+                    else:
+                        email.next_attempt_at = get_now() + get_retry_delay(email.attempts)
+                        EMAILS.inc(outcome="retried")
+
+                else:
+                    sent += 1
+                    email.status = EmailOutbox.SENT
+                    email.date_sent = get_now()
+                    email.last_error = ""
+                    SMTP_SEND_DURATION.observe(time.perf_counter() - started_at, outcome="sent")
+                    EMAILS.inc(outcome="sent")
+
+                email.save(update_fields=["status", "attempts", "next_attempt_at", "last_error", "date_sent"])
+
+        finally:
+            connection.close()
+
+    return sent, failed
@@ -0,0 +1,80 @@
+# Standard Library Imports
+from functools import lru_cache
+
+# Typing Imports
+from typing import Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context
+from django.template.loader import get_template
+
+
+# Email template names
+VERIFY_EMAIL = "verify-email"
+RESET_PASSWORD_EMAIL = "reset-password-email"
+
+
+class EmailTemplate:
+    """
+    An email whose html and text templates are compiled once.
+
+    The static part of the context (site name, contact email) is built once
+    and only the per-user slots (user, uid, token, domain) are pushed on top
+    of it for every message. The text alternative comes from its own text
+    template instead of stripping the tags of the rendered html.
+    """
+
+    def __init__(self, subject: str, html_template_name: str, text_template_name: str, static_context: dict) -> None:
+        self.subject = subject
+        self.html_template = get_template(html_template_name).template
+        self.text_template = get_template(text_template_name).template
+        self.static_context = static_context
+
+    def render(self, **slots) -> Tuple[str, str, str]:
+        """Renders the subject, text and html content for the given slots"""
+
+        context = Context(self.static_context, autoescape=self.html_template.engine.autoescape)
+
+        with context.push(slots):
+            html_content = self.html_template.render(context)
+            text_content = self.text_template.render(context)
+
+        return self.subject, text_content, html_content
+
+
+@lru_cache(maxsize=None)
+def get_email_template(name: str) -> EmailTemplate:
+    """Compiles the email template with the given name once per process"""
+
+    site_name = settings.AUTHENTICATION_SERVICE["site_name"]
+    static_context = {
+        "site_name": site_name,
+        "contact_email": settings.AUTHENTICATION_SERVICE["contact_email"],
+    }
+
+    if name == VERIFY_EMAIL:
+        return EmailTemplate(
+            subject=f"[{site_name}]: Verify Your Email",
+            html_template_name="emails/verify-email-template.html",
+            text_template_name="emails/verify-email-template.txt",
+            static_context=static_context,
+        )
+
+    if name == RESET_PASSWORD_EMAIL:
+        return EmailTemplate(
+            subject=f"[{site_name}]: Reset Your Password",
+            html_template_name="emails/reset-password-email-template.html",
+            text_template_name="emails/reset-password-email-template.txt",
+            static_context=static_context,
+        )
+
+    raise ValueError(f"Unknown email template: {name}")
+
+
+@receiver(setting_changed)
+def clear_email_templates(*, setting: str, **kwargs) -> None:
+    if setting in ("TEMPLATES", "AUTHENTICATION_SERVICE"):
+        get_email_template.cache_clear()
@@ -1,66 +1,66 @@
 # Django Imports
-from django.template.loader import render_to_string
 from django.contrib.sites.shortcuts import get_current_site
 from django.http import HttpRequest
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
-from django.conf import settings
 
 # Typing Imports
-from typing import NoReturn
+from typing import Tuple
 
 # Accounts Imports
-from authentication_service.models import AccountUser
+from authentication_service.models import AccountUser, EmailOutbox
+from authentication_service.services.emails.outbox import queue_email
+from authentication_service.services.emails.rendering import (
+    get_email_template,
+    VERIFY_EMAIL,
+    RESET_PASSWORD_EMAIL
+)
+from authentication_service.services.instrumentation.timings import timed
 
 
-# Global initialization
-site_name = settings.AUTHENTICATION_SERVICE["site_name"]
-contact_email = settings.AUTHENTICATION_SERVICE["contact_email"]
+def render_verify_email(request: HttpRequest, user:AccountUser, uid:str, token:str) -> Tuple[str, str, str]:
+    """Renders the subject, text and html content of the verify email"""
 
-
-def send_email_to_user(request: HttpRequest, user:AccountUser, uid:str, token:str) -> NoReturn:
-    
     current_site = get_current_site(request)
-    mail_subject = f"[{site_name}]: Verify Your Email"
-    
-    email_context = {
-        'user': user,
-        'domain': current_site.domain,
-        'uid': uid,
-        'token': token,
-        'site_name': site_name,
-        'contact_email': contact_email
-    }
-    
-    # Parse html to string
-    html_content = render_to_string('emails/verify-email-template.html', email_context)
-    text_content = strip_tags(html_content)
+    return get_email_template(VERIFY_EMAIL).render(
+        user=user,
+        domain=current_site.domain,
+        uid=uid,
+        token=token
+    )
 
-    # Initialize a single email message which can be send to multiple recipients
-    msg = EmailMultiAlternatives(mail_subject, text_content, settings.DEFAULT_FROM_EMAIL, [user.email])
-    msg.attach_alternative(html_content, "text/html")
-    msg.send()
 
+def render_reset_password_email(request: HttpRequest, user:AccountUser, uid:str, token:str) -> Tuple[str, str, str]:
+    """Renders the subject, text and html content of the reset password email"""
 
-def send_reset_password_email_to_user(request: HttpRequest, user:AccountUser, uid:str, token:str) -> NoReturn:
-    
     current_site = get_current_site(request)
-    mail_subject = f"[{site_name}]: Reset Your Password"
-    
-    email_context = {
-        'user': user,
-        'domain': current_site.domain,
-        'uid': uid,
-        'token': token,
-        'contact_email': contact_email
-    }
-    
-    # Parse html to string
-    html_content = render_to_string('emails/reset-password-email-template.html', email_context)
-    text_content = strip_tags(html_content)
-    
-    # Initialize a single email message which can be send to multiple recipients
-    msg = EmailMultiAlternatives(mail_subject, text_content, settings.DEFAULT_FROM_EMAIL, [user.email])
-    msg.attach_alternative(html_content, "text/html")
-    msg.send()
+    return get_email_template(RESET_PASSWORD_EMAIL).render(
+        user=user,
+        domain=current_site.domain,
+        uid=uid,
+        token=token
+    )
+
+
+@timed("email")
+def queue_email_to_user(request: HttpRequest, user:AccountUser, uid:str, token:str) -> EmailOutbox:
+    """Queues the verify email in the outbox"""
+
+    mail_subject, text_content, html_content = render_verify_email(request, user, uid, token)
+    return queue_email(
+        subject=mail_subject,
+        to_email=user.email,
+        text_content=text_content,
+        html_content=html_content
+    )
+
+
+@timed("email")
+def queue_reset_password_email_to_user(request: HttpRequest, user:AccountUser, uid:str, token:str) -> EmailOutbox:
+    """Queues the reset password email in the outbox"""
+
+    mail_subject, text_content, html_content = render_reset_password_email(request, user, uid, token)
+    return queue_email(
+        subject=mail_subject,
+        to_email=user.email,
+        text_content=text_content,
+        html_content=html_content
+    )
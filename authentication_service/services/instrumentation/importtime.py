@@ -0,0 +1,73 @@
+# Python Imports
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# Typing Imports
+from typing import Dict, List, NamedTuple
+
+# Django Imports
+from django.conf import settings
+
+
+# What a worker imports before it serves its first request
+ENTRYPOINTS = {
+    "wsgi": "from core.wsgi import application",
+    "asgi": "from core.asgi import application",
+}
+RESOLVE_URLS = "from django.urls import get_resolver; get_resolver().url_patterns"
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parses the `-X importtime` lines, in the order the modules finished importing"""
+
+    records = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # the header
+
+        module = name.rstrip()
+        records.append(ImportRecord(
+            module.strip(), (len(module) - len(module.lstrip()) - 1) // 2, int(self_us), int(cumulative_us)
+        ))
+
+    return records
+
+
+def measure_imports(entrypoint: str = "wsgi") -> List[ImportRecord]:
+    """Imports the entrypoint and the URLconf in a fresh interpreter, as a worker does when it starts"""
+
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    result = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", f"{ENTRYPOINTS[entrypoint]}; {RESOLVE_URLS}"),
+        capture_output=True, text=True, env=env, cwd=settings.BASE_DIR, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_import_time(records: List[ImportRecord]) -> int:
+    return sum(record.self_us for record in records)
+
+
+def package_import_times(records: List[ImportRecord]) -> Dict[str, int]:
+    """The time spent importing the modules of each top level package, slowest first"""
+
+    packages: Dict[str, int] = defaultdict(int)
+
+    for record in records:
+        packages[record.module.partition(".")[0]] += record.self_us
+
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
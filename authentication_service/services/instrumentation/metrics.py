@@ -0,0 +1,338 @@
+# Python Imports
+import bisect
+import hmac
+import ipaddress
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+# Typing Imports
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest
+
+
+def get_metrics_dir() -> str:
+    return settings.AUTHENTICATION_SERVICE.get("metrics_dir") or os.environ.get(
+        "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "authentication-service-metrics")
+    )
+
+
+def parse_networks(addresses: Sequence[str]) -> List[ipaddress._BaseNetwork]:
+    return [ipaddress.ip_network(address, strict=False) for address in addresses]
+
+
+# Global initialization
+metrics_dir = get_metrics_dir()
+metrics_allowed_networks = parse_networks(
+    settings.AUTHENTICATION_SERVICE.get("metrics_allowed_ips", ["127.0.0.1", "::1"])
+)
+metrics_token = settings.AUTHENTICATION_SERVICE.get("metrics_token") or ""
+
+# Seconds, from a cache hit to a slow password hash or SMTP server
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+INITIAL_FILE_SIZE = 64 * 1024
+
+# A key is a sample name and its sorted labels
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsFile:
+    """
+    The samples of one process, in a memory mapped file read by every
+    process on a scrape. The file starts with the number of bytes used,
+    followed by entries of a key length, a JSON key padded to 8 bytes,
+    and a double. An entry is written before the bytes used are, so a
+    reader never sees half of it, and readers don't take any lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.file = open(path, "a+b")
+        self.lock = threading.Lock()
+
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.file.truncate(INITIAL_FILE_SIZE)
+
+        self.map()
+        self.used = struct.unpack_from("<i", self.mmap, 0)[0] or 8
+        self.positions = {key: position for key, _, position in iter_entries(self.mmap, self.used)}
+
+    def map(self) -> None:
+        self.capacity = os.fstat(self.file.fileno()).st_size
+        self.mmap = mmap.mmap(self.file.fileno(), self.capacity)
+
+    def init_key(self, key: str) -> int:
+        encoded = key.encode()
+        padded = encoded + b" " * (7 - (len(encoded) + 3) % 8)
+        entry = struct.pack(f"<i{len(padded)}sd", len(encoded), padded, 0.0)
+
+        while self.used + len(entry) > self.capacity:
+            self.mmap.close()
+            self.file.truncate(self.capacity * 2)
+            self.map()
+
+        self.mmap[self.used:self.used + len(entry)] = entry
+        position = self.used + 4 + len(padded)
+
+        self.used += len(entry)
+        struct.pack_into("<i", self.mmap, 0, self.used)
+
+        self.positions[key] = position
+        return position
+
+    def add(self, samples: Sequence[Tuple[str, float]]) -> None:
+        with self.lock:
+            for key, amount in samples:
+                position = self.positions.get(key)
+                if position is None:
+                    position = self.init_key(key)
+
+                value = struct.unpack_from("<d", self.mmap, position)[0]
+                struct.pack_into("<d", self.mmap, position, value + amount)
+
+    def close(self) -> None:
+        self.mmap.close()
+        self.file.close()
+
+
+def iter_entries(data, used: int) -> Iterator[Tuple[str, float, int]]:
+    position = 8
+
+    while position < used:
+        length = struct.unpack_from("<i", data, position)[0]
+        padded = length + 7 - (length + 3) % 8
+        key = bytes(data[position + 4:position + 4 + length]).decode()
+
+        value_position = position + 4 + padded
+        yield key, struct.unpack_from("<d", data, value_position)[0], value_position
+        position = value_position + 8
+
+
+_file: Optional[MetricsFile] = None
+_file_pid: Optional[int] = None
+_file_lock = threading.Lock()
+
+
+def get_metrics_file() -> MetricsFile:
+    """The file of this process, a forked worker gets a file of its own"""
+
+    global _file, _file_pid
+
+    if _file is None or _file_pid != os.getpid():
+        with _file_lock:
+            if _file is None or _file_pid != os.getpid():
+                os.makedirs(metrics_dir, exist_ok=True)
+                _file = MetricsFile(Path(metrics_dir) / f"metrics_{os.getpid()}.db")
+                _file_pid = os.getpid()
+
+    return _file
+
+
+@lru_cache(maxsize=4096)
+def encode_key(name: str, labels: Tuple[Tuple[str, str], ...]) -> str:
+    return json.dumps([name, labels], separators=(",", ":"))
+
+
+class Metric:
+    type = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(sorted(labelnames))
+        REGISTRY.append(self)
+
+    def get_labels(self, labels: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        get_metrics_file().add([(encode_key(self.name, self.get_labels(labels)), amount)])
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+        self.bounds = [str(bucket) for bucket in self.buckets] + ["+Inf"]
+
+    def observe(self, value: float, **labels) -> None:
+        labels = self.get_labels(labels)
+        bound = self.bounds[bisect.bisect_left(self.buckets, value)]
+
+        # Buckets are counted on their own, and summed up on a scrape
+        get_metrics_file().add([
+            (encode_key(f"{self.name}_bucket", labels + (("le", bound),)), 1),
+            (encode_key(f"{self.name}_sum", labels), value),
+            (encode_key(f"{self.name}_count", labels), 1),
+        ])
+
+
+REGISTRY: List[Metric] = []
+
+
+def collect() -> Dict[Key, float]:
+    """Sums the samples of every process, living or not"""
+
+    totals: Dict[Key, float] = defaultdict(float)
+
+    for path in Path(metrics_dir).glob("metrics_*.db"):
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+
+        if len(data) < 8:
+            continue
+
+        for key, value, _ in iter_entries(data, struct.unpack_from("<i", data, 0)[0]):
+            name, labels = json.loads(key)
+            totals[name, tuple(map(tuple, labels))] += value
+
+    return totals
+
+
+def format_sample(name: str, labels: Sequence[Tuple[str, str]], value: float) -> str:
+    if not labels:
+        return f"{name} {value!r}"
+
+    formatted = ",".join(
+        '{}="{}"'.format(label, value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\""))
+        for label, value in labels
+    )
+    return f"{name}{{{formatted}}} {value!r}"
+
+
+def render_metrics() -> str:
+    """The samples of every process, in the Prometheus text format"""
+
+    totals = collect()
+    lines = []
+
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+
+        if metric.type == "counter":
+            for (name, labels), value in sorted(totals.items()):
+                if name == metric.name:
+                    lines.append(format_sample(name, labels, value))
+            continue
+
+        buckets: Dict[Tuple, Dict[str, float]] = defaultdict(dict)
+        for (name, labels), value in totals.items():
+            if name == f"{metric.name}_bucket":
+                buckets[labels[:-1]][labels[-1][1]] = value
+
+        for labels in sorted(buckets):
+            cumulative = 0.0
+            for bound in metric.bounds:
+                cumulative += buckets[labels].get(bound, 0.0)
+                lines.append(format_sample(f"{metric.name}_bucket", labels + (("le", bound),), cumulative))
+
+            lines.append(format_sample(f"{metric.name}_sum", labels, totals.get((f"{metric.name}_sum", labels), 0.0)))
+            lines.append(format_sample(f"{metric.name}_count", labels, cumulative))
+
+    return "\n".join(lines) + "\n"
+
+
+def can_read_metrics(request: HttpRequest) -> bool:
+    """
+    Whether the request may read the metrics: sent with the `metrics_token`
+    bearer token, or from `metrics_allowed_ips`. The address is the one of
+    the connection, a proxy in front must send the token.
+    """
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+    if metrics_token and scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), metrics_token.encode()):
+        return True
+
+    try:
+        address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(address in network for network in metrics_allowed_networks)
+
+
+def configure(
+    *,
+    directory: Optional[str] = None,
+    allowed_ips: Optional[Sequence[str]] = None,
+    token: Optional[str] = None,
+) -> None:
+    """
+    Writes the samples of this process to, and reads them from, `directory`,
+    and changes who may read them (an empty `token` disables the token)
+    """
+
+    global metrics_dir, metrics_allowed_networks, metrics_token, _file, _file_pid
+
+    if directory is not None:
+        with _file_lock:
+            if _file is not None and _file_pid == os.getpid():
+                _file.close()
+            _file = _file_pid = None
+            metrics_dir = directory
+
+    if allowed_ips is not None:
+        metrics_allowed_networks = parse_networks(allowed_ips)
+    if token is not None:
+        metrics_token = token
+
+
+@receiver(setting_changed)
+def reset_metrics(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        configure(
+            allowed_ips=settings.AUTHENTICATION_SERVICE.get("metrics_allowed_ips", ["127.0.0.1", "::1"]),
+            token=settings.AUTHENTICATION_SERVICE.get("metrics_token") or "",
+        )
+
+        # Reopened only when it changed, the samples of this process stay in the file
+        if get_metrics_dir() != metrics_dir:
+            configure(directory=get_metrics_dir())
+
+
+# Requests
+HTTP_REQUESTS = Counter(
+    "auth_http_requests_total", "Requests by view, method and status code.", ("view", "method", "status")
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "auth_http_request_duration_seconds", "Request latency by view and method.", ("view", "method")
+)
+
+# Logins, by branch of UserLoginObtainPairSerializer.validate
+LOGINS = Counter(
+    "auth_logins_total", "Logins by outcome: success, failure, inactive or suspended.", ("outcome",)
+)
+
+# Passwords, emails and OAuth
+PASSWORD_HASHING_DURATION = Histogram(
+    "auth_password_hashing_seconds", "Password hashing time by operation: encode or verify.", ("operation",)
+)
+SMTP_SEND_DURATION = Histogram(
+    "auth_smtp_send_seconds", "Time to hand an email to the SMTP server, by outcome.", ("outcome",)
+)
+EMAILS = Counter(
+    "auth_emails_total", "Outbox deliveries by outcome: sent, retried or failed.", ("outcome",)
+)
+GOOGLE_VALIDATION_DURATION = Histogram(
+    "auth_google_id_token_validation_seconds", "Google ID token validation time by outcome.", ("outcome",)
+)
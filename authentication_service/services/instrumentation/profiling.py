@@ -0,0 +1,347 @@
+# Python Imports
+import cProfile
+import functools
+import os
+import pstats
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+
+# Typing Imports
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+# Django Imports
+from django.conf import settings
+from django.core import signing
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest
+
+# ASGI Imports
+from asgiref.sync import sync_to_async as asgiref_sync_to_async
+
+
+PROFILING_HEADER = "X-Profile-Request"
+PROFILING_SALT = "authentication_service.profiling"
+PROFILE_SUFFIXES = (".collapsed", ".pstats")
+
+
+def get_profiling_dir() -> str:
+    return settings.AUTHENTICATION_SERVICE.get("profiling_dir") or os.path.join(
+        tempfile.gettempdir(), "authentication-service-profiles"
+    )
+
+
+# Global initialization
+profiling_sample_rate = settings.AUTHENTICATION_SERVICE.get("profiling_sample_rate", 0.0)
+profiling_mode = settings.AUTHENTICATION_SERVICE.get("profiling_mode", "sampling")
+profiling_interval = settings.AUTHENTICATION_SERVICE.get("profiling_interval", 0.005)
+profiling_path_prefix = settings.AUTHENTICATION_SERVICE.get("profiling_path_prefix", "/api/v1/")
+profiling_max_files = settings.AUTHENTICATION_SERVICE.get("profiling_max_files", 500)
+profiling_token_max_age = settings.AUTHENTICATION_SERVICE.get("profiling_token_max_age", 3600)
+profiling_dir = get_profiling_dir()
+
+_rotation_lock = threading.Lock()
+
+
+def make_profiling_token() -> str:
+    """A value of the profiling header, only valid for `profiling_token_max_age` seconds"""
+
+    return signing.TimestampSigner(salt=PROFILING_SALT).sign(uuid.uuid4().hex)
+
+
+def has_profiling_token(request: HttpRequest) -> bool:
+    token = request.headers.get(PROFILING_HEADER)
+
+    if not token:
+        return False
+
+    try:
+        signing.TimestampSigner(salt=PROFILING_SALT).unsign(token, max_age=profiling_token_max_age)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def should_profile(request: HttpRequest) -> bool:
+    if not request.path.startswith(profiling_path_prefix):
+        return False
+    if has_profiling_token(request):
+        return True
+    return profiling_sample_rate > 0 and random.random() < profiling_sample_rate
+
+
+@lru_cache(maxsize=4096)
+def shorten_path(filename: str) -> str:
+    """The path of a module relative to the longest entry of sys.path holding it"""
+
+    for entry in sorted(filter(None, sys.path), key=len, reverse=True):
+        if filename.startswith(entry + os.sep):
+            return filename[len(entry) + 1:]
+    return filename
+
+
+def format_frame(frame) -> str:
+    code = frame.f_code
+    # Semicolons separate the frames of a collapsed stack
+    return f"{code.co_name} ({shorten_path(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+
+class StackSampler:
+    """
+    Samples the stacks of the threads running a request every `interval`
+    seconds from a thread of its own, and counts each stack in the collapsed
+    format read by flame graph tools: the frames from the root, separated
+    by semicolons.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.threads: Counter = Counter()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="profiling-sampler", daemon=True)
+
+    @contextmanager
+    def profile_thread(self) -> Iterator[None]:
+        """Samples the calling thread until the block exits"""
+
+        thread_id = threading.get_ident()
+
+        with self.lock:
+            self.threads[thread_id] += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.threads[thread_id] -= 1
+                if not self.threads[thread_id]:
+                    del self.threads[thread_id]
+
+    def sample(self) -> None:
+        with self.lock:
+            thread_ids = list(self.threads)
+
+        frames_by_thread = sys._current_frames()
+
+        for thread_id in thread_ids:
+            frame = frames_by_thread.get(thread_id)
+            frames = []
+
+            while frame is not None:
+                frames.append(format_frame(frame))
+                frame = frame.f_back
+
+            if frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+    def write(self, path: Path) -> None:
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in self.stacks.items()))
+
+
+class DeterministicProfiler:
+    """
+    cProfile over the threads running a request, written as pstats.
+    cProfile only sees the thread that enabled it, so each thread
+    gets a profile of its own, merged when written.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: List[cProfile.Profile] = []
+        self.thread_ids: Set[int] = set()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def profile_thread(self) -> Iterator[None]:
+        """Profiles the calling thread until the block exits"""
+
+        thread_id = threading.get_ident()
+
+        with self.lock:
+            # Already profiled further up its stack
+            if thread_id in self.thread_ids:
+                profile = None
+            else:
+                profile = cProfile.Profile()
+                self.profiles.append(profile)
+                self.thread_ids.add(thread_id)
+
+        if profile is None:
+            yield
+            return
+
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self.lock:
+                self.thread_ids.discard(thread_id)
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def write(self, path: Path) -> None:
+        pstats.Stats(*self.profiles).dump_stats(path)
+
+
+_request_profiler: ContextVar[Optional[Union[StackSampler, DeterministicProfiler]]] = ContextVar(
+    "request_profiler", default=None
+)
+
+
+def profiled(func: Callable) -> Callable:
+    """
+    Wraps `func` so that the thread it's called in is profiled with the
+    request wrapping it, for the work a request hands to other threads.
+    """
+
+    profiler = _request_profiler.get()
+
+    if profiler is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profiler.profile_thread():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def sync_to_async(func: Callable, *, thread_sensitive: bool = True) -> Callable:
+    """asgiref's `sync_to_async`, profiling the thread `func` runs in with the request awaiting it"""
+
+    return asgiref_sync_to_async(profiled(func), thread_sensitive=thread_sensitive)
+
+
+def get_route_name(request: HttpRequest) -> str:
+    resolver_match = getattr(request, "resolver_match", None)
+
+    if resolver_match is None:
+        return "unresolved"
+    return resolver_match.view_name.replace(":", ".")
+
+
+def rotate_profiles(directory: Path) -> None:
+    """Deletes the oldest profiles beyond `profiling_max_files`"""
+
+    with _rotation_lock:
+        profiles = sorted(iter_profiles(directory), key=lambda path: path.name)
+
+        for path in profiles[:max(len(profiles) - profiling_max_files, 0)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def iter_profiles(directory: Path, suffixes: Iterable[str] = PROFILE_SUFFIXES) -> Iterator[Path]:
+    return (path for path in Path(directory).glob("*") if path.suffix in suffixes)
+
+
+@contextmanager
+def profile_request(request: HttpRequest, asynchronous: bool = False) -> Iterator[None]:
+    """
+    Profiles the block, then writes the profile named after the time and
+    the view of the request to `profiling_dir`: `.collapsed` stacks when
+    sampling, `.pstats` with cProfile.
+
+    A synchronous request is profiled in the calling thread. An asynchronous
+    one only in the threads its sync work runs in, through `sync_to_async`
+    and `profiled`, as the event loop is shared with the other requests.
+    """
+
+    if profiling_mode == "cprofile":
+        profiler, suffix = DeterministicProfiler(), "pstats"
+    else:
+        profiler, suffix = StackSampler(profiling_interval), "collapsed"
+
+    token = _request_profiler.set(profiler)
+    profiler.start()
+    try:
+        if asynchronous:
+            yield
+        else:
+            with profiler.profile_thread():
+                yield
+    finally:
+        profiler.stop()
+        _request_profiler.reset(token)
+
+        directory = Path(profiling_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Sorted by name, oldest first
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}-{get_route_name(request)}.{suffix}"
+        profiler.write(directory / name)
+        rotate_profiles(directory)
+
+
+def merge_collapsed(paths: Iterable[Path]) -> Dict[str, int]:
+    """Sums the count of each stack over the collapsed profiles"""
+
+    stacks: Counter = Counter()
+
+    for path in paths:
+        for line in path.read_text().splitlines():
+            stack, _, count = line.rpartition(" ")
+            if stack and count.isdigit():
+                stacks[stack] += int(count)
+
+    return stacks
+
+
+def configure(
+    *,
+    sample_rate: Optional[float] = None,
+    mode: Optional[str] = None,
+    directory: Optional[str] = None,
+    max_files: Optional[int] = None,
+) -> None:
+    """Changes the share of the requests profiled, the profiler and where the profiles go"""
+
+    global profiling_sample_rate, profiling_mode, profiling_dir, profiling_max_files
+
+    if sample_rate is not None:
+        profiling_sample_rate = sample_rate
+    if mode is not None:
+        profiling_mode = mode
+    if directory is not None:
+        profiling_dir = directory
+    if max_files is not None:
+        profiling_max_files = max_files
+
+
+@receiver(setting_changed)
+def reset_profiling(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        configure(
+            sample_rate=settings.AUTHENTICATION_SERVICE.get("profiling_sample_rate", 0.0),
+            mode=settings.AUTHENTICATION_SERVICE.get("profiling_mode", "sampling"),
+            directory=get_profiling_dir(),
+            max_files=settings.AUTHENTICATION_SERVICE.get("profiling_max_files", 500),
+        )
@@ -0,0 +1,171 @@
+# Python Imports
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Typing Imports
+from typing import Dict, Iterator, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+
+
+# Global initialization
+server_timing_sample_rate = settings.AUTHENTICATION_SERVICE.get("server_timing_sample_rate", 0.1)
+server_timing_header = settings.AUTHENTICATION_SERVICE.get("server_timing_header", True)
+server_timing_path_prefix = settings.AUTHENTICATION_SERVICE.get("server_timing_path_prefix", "/api/v1/")
+
+logger = logging.getLogger("authentication_service.timings")
+
+# Timed parts of a request, in the order of the Server-Timing header
+METRICS = ("db", "hash", "email", "http")
+
+
+class RequestTimings:
+    """The time spent, and the number of calls, in each part of a request"""
+
+    __slots__ = ("durations", "counts", "lock")
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+        # Sync parts of an async view run in another thread
+        self.lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.durations[name] = self.durations.get(name, 0.0) + seconds
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def request_timings_scope() -> Iterator[RequestTimings]:
+    """Times the parts of the code run inside the block"""
+
+    token = _request_timings.set(RequestTimings())
+
+    try:
+        yield _request_timings.get()
+    finally:
+        _request_timings.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Adds the time spent in the block to the `name` part of the request.
+    Outside of a sampled request, it costs a context variable lookup.
+    """
+
+    timings = _request_timings.get()
+
+    if timings is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started_at)
+
+
+def time_query(execute, sql, params, many, context):
+    timings = _request_timings.get()
+
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add("db", time.perf_counter() - started_at)
+
+
+def install_query_timer(connection) -> None:
+    # First in the list, so `connection.execute_wrapper()` blocks still pop their own wrapper
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, time_query)
+
+
+@receiver(connection_created)
+def install_connection_query_timer(*, connection, **kwargs) -> None:
+    install_query_timer(connection)
+
+
+def install_query_timers() -> None:
+    for connection in connections.all():
+        install_query_timer(connection)
+
+
+def should_time(request: HttpRequest) -> bool:
+    if not request.path.startswith(server_timing_path_prefix):
+        return False
+    return server_timing_sample_rate >= 1 or random.random() < server_timing_sample_rate
+
+
+def report_timings(request: HttpRequest, response: HttpResponse, timings: RequestTimings, total: float) -> None:
+    """Logs the timings of the request, and sends them in a Server-Timing header"""
+
+    resolver_match = getattr(request, "resolver_match", None)
+    record = {
+        "method": request.method,
+        # The route, as paths may carry uid and tokens
+        "route": resolver_match.route if resolver_match is not None else None,
+        "status": response.status_code,
+        "total_ms": round(total * 1000, 3),
+    }
+    entries = [f"total;dur={total * 1000:.3f}"]
+
+    for name in METRICS:
+        if name not in timings.counts:
+            continue
+
+        duration, count = timings.durations[name] * 1000, timings.counts[name]
+        record[f"{name}_ms"] = round(duration, 3)
+        record[f"{name}_count"] = count
+        entries.append(f'{name};dur={duration:.3f};desc="{count}"')
+
+    logger.info(json.dumps(record, separators=(",", ":")))
+
+    if server_timing_header:
+        response["Server-Timing"] = ", ".join(entries)
+
+
+def configure(
+    *, sample_rate: Optional[float] = None, header: Optional[bool] = None, path_prefix: Optional[str] = None
+) -> None:
+    """Changes the share of the requests timed, and whether clients get their timings"""
+
+    global server_timing_sample_rate, server_timing_header, server_timing_path_prefix
+
+    if sample_rate is not None:
+        server_timing_sample_rate = sample_rate
+    if header is not None:
+        server_timing_header = header
+    if path_prefix is not None:
+        server_timing_path_prefix = path_prefix
+
+
+@receiver(setting_changed)
+def reset_timings(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        configure(
+            sample_rate=settings.AUTHENTICATION_SERVICE.get("server_timing_sample_rate", 0.1),
+            header=settings.AUTHENTICATION_SERVICE.get("server_timing_header", True),
+            path_prefix=settings.AUTHENTICATION_SERVICE.get("server_timing_path_prefix", "/api/v1/"),
+        )
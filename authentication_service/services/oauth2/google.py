@@ -1,36 +1,186 @@
+# Python Imports
+import logging
+import re
+import threading
+import time
+
+# Typing Imports
+from typing import Any, Dict, Optional, Tuple
+
 # Third Party Imports
-import httpx
+import jwt
 
 # Django Imports
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.utils.module_loading import import_string
+
+# Account Service Imports
+from authentication_service.services.instrumentation.metrics import GOOGLE_VALIDATION_DURATION
+from authentication_service.services.oauth2.http import get_client
+
 
 # Google ID Token
-GOOGLE_ID_TOKEN_INFO_URL = 'https://www.googleapis.com/oauth2/v3/tokeninfo'
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# Global initialization
+google_oauth2_key_source = settings.AUTHENTICATION_SERVICE.get(
+    "google_oauth2_key_source", "authentication_service.services.oauth2.google.GoogleCertsKeySource"
+)
+
+# Keys are cached this long when Google sends no max-age
+DEFAULT_MAX_AGE = 300
+
+# Least seconds between two refreshes caused by an unknown kid, or after a failed one
+MIN_REFRESH_INTERVAL = 30
+
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+logger = logging.getLogger(__name__)
+
+
+class KeySetUnavailable(Exception):
+    """The key of a token isn't cached, and the keys can't be fetched"""
+
 
+class GoogleCertsKeySource:
+    """Fetches Google's signing keys, cached as long as its Cache-Control allows"""
 
-async def google_validate_id_token(*, id_token: str) -> bool:
+    url = GOOGLE_CERTS_URL
+
+    def fetch(self) -> Tuple[Dict[str, Any], float]:
+        response = get_client().get(self.url)
+        response.raise_for_status()
+
+        max_age = MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        return response.json(), float(max_age.group(1)) if max_age else DEFAULT_MAX_AGE
+
+
+class StaticKeySource:
+    """A fixed key set, e.g. for tests or networks without access to Google"""
+
+    def __init__(self, jwks: Dict[str, Any]) -> None:
+        self.jwks = jwks
+
+    def fetch(self) -> Tuple[Dict[str, Any], float]:
+        return self.jwks, float("inf")
+
+
+class GoogleKeySet:
     """
-    Authenticate this request by comparing the aud (short for audience) 
-    from the Google response with the GOOGLE_OAUTH2_CLIENT_ID
+    The parsed signing keys, refreshed when they expire, or when
+    a token is signed by a key that isn't known yet.
+
+    One caller fetches the keys at a time, outside of the lock: the
+    others go on with the cached keys rather than queue behind it.
+    A failed fetch keeps the cached keys, and isn't retried for
+    `MIN_REFRESH_INTERVAL` seconds.
     """
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            GOOGLE_ID_TOKEN_INFO_URL,
-            params={'id_token': id_token}
-        )
 
-        # Check is response is not "OK"
-        if not response.ok:
-            raise ValidationError('id_token is invalid.')
+    def __init__(self, key_source) -> None:
+        self.key_source = key_source
+        self.keys: Dict[str, jwt.PyJWK] = {}
+        self.expires_at = 0.0
+        self.attempted_at = float("-inf")
+        self.failed = False
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+    def refresh(self) -> None:
+        jwks, max_age = self.key_source.fetch()
+        keys = {key["kid"]: jwt.PyJWK(key) for key in jwks.get("keys", []) if "kid" in key}
+
+        with self.lock:
+            self.keys = keys
+            self.expires_at = time.monotonic() + max_age
+
+    def get_key(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        with self.lock:
+            now = time.monotonic()
+
+            should_refresh = (
+                not self.refreshing
+                and (now >= self.expires_at or kid not in self.keys)
+                and now - self.attempted_at >= MIN_REFRESH_INTERVAL
+            )
+            if should_refresh:
+                self.refreshing, self.attempted_at = True, now
+
+        if should_refresh:
+            try:
+                self.refresh()
+                self.failed = False
+            except Exception:
+                logger.warning("Fetching the Google signing keys failed", exc_info=True)
+                self.failed = True
+            finally:
+                self.refreshing = False
+
+        key = self.keys.get(kid)
+        if key is None and (self.failed or self.refreshing):
+            raise KeySetUnavailable(kid)
+        return key
+
+
+google_key_set = GoogleKeySet(import_string(google_oauth2_key_source)())
+
+
+def configure(*, key_source) -> None:
+    """Verifies the tokens with the keys of `key_source` from now on"""
+
+    global google_key_set
+    google_key_set = GoogleKeySet(key_source)
+
+
+def google_validate_id_token(*, id_token: str) -> Dict[str, Any]:
+    """
+    Verifies the signature and the claims of a Google ID token locally,
+    and returns its claims. The aud (short for audience) must be
+    the GOOGLE_OAUTH2_CLIENT_ID.
+    """
+
+    started_at, outcome = time.perf_counter(), "invalid"
+
+    try:
+        claims = verify_id_token(id_token)
+        outcome = "valid"
+        return claims
+    finally:
+        GOOGLE_VALIDATION_DURATION.observe(time.perf_counter() - started_at, outcome=outcome)
+
+
+def verify_id_token(id_token: str) -> Dict[str, Any]:
+    if not id_token:
+        raise ValidationError("id_token is invalid.")
+
+    try:
+        key = google_key_set.get_key(jwt.get_unverified_header(id_token).get("kid"))
+    except jwt.InvalidTokenError:
+        raise ValidationError("id_token is invalid.")
+    except KeySetUnavailable:
+        raise ValidationError("Google signing keys are unavailable.")
+
+    if key is None:
+        raise ValidationError("id_token is invalid.")
+
+    try:
+        claims = jwt.decode(
+            id_token,
+            key.key,
+            algorithms=["RS256"],
+            audience=settings.GOOGLE_OAUTH2_CLIENT_ID,
+            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+        )
+    except jwt.InvalidAudienceError:
+        raise ValidationError("Invalid audience.")
+    except jwt.InvalidTokenError:
+        raise ValidationError("id_token is invalid.")
 
-        # Get audience data
-        audience = response.json()['aud']
+    if claims["iss"] not in GOOGLE_ISSUERS:
+        raise ValidationError("Invalid issuer.")
 
-        # Compare audience with that of the settings 
-        # configured oauth2 google client id
-        if audience != settings.GOOGLE_OAUTH2_CLIENT_ID:
-            raise ValidationError('Invalid audience.')
+    if not claims.get("email") or not claims.get("email_verified"):
+        raise ValidationError("Email is not verified.")
 
-        return True
\ No newline at end of file
+    return claims
@@ -0,0 +1,105 @@
+# Standard Library Imports
+import atexit
+import os
+import threading
+
+# Typing Imports
+from typing import Dict, Optional
+
+# Third Party Imports
+import httpx
+
+# Django Imports
+from django.conf import settings
+
+# Account Service Imports
+from authentication_service.services.instrumentation.timings import timed
+
+
+# Global initialization
+oauth_http_timeout = settings.AUTHENTICATION_SERVICE.get("oauth_http_timeout", 5)
+oauth_http_connect_timeout = settings.AUTHENTICATION_SERVICE.get("oauth_http_connect_timeout", 2)
+oauth_http_max_connections = settings.AUTHENTICATION_SERVICE.get("oauth_http_max_connections", 20)
+oauth_http_max_keepalive = settings.AUTHENTICATION_SERVICE.get("oauth_http_max_keepalive", 10)
+oauth_http_keepalive_expiry = settings.AUTHENTICATION_SERVICE.get("oauth_http_keepalive_expiry", 30)
+oauth_http_host_limits: Dict[str, int] = settings.AUTHENTICATION_SERVICE.get("oauth_http_host_limits", {})
+
+_client: Optional[httpx.Client] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+class TimedClient(httpx.Client):
+    """Adds the time of every call, body included, to the request timings"""
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        with timed("http"):
+            return super().send(request, **kwargs)
+
+
+def get_limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(oauth_http_max_keepalive, max_connections),
+        keepalive_expiry=oauth_http_keepalive_expiry,
+    )
+
+
+def build_client() -> TimedClient:
+    """
+    A client keeping connections alive between calls. Hosts listed in
+    `oauth_http_host_limits` get a pool of their own with its own limit.
+    """
+
+    mounts = {
+        f"all://{host}": httpx.HTTPTransport(limits=get_limits(max_connections))
+        for host, max_connections in oauth_http_host_limits.items()
+    }
+
+    return TimedClient(
+        timeout=httpx.Timeout(oauth_http_timeout, connect=oauth_http_connect_timeout),
+        limits=get_limits(oauth_http_max_connections),
+        mounts=mounts,
+    )
+
+
+def get_client() -> httpx.Client:
+    """The process wide client used for the outbound calls of the OAuth providers"""
+
+    global _client, _client_pid
+
+    # Connections inherited from the parent of a forked worker cannot be shared
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                _client = build_client()
+                _client_pid = os.getpid()
+
+    return _client
+
+
+def close_client() -> None:
+    """Closes the pooled connections, a new client is created on the next call"""
+
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = _client_pid = None
+
+
+def configure(*, timeout: Optional[float] = None, host_limits: Optional[Dict[str, int]] = None) -> None:
+    """Changes the timeout or the per host limits of the client"""
+
+    global oauth_http_timeout, oauth_http_host_limits
+
+    close_client()
+
+    if timeout is not None:
+        oauth_http_timeout = timeout
+    if host_limits is not None:
+        oauth_http_host_limits = host_limits
+
+
+atexit.register(close_client)
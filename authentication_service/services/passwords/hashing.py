@@ -0,0 +1,208 @@
+# Standard Library Imports
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Typing Imports
+from typing import Any, Callable, Optional, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    identify_hasher,
+    is_password_usable,
+    make_password,
+)
+
+# Account Service Imports
+from authentication_service.hashers import get_preferred_hasher
+from authentication_service.services.instrumentation.metrics import PASSWORD_HASHING_DURATION
+from authentication_service.services.instrumentation.profiling import profiled
+from authentication_service.services.instrumentation.timings import timed
+
+
+# Global initialization
+password_hashing_workers = settings.AUTHENTICATION_SERVICE.get("password_hashing_workers")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def get_workers() -> int:
+    """Number of hashing processes, defaults to the number of cores"""
+
+    if password_hashing_workers is None:
+        return os.cpu_count() or 1
+    return password_hashing_workers
+
+
+def get_executor() -> Optional[Executor]:
+    """
+    The process pool used to hash and verify passwords,
+    or None when hashing runs in the calling thread.
+    """
+
+    global _executor, _executor_pid
+
+    if get_workers() <= 0:
+        return None
+
+    # A pool inherited from the parent of a forked worker cannot be used
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ProcessPoolExecutor(max_workers=get_workers())
+                _executor_pid = os.getpid()
+
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stops the hashing processes, they are started again on the next hash"""
+
+    global _executor, _executor_pid
+
+    with _executor_lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=False)
+        _executor = _executor_pid = None
+
+
+def configure(*, workers: Optional[int]) -> None:
+    """Changes the number of hashing processes (0 hashes in the calling thread)"""
+
+    global password_hashing_workers
+
+    shutdown_executor()
+    password_hashing_workers = workers
+
+
+def run_hasher(func: Callable, *args) -> Any:
+    """Runs a hasher call in the process pool, falling back to the calling thread"""
+
+    executor = get_executor()
+    started_at = time.perf_counter()
+
+    with timed("hash"):
+        try:
+            if executor is None:
+                return func(*args)
+
+            try:
+                return executor.submit(func, *args).result()
+            except BrokenProcessPool:
+                shutdown_executor()
+                return func(*args)
+        finally:
+            PASSWORD_HASHING_DURATION.observe(time.perf_counter() - started_at, operation=func.__name__)
+
+
+async def arun_hasher(func: Callable, *args) -> Any:
+    """Awaits a hasher call without blocking the event loop"""
+
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    started_at = time.perf_counter()
+
+    with timed("hash"):
+        try:
+            # Only a thread can be profiled, the processes would fail to pickle the wrapper
+            return await loop.run_in_executor(executor, func if executor else profiled(func), *args)
+        except BrokenProcessPool:
+            shutdown_executor()
+            return await loop.run_in_executor(None, profiled(func), *args)
+        finally:
+            PASSWORD_HASHING_DURATION.observe(time.perf_counter() - started_at, operation=func.__name__)
+
+
+def encode(hasher, password: str, salt: str) -> str:
+    return hasher.encode(password, salt)
+
+
+def verify(hasher, password: str, encoded: str, harden_runtime: bool) -> bool:
+    is_correct = hasher.verify(password, encoded)
+
+    # Close the timing gap between the work factor of
+    # the encoded password and the preferred work factor
+    if not is_correct and harden_runtime:
+        hasher.harden_runtime(password, encoded)
+    return is_correct
+
+
+def prepare_hash(password: Optional[str]) -> Tuple[Any, Optional[str]]:
+    if password is None or not isinstance(password, (bytes, str)):
+        return None, None
+
+    hasher = get_preferred_hasher()
+    return hasher, hasher.salt()
+
+
+def prepare_verify(password: Optional[str], encoded: str) -> Tuple[Any, bool, bool]:
+    if password is None or not is_password_usable(encoded):
+        return None, False, False
+
+    preferred = get_preferred_hasher()
+
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        # encoded is gibberish or uses a hasher that's no longer installed
+        return None, False, False
+
+    hasher_changed = hasher.algorithm != preferred.algorithm
+    must_update = hasher_changed or preferred.must_update(encoded)
+    return hasher, must_update, not hasher_changed and must_update
+
+
+def hash_password(password: Optional[str]) -> str:
+    """Same as Django's `make_password`, with the hashing done in the process pool"""
+
+    hasher, salt = prepare_hash(password)
+
+    if hasher is None:
+        return make_password(password)
+    return run_hasher(encode, hasher, password, salt)
+
+
+def verify_password(password: Optional[str], encoded: str) -> Tuple[bool, bool]:
+    """
+    Verifies the password in the process pool.
+
+    :return: Whether the password is correct and whether its hash must be updated
+    """
+
+    hasher, must_update, harden_runtime = prepare_verify(password, encoded)
+
+    if hasher is None:
+        return False, False
+    return run_hasher(verify, hasher, password, encoded, harden_runtime), must_update
+
+
+def check_password(password: Optional[str], encoded: str, setter: Callable = None) -> bool:
+    """Same as Django's `check_password`, with the hashing done in the process pool"""
+
+    is_correct, must_update = verify_password(password, encoded)
+
+    if setter and is_correct and must_update:
+        setter(password)
+    return is_correct
+
+
+async def ahash_password(password: Optional[str]) -> str:
+    hasher, salt = prepare_hash(password)
+
+    if hasher is None:
+        return make_password(password)
+    return await arun_hasher(encode, hasher, password, salt)
+
+
+async def averify_password(password: Optional[str], encoded: str) -> Tuple[bool, bool]:
+    hasher, must_update, harden_runtime = prepare_verify(password, encoded)
+
+    if hasher is None:
+        return False, False
+    return await arun_hasher(verify, hasher, password, encoded, harden_runtime), must_update
@@ -0,0 +1,225 @@
+# Python Imports
+import threading
+import time
+from collections import OrderedDict
+
+# Typing Imports
+from typing import Dict, Optional, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+# Global initialization
+throttle_backend = settings.AUTHENTICATION_SERVICE.get(
+    "throttle_backend", "authentication_service.services.throttling.buckets.LocalBucketBackend"
+)
+throttle_cache = settings.AUTHENTICATION_SERVICE.get("throttle_cache", "default")
+throttle_local_shards = settings.AUTHENTICATION_SERVICE.get("throttle_local_shards", 16)
+throttle_local_size = settings.AUTHENTICATION_SERVICE.get("throttle_local_size", 100_000)
+throttle_rates: Dict[str, Optional[str]] = settings.AUTHENTICATION_SERVICE.get("throttle_rates", {})
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: Optional[str]) -> Optional[Tuple[int, float]]:
+    """
+    Parses a rate such as "10/min" into the capacity of the bucket
+    and the tokens it regains per second, None disables the bucket.
+    """
+
+    if rate is None:
+        return None
+
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class BucketShard:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+
+class LocalBucketBackend:
+    """
+    Token buckets held in the memory of the process. The buckets are
+    spread over shards with a lock each, so concurrent requests rarely
+    wait for one another, and the least recently used are dropped once
+    a shard is full.
+    """
+
+    def __init__(self, shards: int = 16, maxsize: int = 100_000) -> None:
+        self.shards = [BucketShard(max(1, maxsize // shards)) for _ in range(shards)]
+
+    def consume(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Takes a token from the bucket, returns 0 or the seconds until one is available"""
+
+        shard = self.shards[hash(key) % len(self.shards)]
+        now = time.monotonic()
+
+        with shard.lock:
+            tokens, updated_at = shard.buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / refill_rate
+
+            shard.buckets[key] = (tokens, now)
+            shard.buckets.move_to_end(key)
+
+            if len(shard.buckets) > shard.maxsize:
+                shard.buckets.popitem(last=False)
+
+        return wait
+
+    def clear(self) -> None:
+        for shard in self.shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+
+class CacheBucketBackend:
+    """
+    Buckets shared by every process through the `throttle_cache`, with
+    atomic increments only. A bucket is approximated by a counter per
+    refill period, the count of the previous period weighing less as
+    the current one goes by. Rejected keys are remembered in memory
+    until they may retry, so a flood of requests is turned away without
+    a round trip to the cache.
+    """
+
+    def __init__(self, alias: str = "default", maxsize: int = 100_000) -> None:
+        self.alias = alias
+        self.maxsize = maxsize
+        self.rejected: "OrderedDict[str, float]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def consume(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Takes a token from the bucket, returns 0 or the seconds until one is available"""
+
+        now = time.time()
+
+        with self.lock:
+            retry_at = self.rejected.get(key)
+            if retry_at is not None:
+                if now < retry_at:
+                    return retry_at - now
+                del self.rejected[key]
+
+        cache = caches[self.alias]
+        period = capacity / refill_rate
+        index, elapsed = divmod(now, period)
+        current_key, previous_key = f"{key}:{int(index)}", f"{key}:{int(index) - 1}"
+
+        cache.add(current_key, 0, timeout=int(2 * period) + 1)
+        try:
+            count = cache.incr(current_key)
+        except ValueError:
+            # Expired between the add and the incr
+            cache.set(current_key, 1, timeout=int(2 * period) + 1)
+            count = 1
+
+        previous = cache.get(previous_key, 0)
+        weight = 1 - elapsed / period
+
+        if previous * weight + count <= capacity:
+            return 0.0
+
+        # Only the requests let through are counted
+        cache.decr(current_key)
+        count -= 1
+        room = capacity - count - 1
+
+        if room >= 0:
+            # There is room once enough of the previous period has faded
+            wait = period * (weight - room / previous)
+        else:
+            # Otherwise once enough of the current period has faded, in the next one
+            wait = period - elapsed + period * (1 - (capacity - 1) / count)
+
+        with self.lock:
+            self.rejected[key] = now + wait
+            self.rejected.move_to_end(key)
+
+            if len(self.rejected) > self.maxsize:
+                self.rejected.popitem(last=False)
+
+        return wait
+
+    def clear(self) -> None:
+        with self.lock:
+            self.rejected.clear()
+
+
+def build_backend(path: str):
+    backend_class = import_string(path)
+
+    if backend_class is CacheBucketBackend:
+        return backend_class(alias=throttle_cache, maxsize=throttle_local_size)
+    if backend_class is LocalBucketBackend:
+        return backend_class(shards=throttle_local_shards, maxsize=throttle_local_size)
+    return backend_class()
+
+
+bucket_backend = build_backend(throttle_backend)
+
+
+def get_rate(name: str) -> Optional[Tuple[int, float]]:
+    return parse_rate(throttle_rates.get(name))
+
+
+def consume(name: str, ident: str) -> float:
+    """
+    Takes a token from the `name` bucket of `ident`, returns 0 when
+    the request may go on, or the seconds until it may be retried.
+    """
+
+    rate = get_rate(name)
+
+    if rate is None:
+        return 0.0
+    return bucket_backend.consume(f"authentication_service:throttle:{name}:{ident}", *rate)
+
+
+def reset_throttles() -> None:
+    """Refills every bucket of the process"""
+
+    bucket_backend.clear()
+
+
+def configure(*, backend=None, rates: Optional[Dict[str, Optional[str]]] = None) -> None:
+    """Replaces the bucket backend or the rates"""
+
+    global bucket_backend, throttle_rates
+
+    if backend is not None:
+        bucket_backend = backend
+    if rates is not None:
+        throttle_rates = rates
+
+
+@receiver(setting_changed)
+def reset_buckets(*, setting: str, **kwargs) -> None:
+    global throttle_backend, throttle_cache, throttle_local_shards, throttle_local_size
+
+    if setting == "AUTHENTICATION_SERVICE":
+        throttle_backend = settings.AUTHENTICATION_SERVICE.get(
+            "throttle_backend", "authentication_service.services.throttling.buckets.LocalBucketBackend"
+        )
+        throttle_cache = settings.AUTHENTICATION_SERVICE.get("throttle_cache", "default")
+        throttle_local_shards = settings.AUTHENTICATION_SERVICE.get("throttle_local_shards", 16)
+        throttle_local_size = settings.AUTHENTICATION_SERVICE.get("throttle_local_size", 100_000)
+        configure(
+            backend=build_backend(throttle_backend),
+            rates=settings.AUTHENTICATION_SERVICE.get("throttle_rates", {}),
+        )
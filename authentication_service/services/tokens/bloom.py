@@ -0,0 +1,51 @@
+# Python Imports
+import hashlib
+import math
+
+# Typing Imports
+from typing import Tuple
+
+
+class BloomFilter:
+    """
+    A fixed size set of strings that answers "maybe present" or
+    "certainly absent". Items can't be removed, rebuild the filter instead.
+    """
+
+    def __init__(self, size: int, hashes: int) -> None:
+        self.size = size
+        self.hashes = hashes
+        self.bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        """A filter holding `capacity` items with a false positive rate of `error_rate`"""
+
+        capacity = max(capacity, 1)
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hashes = max(round(size / capacity * math.log(2)), 1)
+        return cls(size=size, hashes=hashes)
+
+    def get_seeds(self, item: str) -> Tuple[int, int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def get_positions(self, item: str):
+        # Double hashing: the k positions are derived from two hashes
+        first, second = self.get_seeds(item)
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self.get_positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(item)
+        )
+
+    def __len__(self) -> int:
+        return self.count
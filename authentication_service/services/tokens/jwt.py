@@ -0,0 +1,37 @@
+# Django Imports
+from django.utils.translation import gettext_lazy as _
+
+# SimpleJWT Imports
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+# Account Service Imports
+from authentication_service.services.tokens.keys import token_backend
+from authentication_service.services.tokens.revocation import is_token_revoked
+
+
+class KeyRingMixin:
+    """Signs and verifies the token with the `kid` tagged signing keys"""
+    
+    @property
+    def token_backend(self):
+        return token_backend
+
+
+class RevocationMixin:
+    """Rejects the tokens revoked with `revoke_token`, e.g. on logout"""
+    
+    def verify(self):
+        super().verify()
+        
+        if is_token_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is revoked"))
+
+
+class RevocableAccessToken(RevocationMixin, KeyRingMixin, AccessToken):
+    pass
+
+
+class RevocableRefreshToken(RevocationMixin, KeyRingMixin, RefreshToken):
+    access_token_class = RevocableAccessToken
@@ -0,0 +1,172 @@
+# Python Imports
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+# Typing Imports
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+# Cryptography Imports
+from cryptography.hazmat.primitives import serialization
+
+# JWT Imports
+import jwt
+from jwt import InvalidAlgorithmError, InvalidTokenError
+from jwt.algorithms import get_default_algorithms
+
+# SimpleJWT Imports
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+
+
+# Asymmetric algorithms tokens can be signed with
+SIGNING_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA")
+
+
+class SigningKey(NamedTuple):
+    kid: str
+    algorithm: str
+    private_key: Optional[Any]
+    public_key: Any
+    jwk: Dict[str, Any]
+
+
+def load_signing_key(entry: Dict[str, Any]) -> SigningKey:
+    """
+    Parses one of `jwt_signing_keys`. Retired keys only have a public
+    key, they verify the tokens they signed until these expire.
+    """
+
+    kid, algorithm = entry["kid"], entry["algorithm"]
+
+    if algorithm not in SIGNING_ALGORITHMS:
+        raise ImproperlyConfigured(f"Unsupported JWT signing algorithm {algorithm} for key {kid}.")
+
+    private_key = None
+
+    if entry.get("private_key_path"):
+        private_key = serialization.load_pem_private_key(
+            Path(entry["private_key_path"]).read_bytes(), password=None
+        )
+        public_key = private_key.public_key()
+    else:
+        public_key = serialization.load_pem_public_key(Path(entry["public_key_path"]).read_bytes())
+
+    jwk = json.loads(get_default_algorithms()[algorithm].to_jwk(public_key))
+    jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+
+    return SigningKey(kid, algorithm, private_key, public_key, jwk)
+
+
+class KeyRing:
+    """
+    The parsed signing keys, loaded once per process. The first key
+    signs new tokens, every key verifies the tokens carrying its `kid`.
+    """
+
+    def __init__(self, keys: List[SigningKey]) -> None:
+        self.keys = {key.kid: key for key in keys}
+        self.active = keys[0] if keys else None
+
+        if self.active is not None and self.active.private_key is None:
+            raise ImproperlyConfigured(f"The active JWT signing key {self.active.kid} has no private key.")
+
+        self.jwks = {"keys": [key.jwk for key in keys]}
+        self.jwks_body = json.dumps(self.jwks, sort_keys=True, separators=(",", ":"))
+        self.jwks_etag = hashlib.sha256(self.jwks_body.encode()).hexdigest()[:32]
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        return self.keys.get(kid)
+
+
+@lru_cache(maxsize=None)
+def get_key_ring() -> KeyRing:
+    entries = settings.AUTHENTICATION_SERVICE.get("jwt_signing_keys") or []
+    return KeyRing([load_signing_key(entry) for entry in entries])
+
+
+@receiver(setting_changed)
+def reset_key_ring(*, setting: str, **kwargs) -> None:
+    if setting == "AUTHENTICATION_SERVICE":
+        get_key_ring.cache_clear()
+
+
+class KeyRingTokenBackend(TokenBackend):
+    """
+    Signs tokens with the active key of the key ring, tagged with its `kid`,
+    and verifies them with the key their `kid` names. Without signing keys,
+    it falls back to the `SIMPLE_JWT` algorithm and keys.
+    """
+
+    def encode(self, payload):
+        key_ring = get_key_ring()
+
+        if key_ring.active is None:
+            return super().encode(payload)
+
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        return jwt.encode(
+            jwt_payload,
+            key_ring.active.private_key,
+            algorithm=key_ring.active.algorithm,
+            headers={"kid": key_ring.active.kid},
+            json_encoder=self.json_encoder,
+        )
+
+    def decode(self, token, verify=True):
+        key_ring = get_key_ring()
+
+        if key_ring.active is None:
+            return super().decode(token, verify=verify)
+
+        try:
+            key = key_ring.get(jwt.get_unverified_header(token).get("kid"))
+        except InvalidTokenError:
+            raise TokenBackendError(_("Token is invalid or expired"))
+
+        if key is None:
+            raise TokenBackendError(_("Token is invalid or expired"))
+
+        try:
+            return jwt.decode(
+                token,
+                key.public_key,
+                algorithms=[key.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    "verify_aud": self.audience is not None,
+                    "verify_signature": verify,
+                },
+            )
+        except InvalidAlgorithmError as ex:
+            raise TokenBackendError(_("Invalid algorithm specified")) from ex
+        except InvalidTokenError:
+            raise TokenBackendError(_("Token is invalid or expired"))
+
+
+token_backend = KeyRingTokenBackend(
+    api_settings.ALGORITHM,
+    api_settings.SIGNING_KEY,
+    api_settings.VERIFYING_KEY,
+    api_settings.AUDIENCE,
+    api_settings.ISSUER,
+    api_settings.JWK_URL,
+    api_settings.LEEWAY,
+    api_settings.JSON_ENCODER,
+)
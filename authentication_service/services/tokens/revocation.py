@@ -0,0 +1,184 @@
+# Python Imports
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+# Typing Imports
+from typing import Dict, Optional
+
+# Django Imports
+from django.conf import settings
+
+# SimpleJWT Imports
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Account Service Imports
+from authentication_service.models import RevokedToken
+from authentication_service.routers import use_primary
+from authentication_service.services.tokens.bloom import BloomFilter
+from authentication_service.services.users.timestamps import get_now
+
+
+# Global initialization
+token_revocation_refresh_interval = settings.AUTHENTICATION_SERVICE.get("token_revocation_refresh_interval", 1)
+token_revocation_capacity = settings.AUTHENTICATION_SERVICE.get("token_revocation_capacity", 100_000)
+token_revocation_error_rate = settings.AUTHENTICATION_SERVICE.get("token_revocation_error_rate", 0.001)
+token_revocation_purge_batch_size = settings.AUTHENTICATION_SERVICE.get("token_revocation_purge_batch_size", 1000)
+
+# Tokens revoked this long before the watermark are read again,
+# so clock skew between the app servers can't hide a revocation
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+class RevocationFilter:
+    """
+    A per process Bloom filter of the revoked jtis. It is read in full
+    once, then refreshed with the tokens revoked since, and rebuilt
+    without the expired tokens when it outgrows its capacity.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, refresh_interval: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.filter: Optional[BloomFilter] = None
+        self.watermark: Optional[datetime] = None
+        self.refreshed_at = 0.0
+        self.lock = threading.RLock()
+
+    def load(self, tokens) -> None:
+        for jti, date_revoked in tokens.values_list("jti", "date_revoked").iterator():
+            # Skips the tokens read again by the watermark overlap
+            if jti not in self.filter:
+                self.filter.add(jti)
+
+            if self.watermark is None or date_revoked > self.watermark:
+                self.watermark = date_revoked
+
+    def rebuild(self) -> None:
+        with self.lock, use_primary():
+            tokens = RevokedToken.objects.filter(expires_at__gte=get_now())
+            capacity = max(self.capacity, 2 * tokens.count())
+
+            self.filter = BloomFilter.for_capacity(capacity, self.error_rate)
+            self.capacity = capacity
+            self.watermark = None
+            self.load(tokens)
+            self.refreshed_at = time.monotonic()
+
+    def refresh(self, force: bool = False) -> None:
+        # A replica behind the watermark would hide its revocations for good
+        with self.lock, use_primary():
+            if self.filter is None or len(self.filter) >= self.capacity:
+                self.rebuild()
+                return
+
+            if not force and time.monotonic() - self.refreshed_at < self.refresh_interval:
+                return
+
+            tokens = RevokedToken.objects.all()
+            if self.watermark is not None:
+                tokens = tokens.filter(date_revoked__gte=self.watermark - WATERMARK_OVERLAP)
+
+            self.load(tokens)
+            self.refreshed_at = time.monotonic()
+
+    def add(self, jti: str) -> None:
+        with self.lock:
+            if self.filter is not None:
+                self.filter.add(jti)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        self.refresh()
+        return jti in self.filter
+
+    def clear(self) -> None:
+        with self.lock:
+            self.filter = None
+            self.watermark = None
+            self.refreshed_at = 0.0
+
+
+revocation_filter = RevocationFilter(
+    capacity=token_revocation_capacity,
+    error_rate=token_revocation_error_rate,
+    refresh_interval=token_revocation_refresh_interval,
+)
+
+_stats_lock = threading.Lock()
+_stats = {"negatives": 0, "lookups": 0, "false_positives": 0}
+
+
+def _count(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def revocation_stats() -> Dict[str, int]:
+    """
+    Checks answered by the filter alone, checks that fell through to
+    the database, and the ones among them that weren't revoked.
+    """
+
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_revocation_stats() -> None:
+    with _stats_lock:
+        for counter in _stats:
+            _stats[counter] = 0
+
+
+def revoke_token(token: Token, user_id: Optional[int] = None) -> None:
+    """Revokes the token until it expires"""
+
+    jti = token[api_settings.JTI_CLAIM]
+
+    RevokedToken.objects.bulk_create([
+        RevokedToken(
+            jti=jti,
+            token_type=token.get(api_settings.TOKEN_TYPE_CLAIM, ""),
+            user_id=user_id or token.get(api_settings.USER_ID_CLAIM),
+            expires_at=datetime.fromtimestamp(token["exp"], tz=timezone.utc),
+        )
+    ], ignore_conflicts=True)
+
+    revocation_filter.add(jti)
+
+
+def is_token_revoked(jti: str) -> bool:
+    """
+    Answers in memory for the tokens that certainly aren't revoked,
+    and with an indexed lookup for the probable hits of the filter.
+    """
+
+    if not revocation_filter.might_be_revoked(jti):
+        _count("negatives")
+        return False
+
+    _count("lookups")
+    with use_primary():
+        is_revoked = RevokedToken.objects.filter(jti=jti).exists()
+
+    if not is_revoked:
+        _count("false_positives")
+    return is_revoked
+
+
+def purge_expired_tokens(batch_size: Optional[int] = None) -> int:
+    """Deletes the expired tokens in batches, returns how many were deleted"""
+
+    batch_size = batch_size or token_revocation_purge_batch_size
+    now = get_now()
+    purged = 0
+
+    while True:
+        ids = list(
+            RevokedToken.objects.filter(expires_at__lt=now).values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return purged
+
+        purged += RevokedToken.objects.filter(id__in=ids).delete()[0]
@@ -0,0 +1,187 @@
+# Python Imports
+import threading
+import time
+from collections import OrderedDict
+
+# Typing Imports
+from typing import Any, Dict, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.db.models import DEFERRED
+from django.dispatch import receiver
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.routers import PRIMARY
+
+
+# Global initialization
+auth_user_cache = settings.AUTHENTICATION_SERVICE.get("auth_user_cache", "default")
+auth_user_cache_timeout = settings.AUTHENTICATION_SERVICE.get("auth_user_cache_timeout", 300)
+auth_user_cache_local_size = settings.AUTHENTICATION_SERVICE.get("auth_user_cache_local_size", 1024)
+auth_user_cache_local_ttl = settings.AUTHENTICATION_SERVICE.get("auth_user_cache_local_ttl", 5)
+
+# The fields read by the authentication and the permission checks. The cache
+# is shared with other services, so the password hash and the rest of the row
+# stay out of it, and are loaded from the database if a view reads them.
+CACHED_FIELDS = (
+    "id", "uuid", "email", "is_active", "is_suspended", "is_staff", "is_superuser", "credential_epoch"
+)
+
+# Saves that touch one of these fields change who is authenticated
+AUTH_FIELDS = frozenset((*CACHED_FIELDS, "password"))
+
+
+class LocalLRUCache:
+    """
+    A per process LRU of recently authenticated users. Entries expire after
+    `ttl` seconds, which bounds how long another process's write goes unseen.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            user, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return user
+
+    def set(self, key: Any, user: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self.lock:
+            self.entries[key] = (user, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+local_cache = LocalLRUCache(maxsize=auth_user_cache_local_size, ttl=auth_user_cache_local_ttl)
+
+_stats_lock = threading.Lock()
+_stats = {"local_hits": 0, "cache_hits": 0, "misses": 0}
+
+
+def _count(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def get_cache_key(user_id: Any) -> str:
+    return f"authentication_service:auth-user:{user_id}"
+
+
+def load_user(snapshot: Dict[str, Any]) -> AccountUser:
+    """A new user built from the cached fields, the others are deferred"""
+
+    values = [snapshot.get(field.attname, DEFERRED) for field in AccountUser._meta.concrete_fields]
+    return AccountUser.from_db(PRIMARY, CACHED_FIELDS, values)
+
+
+def get_cached_user(user_id: Any) -> Optional[AccountUser]:
+    """
+    Returns the cached user with the id, first from the process
+    LRU and then from the Django cache, or None on a miss.
+    """
+
+    key = get_cache_key(user_id)
+    snapshot = local_cache.get(key)
+
+    if snapshot is not None:
+        _count("local_hits")
+        return load_user(snapshot)
+
+    snapshot = caches[auth_user_cache].get(key)
+
+    # Entries of the full user, written before the fields were picked
+    if snapshot is not None and not isinstance(snapshot, dict):
+        snapshot = None
+
+    if snapshot is not None:
+        _count("cache_hits")
+        local_cache.set(key, snapshot)
+        return load_user(snapshot)
+
+    _count("misses")
+    return None
+
+
+def cache_user(user: AccountUser) -> None:
+    """Stores the `CACHED_FIELDS` of the user in both caches"""
+
+    key = get_cache_key(user.pk)
+    snapshot = {field: getattr(user, field) for field in CACHED_FIELDS}
+
+    caches[auth_user_cache].set(key, snapshot, auth_user_cache_timeout)
+    local_cache.set(key, snapshot)
+
+
+def invalidate_user(user_id: Any) -> None:
+    key = get_cache_key(user_id)
+
+    local_cache.delete(key)
+    caches[auth_user_cache].delete(key)
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit and miss counters of the process, and its hit ratio"""
+
+    with _stats_lock:
+        stats = dict(_stats)
+
+    lookups = sum(stats.values())
+    stats["hit_ratio"] = (stats["local_hits"] + stats["cache_hits"]) / lookups if lookups else 0.0
+    return stats
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        for counter in _stats:
+            _stats[counter] = 0
+
+
+def configure(*, local_size: int, local_ttl: float) -> None:
+    """Resizes the process LRU and drops its entries"""
+
+    local_cache.maxsize = local_size
+    local_cache.ttl = local_ttl
+    local_cache.clear()
+
+
+@receiver(setting_changed)
+def reset_user_cache(*, setting: str, **kwargs) -> None:
+    global auth_user_cache, auth_user_cache_timeout
+
+    if setting == "AUTHENTICATION_SERVICE":
+        auth_user_cache = settings.AUTHENTICATION_SERVICE.get("auth_user_cache", "default")
+        auth_user_cache_timeout = settings.AUTHENTICATION_SERVICE.get("auth_user_cache_timeout", 300)
+        configure(
+            local_size=settings.AUTHENTICATION_SERVICE.get("auth_user_cache_local_size", 1024),
+            local_ttl=settings.AUTHENTICATION_SERVICE.get("auth_user_cache_local_ttl", 5),
+        )
@@ -0,0 +1,159 @@
+# Python Imports
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# Typing Imports
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+# Django Imports
+from django.conf import settings
+from django.db.models import F
+
+# SimpleJWT Imports
+from rest_framework_simplejwt.tokens import Token
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.routers import use_primary
+
+
+# Global initialization
+credential_epoch_refresh_interval = settings.AUTHENTICATION_SERVICE.get("credential_epoch_refresh_interval", 1)
+credential_epoch_unknown_user_ttl = settings.AUTHENTICATION_SERVICE.get("credential_epoch_unknown_user_ttl", 30)
+
+# Unknown user ids remembered, the oldest are forgotten beyond
+UNKNOWN_USERS_SIZE = 10_000
+
+# Rows modified this long before the watermark are read again,
+# so clock skew between the app servers can't hide a write
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+class CredentialState(NamedTuple):
+    epoch: int
+    is_active: bool
+    is_suspended: bool
+    is_staff: bool
+
+
+def bump_credential_epoch(user: AccountUser, update_fields: Iterable[str] = ()) -> None:
+    """
+    Saves `update_fields` with a new credential epoch, which
+    rejects every access token issued to the user before it.
+    """
+
+    # Incremented by the UPDATE: the epoch of the instance may be stale
+    # (from the identity map, the user cache or a replica), and writing
+    # it back could hand out the epoch of the tokens issued since
+    user.credential_epoch = F("credential_epoch") + 1
+    user.save(update_fields=[*update_fields, "credential_epoch"])
+
+    # Deferred, the new epoch is loaded from the database if it's read
+    del user.credential_epoch
+
+
+def add_account_claims(token: Token, user: AccountUser) -> Token:
+    """Adds the claims read by `StatelessJWTAuthentication` to the token"""
+
+    token["is_staff"] = user.is_staff
+    token["is_suspended"] = user.is_suspended
+    token["epoch"] = user.credential_epoch
+    return token
+
+
+class CredentialEpochTable:
+    """
+    The credential state of every user, kept in memory. The first lookup
+    loads the whole table, later ones read the users modified since.
+    Unknown users, e.g. deleted ones with a valid token, are remembered
+    for `unknown_user_ttl` seconds rather than refreshing on each lookup.
+    """
+
+    def __init__(self, refresh_interval: float, unknown_user_ttl: float = 30) -> None:
+        self.refresh_interval = refresh_interval
+        self.unknown_user_ttl = unknown_user_ttl
+        self.states: Dict[Any, CredentialState] = {}
+        self.unknown_users: "OrderedDict[Any, float]" = OrderedDict()
+        self.watermark: Optional[datetime] = None
+        self.refreshed_at = 0.0
+        self.lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> None:
+        # A replica behind the watermark would hide its writes for good
+        with self.lock, use_primary():
+            if not force and time.monotonic() - self.refreshed_at < self.refresh_interval:
+                return
+
+            users = AccountUser.objects.all()
+            if self.watermark is not None:
+                users = users.filter(date_modified__gte=self.watermark - WATERMARK_OVERLAP)
+
+            rows = users.values_list(
+                "id", "credential_epoch", "is_active", "is_suspended", "is_staff", "date_modified"
+            )
+
+            for user_id, epoch, is_active, is_suspended, is_staff, date_modified in rows:
+                self.states[user_id] = CredentialState(epoch, is_active, is_suspended, is_staff)
+
+                if self.watermark is None or date_modified > self.watermark:
+                    self.watermark = date_modified
+
+            self.refreshed_at = time.monotonic()
+
+    def get(self, user_id: Any) -> Optional[CredentialState]:
+        """
+        The credential state of the user, refreshed at most once per
+        `credential_epoch_refresh_interval`, or right away for unknown users
+        """
+
+        self.refresh()
+        state = self.states.get(user_id)
+
+        if state is None and not self.is_unknown(user_id):
+            # Users created since the last refresh
+            self.refresh(force=True)
+            state = self.states.get(user_id)
+
+            if state is None:
+                self.remember_unknown(user_id)
+
+        return state
+
+    def is_unknown(self, user_id: Any) -> bool:
+        with self.lock:
+            expires_at = self.unknown_users.get(user_id)
+
+            if expires_at is None:
+                return False
+            if expires_at < time.monotonic():
+                del self.unknown_users[user_id]
+                return False
+            return True
+
+    def remember_unknown(self, user_id: Any) -> None:
+        with self.lock:
+            self.unknown_users[user_id] = time.monotonic() + self.unknown_user_ttl
+            self.unknown_users.move_to_end(user_id)
+
+            while len(self.unknown_users) > UNKNOWN_USERS_SIZE:
+                self.unknown_users.popitem(last=False)
+
+    def discard(self, user_id: Any) -> None:
+        """Deletes aren't seen by the refresh, drop the user in this process"""
+
+        with self.lock:
+            self.states.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.states.clear()
+            self.unknown_users.clear()
+            self.watermark = None
+            self.refreshed_at = 0.0
+
+
+epoch_table = CredentialEpochTable(
+    refresh_interval=credential_epoch_refresh_interval, unknown_user_ttl=credential_epoch_unknown_user_ttl
+)
@@ -0,0 +1,124 @@
+# Python Imports
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import UUID
+
+# Typing Imports
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Account Service Imports
+from authentication_service.managers import canonical_email
+from authentication_service.models import AccountUser
+
+
+class UserIdentityMap:
+    """
+    The users loaded during a request, keyed by their canonical email,
+    uuid and id, so that the serializers, the utils and the views share
+    one instance (and one query) per user.
+    """
+
+    def __init__(self) -> None:
+        self.users: Dict[Tuple[str, Any], Optional[AccountUser]] = {}
+
+    def add(self, user: AccountUser) -> None:
+        for key in get_user_keys(user):
+            self.users[key] = user
+
+    def discard(self, user: AccountUser) -> None:
+        for key in get_user_keys(user):
+            self.users.pop(key, None)
+
+
+_identity_map: ContextVar[Optional[UserIdentityMap]] = ContextVar("user_identity_map", default=None)
+
+
+def get_user_keys(user: AccountUser) -> Tuple[Tuple[str, Any], ...]:
+    return (
+        ("id", user.id),
+        ("uuid", user.uuid),
+        ("email", canonical_email(user.email)),
+    )
+
+
+def normalize_lookup(field: str, value: Any) -> Tuple[str, Any]:
+    """
+    Converts a lookup to the form its key is stored in.
+    Invalid ids and uuids raise `ValueError` or `TypeError`.
+    """
+
+    if field == "email":
+        return field, canonical_email(value)
+
+    if field == "uuid":
+        return field, value if isinstance(value, UUID) else UUID(str(value))
+
+    if field in ("id", "pk"):
+        return "id", int(value)
+
+    raise TypeError(f"Users can't be looked up by {field}")
+
+
+def get_identity_map() -> Optional[UserIdentityMap]:
+    return _identity_map.get()
+
+
+@contextmanager
+def user_identity_scope() -> Iterator[UserIdentityMap]:
+    """Shares the users loaded inside the block"""
+
+    token = _identity_map.set(UserIdentityMap())
+
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
+
+
+def get_user(**lookup) -> Optional[AccountUser]:
+    """
+    Returns the user matching a single `email`, `uuid` or `id` lookup.
+
+    Inside a request the users table is queried at most once per user;
+    outside of one every call queries the database.
+    """
+
+    (field, value), = lookup.items()
+    key = normalize_lookup(field, value)
+
+    identity_map = get_identity_map()
+
+    if identity_map is not None and key in identity_map.users:
+        return identity_map.users[key]
+
+    user = AccountUser.objects.filter(**{key[0]: key[1]}).first()
+    remember_user(identity_map, key, user)
+
+    return user
+
+
+async def aget_user(**lookup) -> Optional[AccountUser]:
+    """Same as `get_user`, for async views"""
+
+    (field, value), = lookup.items()
+    key = normalize_lookup(field, value)
+
+    identity_map = get_identity_map()
+
+    if identity_map is not None and key in identity_map.users:
+        return identity_map.users[key]
+
+    user = await AccountUser.objects.filter(**{key[0]: key[1]}).afirst()
+    remember_user(identity_map, key, user)
+
+    return user
+
+
+def remember_user(identity_map: Optional[UserIdentityMap], key: Tuple[str, Any], user: Optional[AccountUser]) -> None:
+    if identity_map is None:
+        return
+
+    if user is None:
+        identity_map.users[key] = None
+    else:
+        identity_map.add(user)
@@ -2,6 +2,7 @@
 from typing import Tuple
 
 # Account Service Imports
+from authentication_service.managers import canonical_email
 from authentication_service.models import AccountUser
 
 # Django Imports
@@ -61,7 +62,7 @@ def user_get_me(*, user: AccountUser):
         data = {
             'id': user.id,
             'uuid': user.uuid,
-            'name': user.fullname,
+            'name': user.fullname(),
             'email': user.email
         }
     )
@@ -86,7 +87,7 @@ def user_get_or_create(*, email: str, **extra_data) -> Tuple[AccountUser, bool]:
     Get or create a user account
     """
     
-    user = AccountUser.objects.filter(email=email).first()
+    user = AccountUser.objects.filter(email=canonical_email(email)).first()
 
     if user is not None:
         return user, False
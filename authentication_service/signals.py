@@ -0,0 +1,41 @@
+# Django Imports
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.services.users.cache import AUTH_FIELDS, invalidate_user
+from authentication_service.services.users.epochs import epoch_table
+from authentication_service.services.users.identity import get_identity_map
+
+
+@receiver(post_save, sender=AccountUser)
+def remember_saved_user(sender, instance: AccountUser, **kwargs) -> None:
+    """Keeps the request identity map in sync with the users written by the request"""
+    
+    identity_map = get_identity_map()
+    
+    if identity_map is not None:
+        identity_map.add(instance)
+
+
+@receiver(post_delete, sender=AccountUser)
+def forget_deleted_user(sender, instance: AccountUser, **kwargs) -> None:
+    identity_map = get_identity_map()
+    
+    if identity_map is not None:
+        identity_map.discard(instance)
+
+
+@receiver(post_save, sender=AccountUser)
+def invalidate_authenticated_user(sender, instance: AccountUser, update_fields=None, **kwargs) -> None:
+    """Drops the cached user when a save may have changed who is authenticated"""
+    
+    if update_fields is None or AUTH_FIELDS.intersection(update_fields):
+        invalidate_user(instance.pk)
+
+
+@receiver(post_delete, sender=AccountUser)
+def invalidate_deleted_user(sender, instance: AccountUser, **kwargs) -> None:
+    invalidate_user(instance.pk)
+    epoch_table.discard(instance.pk)
@@ -0,0 +1,28 @@
+# Django Imports
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests without the login and email throttles, so the test cases
+    don't share buckets. `test_throttling` configures the rates it tests.
+    """
+
+    def setup_test_environment(self, **kwargs) -> None:
+        super().setup_test_environment(**kwargs)
+
+        # Set in place rather than overridden, which would hide `settings.SETTINGS_MODULE`
+        self.authentication_service = settings.AUTHENTICATION_SERVICE
+        self.set_authentication_service({**self.authentication_service, "throttle_rates": {}})
+
+    def teardown_test_environment(self, **kwargs) -> None:
+        self.set_authentication_service(self.authentication_service)
+        super().teardown_test_environment(**kwargs)
+
+    def set_authentication_service(self, value: dict) -> None:
+        settings.AUTHENTICATION_SERVICE = value
+        setting_changed.send(
+            sender=settings._wrapped.__class__, setting="AUTHENTICATION_SERVICE", value=value, enter=True
+        )
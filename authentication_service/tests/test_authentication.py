@@ -0,0 +1,222 @@
+# Django Imports
+from django.core.cache import caches
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework.request import Request
+
+# Simple JWT Imports
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Own Imports
+from authentication_service.authentication import CachedJWTAuthentication, StatelessJWTAuthentication
+from authentication_service.models import AccountUser
+from authentication_service.services.users import cache
+from authentication_service.services.users.epochs import bump_credential_epoch, epoch_table
+
+
+class CachedJWTAuthenticationTestCase(TestCase):
+    """
+    Test case for the cached resolution of authenticated users
+    """
+    
+    def setUp(self) -> None:
+        cache.local_cache.clear()
+        caches[cache.auth_user_cache].clear()
+        cache.reset_cache_stats()
+        
+        self.user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        self.authorization = f"Bearer {RefreshToken.for_user(self.user).access_token}"
+        
+    def authenticate(self):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=self.authorization)
+        return CachedJWTAuthentication().authenticate(Request(request))
+    
+    def test_user_resolved_from_cache(self):
+        """
+        Test case to ensure that only the first authenticated
+        request queries the users table.
+        """
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate()[0], self.user)
+            
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate()[0], self.user)
+        
+        cache.local_cache.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate()[0], self.user)
+            
+        stats = cache.cache_stats()
+        self.assertEqual(
+            (stats["misses"], stats["local_hits"], stats["cache_hits"]), (1, 1, 1)
+        )
+        
+    def test_cached_user_is_a_copy(self):
+        """
+        Test case to ensure that changes made to the authenticated
+        user during a request don't leak into the cache.
+        """
+        
+        self.authenticate()[0].firstname = "Changed"
+        self.assertNotEqual(self.authenticate()[0].firstname, "Changed")
+
+    def test_password_is_not_cached(self):
+        """
+        Test case to ensure that the shared cache only holds the fields
+        the authentication reads, and never the password hash.
+        """
+
+        self.user.set_password("someawfully_strongpassword_2022")
+        self.user.save()
+        self.authenticate()
+
+        snapshot = caches[cache.auth_user_cache].get(cache.get_cache_key(self.user.pk))
+        self.assertEqual(set(snapshot), set(cache.CACHED_FIELDS))
+
+        user = self.authenticate()[0]
+        self.assertIn("password", user.get_deferred_fields())
+        self.assertTrue(user.check_password("someawfully_strongpassword_2022"))
+
+    def test_invalidated_on_status_change(self):
+        """
+        Test case to ensure that changing the status of a user
+        invalidates its cache entry, unlike other fields.
+        """
+        
+        self.authenticate()
+        
+        self.user.firstname = "Abraham"
+        self.user.save(update_fields=["firstname"])
+        with self.assertNumQueries(0):
+            self.authenticate()
+        
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+
+class StatelessJWTAuthenticationTestCase(TestCase):
+    """
+    Test case for the stateless authentication with credential epochs
+    """
+    
+    password = "someawfully_strongpassword_2022"
+    
+    def setUp(self) -> None:
+        epoch_table.clear()
+        self.addCleanup(epoch_table.clear)
+        
+        self.user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True, is_staff=True
+        )
+        self.user.set_password(self.password)
+        self.user.save()
+        
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+        )
+        self.authorization = f"Bearer {response.data['data']['access']}"
+        
+    def authenticate(self):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=self.authorization)
+        return StatelessJWTAuthentication().authenticate(Request(request))
+    
+    def test_authenticate_from_claims(self):
+        """
+        Test case to ensure that the user is built from the token
+        claims once the epoch table is loaded.
+        """
+        
+        self.authenticate()
+        
+        with self.assertNumQueries(0):
+            user = self.authenticate()[0]
+        
+        self.assertEqual(user.id, self.user.id)
+        self.assertTrue(user.is_staff)
+        self.assertFalse(user.is_suspended)
+        self.assertEqual(user.credential_epoch, 0)
+        
+    def test_password_change_revokes_tokens(self):
+        """
+        Test case to ensure that tokens issued before
+        a password change are rejected.
+        """
+        
+        self.authenticate()
+        
+        self.user.set_password("another_strongpassword_2022")
+        bump_credential_epoch(self.user, update_fields=["password"])
+        epoch_table.refresh(force=True)
+        
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+            
+    def test_suspension_revokes_tokens(self):
+        """
+        Test case to ensure that tokens of suspended users are rejected.
+        """
+        
+        self.authenticate()
+        
+        self.user.is_suspended = True
+        self.user.save(update_fields=["is_suspended"])
+        epoch_table.refresh(force=True)
+        
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+    
+    def test_staff_change_revokes_tokens(self):
+        """
+        Test case to ensure that the tokens of a demoted
+        staff user are rejected.
+        """
+        
+        self.authenticate()
+        
+        self.user.is_staff = False
+        self.user.save(update_fields=["is_staff"])
+        epoch_table.refresh(force=True)
+        
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+    
+    def test_stale_user_bumps_the_epoch(self):
+        """
+        Test case to ensure that a bump from a stale instance
+        increments the epoch stored rather than its own.
+        """
+        
+        stale_user = AccountUser.objects.get(id=self.user.id)
+        
+        bump_credential_epoch(self.user, update_fields=["password"])
+        bump_credential_epoch(stale_user, update_fields=["password"])
+        
+        self.assertEqual(stale_user.credential_epoch, 2)
+        self.assertEqual(AccountUser.objects.get(id=self.user.id).credential_epoch, 2)
+        
+    def test_unknown_user_is_remembered(self):
+        """
+        Test case to ensure that the tokens of a deleted user
+        don't refresh the epoch table on every request.
+        """
+        
+        self.authenticate()
+        AccountUser.objects.filter(id=self.user.id).delete()
+        epoch_table.discard(self.user.id)
+        
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+            
+        with self.assertNumQueries(0):
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate()
+
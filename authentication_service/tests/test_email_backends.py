@@ -0,0 +1,110 @@
+# Python Imports
+import smtplib
+from unittest import mock
+
+# Django Imports
+from django.core.mail import EmailMessage, get_connection
+from django.test import SimpleTestCase
+
+# Own Imports
+from authentication_service.services.emails.backends import PooledSMTPEmailBackend
+
+
+class FakeSMTP:
+    """
+    In-memory stand-in for `smtplib.SMTP` that records
+    every connection and message.
+    """
+
+    instances = []
+
+    def __init__(self, host, port, **kwargs):
+        self.sent = []
+        self.disconnect_next = False
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self, **kwargs):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def noop(self):
+        return (250, b"OK")
+
+    def sendmail(self, from_email, recipients, message):
+        if self.disconnect_next:
+            self.disconnect_next = False
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(recipients)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class PooledSMTPEmailBackendTestCase(SimpleTestCase):
+    """
+    Test case for the pooled SMTP email backend
+    """
+
+    backend = "authentication_service.services.emails.backends.PooledSMTPEmailBackend"
+
+    def setUp(self) -> None:
+        FakeSMTP.instances = []
+        patcher = mock.patch("django.core.mail.backends.smtp.smtplib.SMTP", FakeSMTP)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(PooledSMTPEmailBackend.close_all)
+
+    def send(self, to):
+        connection = get_connection(self.backend, host="smtp.test", port=2525)
+        return EmailMessage("Subject", "Body", "noreply@admin.com", [to], connection=connection).send()
+
+    def test_connection_is_reused_between_messages(self):
+        """
+        Test case to ensure that messages sent through separate
+        backend instances share a single connection.
+        """
+
+        for i in range(3):
+            self.assertEqual(self.send(f"user{i}@email.com"), 1)
+
+        self.assertEqual(len(FakeSMTP.instances), 1)
+        self.assertEqual(len(FakeSMTP.instances[0].sent), 3)
+        self.assertFalse(FakeSMTP.instances[0].closed)
+
+    def test_batch_is_sent_over_one_connection(self):
+        """
+        Test case to ensure that `send_messages` sends a batch
+        over one connection and reports its throughput.
+        """
+
+        connection = get_connection(self.backend, host="smtp.test", port=2525)
+        messages = [
+            EmailMessage("Subject", "Body", "noreply@admin.com", [f"user{i}@email.com"])
+            for i in range(5)
+        ]
+
+        self.assertEqual(connection.send_messages(messages), 5)
+        self.assertEqual(len(FakeSMTP.instances), 1)
+
+        stats = PooledSMTPEmailBackend.connection_stats()
+        self.assertEqual(stats[0]["messages_sent"], 5)
+
+    def test_reconnects_when_server_drops_connection(self):
+        """
+        Test case to ensure that a dropped pooled connection
+        is replaced and the message is still sent.
+        """
+
+        self.send("user1@email.com")
+        FakeSMTP.instances[0].disconnect_next = True
+
+        self.assertEqual(self.send("user2@email.com"), 1)
+        self.assertEqual(len(FakeSMTP.instances), 2)
+        self.assertTrue(FakeSMTP.instances[0].closed)
+        self.assertEqual(FakeSMTP.instances[1].sent, [["user2@email.com"]])
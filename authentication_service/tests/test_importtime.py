@@ -0,0 +1,49 @@
+# Python Imports
+from io import StringIO
+
+# Django Imports
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+# Own Imports
+from authentication_service.services.instrumentation import importtime
+
+
+class ImportTimeTestCase(SimpleTestCase):
+    """
+    Test case for the modules imported by a worker before its first request
+    """
+
+    def test_parse_importtime(self):
+        records = importtime.parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     httpx._api\n"
+            "import time:       300 |        420 |   httpx\n"
+            "import time:        80 |        500 | authentication_service.views\n"
+        )
+
+        self.assertEqual(records[0], importtime.ImportRecord("httpx._api", 2, 120, 120))
+        self.assertEqual(records[2].depth, 0)
+        self.assertEqual(importtime.total_import_time(records), 500)
+        self.assertEqual(importtime.package_import_times(records), {"httpx": 420, "authentication_service": 80})
+
+    def test_rare_routes_are_imported_lazily(self):
+        """
+        Test case to ensure that a worker doesn't import the API docs
+        or the OAuth HTTP client before a request needs them.
+        """
+
+        modules = {record.module for record in importtime.measure_imports("wsgi")}
+
+        self.assertIn("authentication_service.views", modules)
+        self.assertNotIn("drf_yasg.views", modules)
+        self.assertNotIn("httpx", modules)
+
+    def test_budget(self):
+        stdout = StringIO()
+
+        with self.assertRaisesMessage(CommandError, "over the budget of 1.0 ms"):
+            call_command("import_time_report", top=3, budget=1, stdout=stdout)
+
+        self.assertIn("modules imported in", stdout.getvalue())
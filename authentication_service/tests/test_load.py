@@ -0,0 +1,37 @@
+# Django Imports
+from django.test import TestCase
+
+# Own Imports
+from benchmarks import endpoints
+
+
+class LoadHarnessTestCase(TestCase):
+    """
+    Test case for the endpoint load harness of `benchmarks.endpoints`
+    """
+
+    def test_every_scenario_succeeds(self):
+        """
+        Test case to ensure that the requests of every scenario get
+        their expected response, so the baselines measure real work.
+        """
+
+        for name in endpoints.SCENARIOS:
+            with self.subTest(endpoint=name):
+                result = endpoints.run_scenario(name, requests=4, concurrency=2, warmup=1)
+
+                self.assertEqual(result["errors"], 0)
+                self.assertGreater(result["throughput"], 0)
+                self.assertLessEqual(result["p50"], result["p99"])
+
+    def test_regressions(self):
+        baseline = {"login": {"p95": 0.1, "throughput": 100.0, "queries_per_request": 1.0}}
+
+        self.assertEqual(
+            endpoints.compare({"login": {"p95": 0.11, "throughput": 90.0, "queries_per_request": 1.0}}, baseline, 0.2),
+            [],
+        )
+        self.assertEqual(
+            len(endpoints.compare({"login": {"p95": 0.2, "throughput": 50.0, "queries_per_request": 2.0}}, baseline, 0.2)),
+            3,
+        )
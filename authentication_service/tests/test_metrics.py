@@ -0,0 +1,127 @@
+# Python Imports
+import multiprocessing
+import tempfile
+
+# Django Imports
+from django.test import TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service.models import AccountUser
+from authentication_service.services.instrumentation import metrics
+
+
+def count_logins(times: int) -> None:
+    for _ in range(times):
+        metrics.LOGINS.inc(outcome="failure")
+
+
+class MetricsTestCase(TestCase):
+    """
+    Test case for the Prometheus metrics served at /metrics
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(metrics.configure, directory=metrics.metrics_dir)
+        metrics.configure(directory=directory.name)
+
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+
+    def login(self, password: str):
+        return self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": password},
+        )
+
+    def test_login_metrics(self):
+        """
+        Test case to ensure that the requests, their latency, the
+        password hashing and the login outcomes are exposed.
+        """
+
+        self.assertEqual(self.login(self.password).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.login("not_the_password").status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.get(reverse("metrics"))
+        body = response.content.decode()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+
+        self.assertIn("# TYPE auth_http_request_duration_seconds histogram", body)
+        self.assertIn(
+            'auth_http_requests_total{method="POST",status="200",view="authentication_service:login"} 1.0', body
+        )
+        self.assertIn(
+            'auth_http_request_duration_seconds_count{method="POST",view="authentication_service:login"} 2.0', body
+        )
+        self.assertIn(
+            'auth_http_request_duration_seconds_bucket{method="POST",view="authentication_service:login",le="+Inf"} 2.0',
+            body,
+        )
+        self.assertIn('auth_logins_total{outcome="success"} 1.0', body)
+        self.assertIn('auth_logins_total{outcome="failure"} 1.0', body)
+        self.assertIn('auth_password_hashing_seconds_count{operation="verify"} 2.0', body)
+
+    def test_processes_are_summed(self):
+        """
+        Test case to ensure that a scrape sums the samples written by
+        every process, including the ones that have exited.
+        """
+
+        count_logins(3)
+
+        process = multiprocessing.get_context("fork").Process(target=count_logins, args=(4,))
+        process.start()
+        process.join()
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertIn('auth_logins_total{outcome="failure"} 7.0', metrics.render_metrics())
+
+    def test_file_grows(self):
+        """
+        Test case to ensure that the file of a process is remapped
+        when its samples outgrow it, and read back whole.
+        """
+
+        for index in range(2000):
+            metrics.HTTP_REQUESTS.inc(view=f"view-{index}", method="GET", status=200)
+
+        self.assertGreater(metrics.get_metrics_file().capacity, metrics.INITIAL_FILE_SIZE)
+        self.assertEqual(
+            sum(value for (name, _), value in metrics.collect().items() if name == "auth_http_requests_total"),
+            2000,
+        )
+
+    def test_access_is_restricted(self):
+        """
+        Test case to ensure that only the allowed networks and
+        the holders of the token can read the metrics.
+        """
+
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR="203.0.113.7").status_code, status.HTTP_403_FORBIDDEN)
+
+        restricted = {"metrics_allowed_ips": ["203.0.113.0/24"], "metrics_token": "s3cret"}
+
+        with self.settings(AUTHENTICATION_SERVICE=restricted):
+            self.assertEqual(self.client.get(url, REMOTE_ADDR="203.0.113.7").status_code, status.HTTP_200_OK)
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer s3cret")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer wrong")
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
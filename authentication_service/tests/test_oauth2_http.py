@@ -0,0 +1,93 @@
+# Python Imports
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Django Imports
+from django.test import SimpleTestCase
+
+# Own Imports
+from authentication_service.services.oauth2 import http
+from authentication_service.services.oauth2.google import GoogleCertsKeySource
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves an empty key set and records the client port of every request"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        
+        body = json.dumps({"keys": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=19800, must-revalidate")
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, *args):
+        pass
+
+
+class OAuth2HTTPClientTestCase(SimpleTestCase):
+    """
+    Test case for the pooled client of the OAuth providers
+    """
+    
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.client_ports = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(http.configure, host_limits=http.oauth_http_host_limits)
+        http.close_client()
+        
+        self.url = f"http://127.0.0.1:{self.server.server_port}/oauth2/v3/certs"
+    
+    def test_connections_are_reused(self):
+        """
+        Test case to ensure that consecutive calls
+        share one kept alive connection.
+        """
+        
+        client = http.get_client()
+        
+        for _ in range(5):
+            self.assertEqual(client.get(self.url).status_code, 200)
+            
+        self.assertIs(http.get_client(), client)
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+        
+        http.close_client()
+        http.get_client().get(self.url)
+        self.assertEqual(len(set(self.server.client_ports)), 2)
+        
+    def test_per_host_limits(self):
+        """
+        Test case to ensure that a host with a limit of its own
+        is served from its own pool.
+        """
+        
+        http.configure(host_limits={"127.0.0.1": 1})
+        client = http.get_client()
+        
+        transport = client._transport_for_url(client.build_request("GET", self.url).url)
+        self.assertEqual(transport._pool._max_connections, 1)
+        self.assertEqual(client.get(self.url).status_code, 200)
+        
+    def test_google_keys_fetched_with_pooled_client(self):
+        """
+        Test case to ensure that Google's keys are cached for
+        the max-age of their Cache-Control.
+        """
+        
+        key_source = GoogleCertsKeySource()
+        key_source.url = self.url
+        
+        self.assertEqual(key_source.fetch(), ({"keys": []}, 19800.0))
+        key_source.fetch()
+        self.assertEqual(len(set(self.server.client_ports)), 1)
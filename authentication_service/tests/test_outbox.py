@@ -0,0 +1,97 @@
+# Python Imports
+from unittest import mock
+
+# Django Imports
+from django.core import mail
+from django.core.management import call_command
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+# Own Imports
+from authentication_service.models import EmailOutbox
+from authentication_service.services.emails.outbox import deliver_outbox, queue_email
+
+
+# initialize api client
+client = APIClient()
+
+
+class EmailOutboxTestCase(APITestCase):
+    """
+    Test case for the email outbox and its worker
+    """
+
+    def setUp(self) -> None:
+        self.valid_payload = {
+            "firstname": "Victory",
+            "lastname": "Abraham",
+            "username": "abram",
+            "email": "abraham@email.com",
+            "password": "someawfully_strongpassword_2022"
+        }
+
+    def test_register_queues_email(self):
+        """
+        Test case to ensure that registering a user
+        queues the verify email instead of sending it.
+        """
+
+        url = reverse("authentication_service:register")
+        response = client.post(url, data=self.valid_payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.to_email, "abraham@email.com")
+        self.assertEqual(email.status, EmailOutbox.PENDING)
+
+    def test_worker_delivers_queued_emails(self):
+        """
+        Test case to ensure that the worker delivers
+        the queued emails and marks them as sent.
+        """
+
+        url = reverse("authentication_service:register")
+        client.post(url, data=self.valid_payload, format="json")
+
+        call_command("process_email_outbox", once=True, stdout=mock.MagicMock())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["abraham@email.com"])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        self.assertIn("/api/v1/verify_email/", mail.outbox[0].body)
+        self.assertNotIn("<", mail.outbox[0].body)
+        self.assertEqual(EmailOutbox.objects.get().status, EmailOutbox.SENT)
+
+    def test_failed_email_is_retried_with_backoff(self):
+        """
+        Test case to ensure that a failed email is rescheduled
+        and marked as failed after the last attempt.
+        """
+
+        email = queue_email(subject="Subject", to_email="abraham@email.com", text_content="Body")
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("relay down")
+        ):
+            self.assertEqual(deliver_outbox(max_attempts=2), (0, 1))
+
+            email.refresh_from_db()
+            self.assertEqual(email.status, EmailOutbox.PENDING)
+            self.assertEqual(email.attempts, 1)
+            self.assertGreater(email.next_attempt_at, email.date_created)
+
+            # the email is not due until the backoff has passed
+            self.assertEqual(deliver_outbox(max_attempts=2), (0, 0))
+
+            EmailOutbox.objects.update(next_attempt_at=email.date_created)
+            self.assertEqual(deliver_outbox(max_attempts=2), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, EmailOutbox.FAILED)
+        self.assertIn("relay down", email.last_error)
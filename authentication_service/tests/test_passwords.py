@@ -0,0 +1,179 @@
+# Python Imports
+import asyncio
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+# Django Imports
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.contrib.auth.hashers import check_password as django_check_password
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+# Own Imports
+from authentication_service.hashers import (
+    CalibratedPBKDF2PasswordHasher,
+    clear_calibration,
+    get_preferred_hasher
+)
+from authentication_service.management.commands import calibrate_hashers
+from authentication_service.models import AccountUser
+from authentication_service.services.passwords import hashing
+
+
+class PasswordHashingTestCase(SimpleTestCase):
+    """
+    Test case for the password hashing process pool
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        self.workers = hashing.password_hashing_workers
+        self.addCleanup(hashing.configure, workers=self.workers)
+
+    def test_hash_and_verify_in_process_pool(self):
+        """
+        Test case to ensure that passwords hashed in the pool
+        are compatible with Django's hashers.
+        """
+
+        hashing.configure(workers=2)
+        encoded = hashing.hash_password(self.password)
+
+        self.assertTrue(django_check_password(self.password, encoded))
+        self.assertEqual(hashing.verify_password(self.password, encoded), (True, False))
+        self.assertEqual(hashing.verify_password("wrong-password", encoded), (False, False))
+
+    def test_synchronous_fallback(self):
+        """
+        Test case to ensure that hashing runs in the calling
+        thread when the pool is disabled.
+        """
+
+        hashing.configure(workers=0)
+        self.assertIsNone(hashing.get_executor())
+
+        user = AccountUser()
+        user.set_password(self.password)
+        self.assertTrue(user.check_password(self.password))
+        self.assertFalse(user.check_password(None))
+
+    def test_async_hash_and_verify(self):
+        """
+        Test case to ensure that async callers can await the pool.
+        """
+
+        hashing.configure(workers=1)
+
+        async def hash_and_verify():
+            encoded = await hashing.ahash_password(self.password)
+            return await hashing.averify_password(self.password, encoded)
+
+        self.assertEqual(asyncio.run(hash_and_verify()), (True, False))
+
+
+class CalibratedHashersTestCase(TestCase):
+    """
+    Test case for the hasher calibration and the rehash on login
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        self.workers = hashing.password_hashing_workers
+        hashing.configure(workers=0)
+        self.addCleanup(hashing.configure, workers=self.workers)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.calibration_file = Path(directory.name) / "hasher-calibration.json"
+
+        settings_override = self.settings(AUTHENTICATION_SERVICE={
+            **settings.AUTHENTICATION_SERVICE,
+            "password_hasher_calibration": self.calibration_file,
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def write_calibration(self, iterations: int) -> None:
+        self.calibration_file.write_text(json.dumps({
+            "preferred": "pbkdf2_sha256",
+            "hashers": {"pbkdf2_sha256": {"params": {"iterations": iterations}}},
+        }))
+        clear_calibration()
+
+    def test_calibrate_hashers_command(self):
+        """
+        Test case to ensure that the command writes
+        the parameters of the calibrated hashers.
+        """
+
+        call_command(
+            "calibrate_hashers", target_ms=5, samples=1,
+            algorithms=["pbkdf2_sha256"], stdout=StringIO()
+        )
+        calibration = json.loads(self.calibration_file.read_text())
+
+        self.assertEqual(calibration["preferred"], "pbkdf2_sha256")
+        self.assertGreaterEqual(calibration["hashers"]["pbkdf2_sha256"]["params"]["iterations"], 390_000)
+        self.assertEqual(get_preferred_hasher().iterations, calibration["hashers"]["pbkdf2_sha256"]["params"]["iterations"])
+
+    def test_weaker_calibration_is_not_written(self):
+        """
+        Test case to ensure that the command refuses to write
+        parameters below Django's.
+        """
+
+        calibrators = {
+            "pbkdf2_sha256": (lambda target_ms, samples: {"iterations": 1000}, CalibratedPBKDF2PasswordHasher),
+        }
+
+        with mock.patch.dict(calibrate_hashers.CALIBRATORS, calibrators):
+            with self.assertRaises(CommandError):
+                call_command(
+                    "calibrate_hashers", target_ms=5, samples=1,
+                    algorithms=["pbkdf2_sha256"], stdout=StringIO()
+                )
+
+        self.assertFalse(self.calibration_file.exists())
+
+    def test_login_upgrades_password_hash(self):
+        """
+        Test case to ensure that logging in rehashes the
+        stored password with the calibrated parameters.
+        """
+
+        self.write_calibration(iterations=390_000)
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$390000$"))
+
+        self.write_calibration(iterations=400_000)
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+        )
+
+        user.refresh_from_db()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$400000$"))
+        self.assertTrue(user.check_password(self.password))
+
+    def test_weaker_calibration_is_ignored(self):
+        """
+        Test case to ensure that a calibration below Django's parameters
+        is ignored, rather than downgrading the stored hashes on login.
+        """
+
+        self.write_calibration(iterations=1000)
+
+        with self.assertLogs("authentication_service.hashers", level="WARNING"):
+            self.assertEqual(get_preferred_hasher().iterations, PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,127 @@
+# Python Imports
+import pstats
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+# Django Imports
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service.models import AccountUser
+from authentication_service.services.instrumentation import profiling
+
+
+class ProfilingTestCase(TestCase):
+    """
+    Test case for the profiling of the API requests
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        self.addCleanup(
+            profiling.configure,
+            sample_rate=profiling.profiling_sample_rate,
+            mode=profiling.profiling_mode,
+            directory=profiling.profiling_dir,
+            max_files=profiling.profiling_max_files,
+        )
+        profiling.configure(sample_rate=0.0, mode="sampling", directory=directory.name)
+
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+
+    def login(self, **headers):
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+            **headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    async def alogin(self, **headers):
+        response = await self.async_client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_signed_header(self):
+        """
+        Test case to ensure that only the requests with a valid signed
+        header are profiled when no request is sampled.
+        """
+
+        self.login()
+        self.login(HTTP_X_PROFILE_REQUEST="not-signed")
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+        self.login(HTTP_X_PROFILE_REQUEST=profiling.make_profiling_token())
+
+        [path] = self.directory.iterdir()
+        self.assertTrue(path.name.endswith("-authentication_service.login.collapsed"))
+        self.assertIn("validate (authentication_service/serializers.py:", path.read_text())
+
+    def test_cprofile(self):
+        profiling.configure(sample_rate=1.0, mode="cprofile")
+        self.login()
+
+        [path] = self.directory.iterdir()
+        self.assertEqual(path.suffix, ".pstats")
+
+    async def test_async_request(self):
+        """
+        Test case to ensure that an asynchronous request is sampled in the
+        threads running its sync work, rather than on the event loop.
+        """
+
+        await self.alogin(**{profiling.PROFILING_HEADER: profiling.make_profiling_token()})
+
+        [path] = self.directory.iterdir()
+        self.assertIn("validate (authentication_service/serializers.py:", path.read_text())
+
+    async def test_async_request_cprofile(self):
+        profiling.configure(sample_rate=1.0, mode="cprofile")
+        await self.alogin()
+
+        [path] = self.directory.iterdir()
+        functions = pstats.Stats(str(path)).stats
+
+        self.assertTrue(any(
+            filename.endswith("serializers.py") and name == "validate" for filename, _, name in functions
+        ))
+
+    def test_rotation_and_merge(self):
+        """
+        Test case to ensure that the oldest profiles are deleted, and
+        that the command sums the stacks of the profiles left.
+        """
+
+        profiling.configure(max_files=2)
+
+        for name in ("20221001T000000-a", "20221002T000000-b", "20221003T000000-c"):
+            (self.directory / f"{name}-authentication_service.login.collapsed").write_text("main;login 2\nmain 1\n")
+        profiling.rotate_profiles(self.directory)
+
+        self.assertEqual(len(list(self.directory.iterdir())), 2)
+        self.assertFalse((self.directory / "20221001T000000-a-authentication_service.login.collapsed").exists())
+
+        output = self.directory / "merged.txt"
+        call_command("merge_profiles", dir=str(self.directory), view="login", output=str(output), stdout=StringIO())
+
+        self.assertEqual(output.read_text(), "main 2\nmain;login 4\n")
@@ -0,0 +1,290 @@
+# Python Imports
+from datetime import timedelta
+from typing import Callable, List
+
+# Django Imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Simple JWT Imports
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Own Imports
+from authentication_service.models import AccountUser
+from authentication_service.serializers import UserChangePasswordSerializer, UserEmailSerializer
+from authentication_service.services.generators.uid import generate_uid_token
+from authentication_service.services.users.identity import get_user, user_identity_scope
+from authentication_service.utils import get_active_user, get_inactive_user
+
+
+class QueryPlanTestCase(TestCase):
+    """
+    Runs the queries of the codebase under EXPLAIN and fails
+    when they scan the whole users table.
+    """
+
+    def setUp(self) -> None:
+        if connection.vendor not in ("sqlite", "postgresql"):
+            self.skipTest(f"No query plan checks for {connection.vendor}.")
+
+        self.active_user = AccountUser.objects.create(
+            firstname="Abraham", lastname="Israel", username="IsraelAbraham",
+            email="IsraelAbraham@Email.com", is_active=True
+        )
+        self.inactive_user = AccountUser.objects.create(
+            firstname="Dan", lastname="Odin", username="danodin", email="dpoxo@email.com"
+        )
+
+    def capture_queries(self, func: Callable, table: str = "users") -> List[str]:
+        """The SELECT statements on `table` run by `func`"""
+
+        with CaptureQueriesContext(connection) as queries:
+            func()
+
+        return [
+            query["sql"] for query in queries
+            if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+        ]
+
+    def explain(self, sql: str) -> str:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # Tiny test tables are always cheaper to scan
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+            else:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+    def assertIndexScan(self, sql: str, table: str = "users") -> None:
+        plan = self.explain(sql)
+
+        if connection.vendor == "postgresql":
+            self.assertNotIn(f"Seq Scan on {table}", plan, msg=f"{sql}\n{plan}")
+            return
+
+        for line in plan.splitlines():
+            if line.startswith(f"SCAN {table}"):
+                self.assertIn("USING", line, msg=f"{sql}\n{plan}")
+
+    def assertQueriesUseIndex(self, func: Callable, table: str = "users") -> None:
+        queries = self.capture_queries(func, table)
+        self.assertTrue(queries, msg=f"{func} did not query {table}")
+
+        for sql in queries:
+            self.assertIndexScan(sql, table)
+
+
+class EmailLookupTestCase(QueryPlanTestCase):
+    """
+    Test case to ensure that email lookups are indexed equalities
+    """
+
+    def test_emails_are_canonicalized(self):
+        """
+        Test case to ensure that emails are stored in lower case.
+        """
+
+        self.active_user.refresh_from_db()
+        self.assertEqual(self.active_user.email, "israelabraham@email.com")
+        self.assertEqual(self.active_user.username, "IsraelAbraham")
+        self.assertEqual(get_active_user(request=None, email=" ISRAELABRAHAM@email.com"), self.active_user)
+
+    def test_login_with_any_email_case(self):
+        """
+        Test case to ensure that users can log in with
+        their email in any case.
+        """
+
+        self.active_user.set_password("someawfully_strongpassword_2022")
+        self.active_user.save()
+
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "IsraelAbraham@EMAIL.com", "password": "someawfully_strongpassword_2022"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], "Login successful")
+
+    def test_email_lookups_use_index(self):
+        """
+        Test case to ensure that every email lookup
+        runs as an index search.
+        """
+
+        lookups = [
+            lambda: get_active_user(request=None, email="IsraelAbraham@email.com"),
+            lambda: get_inactive_user(request=None, email="DPOXO@email.com"),
+            lambda: AccountUser.objects.get_by_natural_key("IsraelAbraham@email.com"),
+            lambda: UserEmailSerializer(data={"email": "DPOXO@email.com"}).is_valid(),
+            lambda: UserChangePasswordSerializer(data={
+                "email": "IsraelAbraham@email.com",
+                "current_password": "current",
+                "new_password": "new",
+                "repeat_new_password": "new",
+            }).is_valid(),
+        ]
+
+        for lookup in lookups:
+            self.assertQueriesUseIndex(lookup)
+
+
+class EndpointQueryTestCase(QueryPlanTestCase):
+    """
+    Base test case with a staff user logged in to the endpoints
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.active_user.is_staff = True
+        self.active_user.set_password(self.password)
+        self.active_user.save()
+
+        self.uid, self.token = generate_uid_token(request=None, user=self.inactive_user)
+        self.bearer_token = {
+            "HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.active_user).access_token}"
+        }
+
+
+class HotQueryPlanTestCase(EndpointQueryTestCase):
+    """
+    Test case to ensure that the users queries run by every
+    endpoint, and the reporting queries, never scan the table
+    """
+
+    def test_endpoint_queries_use_index(self):
+        """
+        Test case to ensure that the endpoints only
+        run index searches on the users table.
+        """
+
+        requests = [
+            lambda: self.client.post(
+                reverse("authentication_service:login"),
+                data={"email": "israelabraham@email.com", "password": self.password},
+            ),
+            lambda: self.client.post(
+                reverse("authentication_service:request_email_token"),
+                data={"email": "dpoxo@email.com"},
+            ),
+            lambda: self.client.get(
+                reverse("authentication_service:reset_uidb64_token", args=[self.uid, self.token])
+            ),
+            lambda: self.client.post(
+                reverse("authentication_service:reset_password"),
+                data={"email": "israelabraham@email.com"},
+            ),
+            lambda: self.client.put(
+                reverse("authentication_service:change_password"),
+                data={
+                    "email": "israelabraham@email.com",
+                    "current_password": self.password,
+                    "new_password": self.password,
+                    "repeat_new_password": self.password,
+                },
+                content_type="application/json",
+                **self.bearer_token,
+            ),
+            lambda: self.client.put(
+                reverse("authentication_service:suspend_user", args=["dpoxo@email.com"]),
+                **self.bearer_token,
+            ),
+            lambda: self.client.post(
+                reverse("authentication_service:verify_uidb64_token", args=[self.uid, self.token])
+            ),
+        ]
+
+        for request in requests:
+            self.assertQueriesUseIndex(request)
+
+    def test_reporting_queries_use_index(self):
+        """
+        Test case to ensure that suspended users, signups over
+        a period and recently modified users are read through an index.
+        """
+
+        since = timezone.now() - timedelta(days=7)
+
+        lookups = [
+            lambda: list(AccountUser.objects.filter(is_suspended=True, email="dpoxo@email.com")),
+            lambda: list(AccountUser.objects.filter(date_created__gte=since).values_list("id", flat=True)),
+            lambda: AccountUser.objects.filter(date_created__range=(since, timezone.now())).count(),
+            lambda: list(AccountUser.objects.filter(date_modified__gte=since).values_list("id", "credential_epoch")),
+        ]
+
+        for lookup in lookups:
+            self.assertQueriesUseIndex(lookup)
+
+
+class IdentityMapTestCase(EndpointQueryTestCase):
+    """
+    Test case to ensure that every endpoint loads
+    a user from the database at most once
+    """
+    
+    def assertUserQueries(self, num: int, func: Callable) -> None:
+        queries = self.capture_queries(func)
+        self.assertEqual(len(queries), num, msg="\n".join(queries))
+    
+    def test_endpoints_load_user_once(self):
+        """
+        Test case to ensure that the serializers, utils, authentication
+        and views share the users loaded during a request.
+        """
+        
+        self.assertUserQueries(1, lambda: self.client.post(
+            reverse("authentication_service:reset_password"),
+            data={"email": "IsraelAbraham@email.com"},
+        ))
+        self.assertUserQueries(1, lambda: self.client.post(
+            reverse("authentication_service:request_email_token"),
+            data={"email": "dpoxo@email.com"},
+        ))
+        self.assertUserQueries(1, lambda: self.client.put(
+            reverse("authentication_service:change_password"),
+            data={
+                "email": "israelabraham@email.com",
+                "current_password": self.password,
+                "new_password": self.password,
+                "repeat_new_password": self.password,
+            },
+            content_type="application/json",
+            **self.bearer_token,
+        ))
+        self.assertUserQueries(1, lambda: self.client.post(
+            reverse("authentication_service:verify_uidb64_token", args=[self.uid, self.token])
+        ))
+    
+    def test_identity_scope(self):
+        """
+        Test case to ensure that users are shared inside a scope,
+        refreshed by saves and only cached for the scope.
+        """
+        
+        with user_identity_scope():
+            user = get_user(email="ISRAELABRAHAM@email.com")
+            
+            with self.assertNumQueries(0):
+                self.assertIs(get_user(uuid=str(user.uuid)), user)
+                self.assertIs(get_user(id=user.id), user)
+                
+            self.assertIsNone(get_user(email="nobody@email.com"))
+            new_user = AccountUser.objects.create(username="nobody", email="nobody@email.com")
+            
+            with self.assertNumQueries(0):
+                self.assertIs(get_user(email="nobody@email.com"), new_user)
+                
+            new_user.delete()
+            self.assertIsNone(get_user(email="nobody@email.com"))
+            
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user(id=user.id), user)
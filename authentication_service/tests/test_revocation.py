@@ -0,0 +1,119 @@
+# Python Imports
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+# Django Imports
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service.models import AccountUser, RevokedToken
+from authentication_service.services.tokens import revocation
+from authentication_service.services.tokens.bloom import BloomFilter
+
+
+class BloomFilterTestCase(SimpleTestCase):
+    """
+    Test case for the Bloom filter of the revoked tokens
+    """
+    
+    def test_no_false_negatives(self):
+        """
+        Test case to ensure that every added item is found,
+        and that the false positive rate stays near the target.
+        """
+        
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        items = [uuid.uuid4().hex for _ in range(1000)]
+        
+        for item in items:
+            bloom.add(item)
+        
+        self.assertTrue(all(item in bloom for item in items))
+        
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10_000))
+        self.assertLess(false_positives / 10_000, 0.03)
+
+
+class TokenRevocationTestCase(TestCase):
+    """
+    Test case for the revocation of tokens on logout
+    """
+    
+    password = "someawfully_strongpassword_2022"
+    
+    def setUp(self) -> None:
+        revocation.revocation_filter.clear()
+        revocation.reset_revocation_stats()
+        self.addCleanup(revocation.revocation_filter.clear)
+        
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+        
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+        )
+        self.access = response.data["data"]["access"]
+        self.refresh = response.data["data"]["refresh"]
+        
+    def logout(self):
+        return self.client.post(
+            reverse("authentication_service:logout"),
+            data={"refresh": self.refresh},
+            HTTP_AUTHORIZATION=f"Bearer {self.access}",
+        )
+    
+    def test_logout_revokes_tokens(self):
+        """
+        Test case to ensure that the access and refresh
+        tokens are rejected after logging out.
+        """
+        
+        self.assertEqual(self.logout().status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(RevokedToken.objects.count(), 2)
+        
+        self.assertEqual(self.logout().status_code, status.HTTP_401_UNAUTHORIZED)
+        
+        response = self.client.post(
+            reverse("authentication_service:login_refresh"), data={"refresh": self.refresh}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_valid_tokens_checked_in_memory(self):
+        """
+        Test case to ensure that tokens that were never revoked
+        are accepted without querying the revoked tokens.
+        """
+        
+        revocation.revocation_filter.refresh()
+        
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation.is_token_revoked(uuid.uuid4().hex))
+        
+        self.assertEqual(revocation.revocation_stats()["negatives"], 1)
+        
+    def test_purge_expired_tokens(self):
+        """
+        Test case to ensure that only the expired tokens are purged.
+        """
+        
+        now = timezone.now()
+        RevokedToken.objects.bulk_create([
+            RevokedToken(jti=uuid.uuid4().hex, token_type="access", expires_at=now - timedelta(minutes=i))
+            for i in range(1, 6)
+        ])
+        RevokedToken.objects.create(jti="unexpired", token_type="refresh", expires_at=now + timedelta(days=1))
+        
+        call_command("purge_revoked_tokens", batch_size=2, stdout=StringIO())
+        
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["unexpired"])
@@ -0,0 +1,113 @@
+# Django Imports
+from django.db import connections, transaction
+from django.test import TransactionTestCase
+
+# Own Imports
+from authentication_service import routers
+from authentication_service.models import AccountUser
+from authentication_service.services.users.epochs import bump_credential_epoch
+
+
+class PrimaryReplicaRouterTestCase(TransactionTestCase):
+    """
+    Test case for the routing of the reads to a replica, here a
+    second SQLite database with a snapshot of the primary
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # Unknown to the test runner, which would create a test database for it
+        connections.settings["replica"] = {**connections["default"].settings_dict, "NAME": ":memory:"}
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        self.user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        self.snapshot_primary()
+
+        # Written after the snapshot, the replica lags behind
+        self.new_user = AccountUser.objects.create(
+            username="johndoe", email="johndoe@email.com", is_active=True
+        )
+
+        routers.configure(replicas=["replica"])
+        self.addCleanup(routers.configure, replicas=[])
+
+    def snapshot_primary(self) -> None:
+        for alias in ("default", "replica"):
+            connections[alias].ensure_connection()
+        connections["default"].connection.backup(connections["replica"].connection)
+
+    def new_user_is_found(self) -> bool:
+        return AccountUser.objects.filter(email=self.new_user.email).exists()
+
+    def test_reads_go_to_the_replica(self):
+        """
+        Test case to ensure that reads go to the replica, and that
+        `use_primary()` sends them to the primary.
+        """
+
+        self.assertFalse(self.new_user_is_found())
+        self.assertEqual(AccountUser.objects.get(email=self.user.email)._state.db, "replica")
+
+        with routers.use_primary():
+            self.assertTrue(self.new_user_is_found())
+
+    def test_reads_after_a_write_go_to_the_primary(self):
+        """
+        Test case to ensure that once a request wrote,
+        its later reads see its writes.
+        """
+
+        with routers.database_scope():
+            self.assertFalse(self.new_user_is_found())
+
+            AccountUser.objects.filter(id=self.user.id).update(username="israel")
+            self.assertTrue(self.new_user_is_found())
+
+        # The next request reads from the replica again
+        with routers.database_scope():
+            self.assertFalse(self.new_user_is_found())
+
+    def test_transactions_read_from_the_primary(self):
+        """
+        Test case to ensure that reads inside `transaction.atomic` go to the primary.
+        """
+
+        with transaction.atomic():
+            self.assertTrue(self.new_user_is_found())
+
+    def test_epoch_bump_of_a_replica_user(self):
+        """
+        Test case to ensure that bumping the epoch of a user read from a
+        lagging replica doesn't write back the epoch of older tokens.
+        """
+
+        AccountUser.objects.filter(id=self.user.id).update(credential_epoch=3)
+
+        user = AccountUser.objects.get(id=self.user.id)
+        self.assertEqual(user.credential_epoch, 0)
+
+        bump_credential_epoch(user)
+
+        self.assertEqual(user.credential_epoch, 4)
+        self.assertEqual(AccountUser.objects.using("default").get(id=self.user.id).credential_epoch, 4)
+
+    def test_replicas_are_not_migrated(self):
+        """
+        Test case to ensure that migrations skip the replicas.
+        """
+
+        router = routers.PrimaryReplicaRouter()
+
+        self.assertFalse(router.allow_migrate("replica", "authentication_service"))
+        self.assertIsNone(router.allow_migrate("default", "authentication_service"))
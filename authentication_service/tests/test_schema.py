@@ -0,0 +1,77 @@
+# Python Imports
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+# Django Imports
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service import schema
+
+
+class CachedSchemaTestCase(TestCase):
+    """
+    Test case for the OpenAPI schema served by the documentation routes
+    """
+
+    def setUp(self) -> None:
+        schema.clear_schema_cache()
+        self.addCleanup(schema.clear_schema_cache)
+
+    def test_schema_is_generated_once(self):
+        """
+        Test case to ensure that the schema is only generated on the
+        first request, and that clients with a current copy get a 304.
+        """
+
+        url = reverse("schema-json", kwargs={"format": ".json"})
+
+        with mock.patch.object(schema, "generate_schema", wraps=schema.generate_schema) as generate:
+            response = self.client.get(url)
+            self.client.get(url)
+            self.client.get(reverse("api_docs_swagger"), {"format": "openapi"})
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("/login/", json.loads(response.content)["paths"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.assertEqual(self.client.get(reverse("api_docs_swagger")).status_code, status.HTTP_200_OK)
+
+    def test_schema_from_disk(self):
+        """
+        Test case to ensure that a schema written by `generate_api_schema`
+        is served without generating it again.
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "schema.json"
+            call_command("generate_api_schema", output=str(path), stdout=StringIO(), stderr=StringIO())
+
+            with override_settings(AUTHENTICATION_SERVICE={"api_schema_path": str(path)}):
+                with mock.patch.object(schema, "generate_schema") as generate:
+                    response = self.client.get(reverse("schema-json", kwargs={"format": ".json"}))
+
+            self.assertFalse(generate.called)
+            self.assertEqual(response.content.decode(), json.loads(path.read_text())["documents"][".json"])
+
+            # A schema of another URLconf is generated again
+            saved = json.loads(path.read_text())
+            path.write_text(json.dumps({**saved, "fingerprint": "0" * 16}))
+            schema.clear_schema_cache()
+
+            with override_settings(AUTHENTICATION_SERVICE={"api_schema_path": str(path)}):
+                with mock.patch.object(schema, "generate_schema", wraps=schema.generate_schema) as generate:
+                    self.client.get(reverse("schema-json", kwargs={"format": ".json"}))
+
+            self.assertTrue(generate.called)
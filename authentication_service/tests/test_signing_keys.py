@@ -0,0 +1,134 @@
+# Python Imports
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+# Django Imports
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# JWT Imports
+import jwt
+
+# Cryptography Imports
+from cryptography.hazmat.primitives import serialization
+
+# Own Imports
+from authentication_service.models import AccountUser
+
+
+class SigningKeysTestCase(TestCase):
+    """
+    Test case for the asymmetric signing keys and the JWKS endpoint
+    """
+    
+    password = "someawfully_strongpassword_2022"
+    
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        
+        self.old_key = self.generate_key("old", "RS256")
+        self.new_key = self.generate_key("new", "EdDSA")
+        
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+        
+    def generate_key(self, kid: str, algorithm: str) -> dict:
+        call_command(
+            "generate_signing_key", kid=kid, algorithm=algorithm,
+            output_dir=self.directory, stdout=StringIO()
+        )
+        return {"kid": kid, "algorithm": algorithm, "private_key_path": self.directory / f"{kid}.pem"}
+    
+    def use_keys(self, *keys) -> None:
+        settings_override = self.settings(AUTHENTICATION_SERVICE={
+            **settings.AUTHENTICATION_SERVICE, "jwt_signing_keys": list(keys),
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+    def retire(self, key: dict) -> dict:
+        """The public half of the key, as kept after a rotation"""
+        
+        private_key = serialization.load_pem_private_key(key["private_key_path"].read_bytes(), password=None)
+        public_key_path = self.directory / f"{key['kid']}.pub.pem"
+        public_key_path.write_bytes(private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        ))
+        return {"kid": key["kid"], "algorithm": key["algorithm"], "public_key_path": public_key_path}
+    
+    def login(self) -> str:
+        response = self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+        )
+        return response.data["data"]["access"]
+    
+    def logout(self, access: str):
+        return self.client.post(reverse("authentication_service:logout"), HTTP_AUTHORIZATION=f"Bearer {access}")
+    
+    def test_tokens_signed_with_active_key(self):
+        """
+        Test case to ensure that tokens carry the kid of the active key,
+        and can be verified with the published JWKS.
+        """
+        
+        self.use_keys(self.old_key)
+        access = self.login()
+        
+        self.assertEqual(jwt.get_unverified_header(access), {"alg": "RS256", "kid": "old", "typ": "JWT"})
+        
+        jwks = self.client.get(reverse("jwks")).json()
+        public_key = jwt.PyJWK(jwks["keys"][0]).key
+        self.assertEqual(jwt.decode(access, public_key, algorithms=["RS256"])["token_type"], "access")
+        
+        self.assertEqual(self.logout(access).status_code, status.HTTP_204_NO_CONTENT)
+        
+    def test_key_rotation(self):
+        """
+        Test case to ensure that tokens signed by a retired key are
+        accepted, and tokens signed by an unknown key are rejected.
+        """
+        
+        self.use_keys(self.old_key)
+        old_access = self.login()
+        
+        self.use_keys(self.new_key, self.retire(self.old_key))
+        new_access = self.login()
+        
+        self.assertEqual(jwt.get_unverified_header(new_access)["kid"], "new")
+        self.assertEqual(self.logout(old_access).status_code, status.HTTP_204_NO_CONTENT)
+        
+        self.use_keys(self.new_key)
+        self.assertEqual(self.logout(self.login()).status_code, status.HTTP_204_NO_CONTENT)
+        
+        forged = jwt.encode({"user_id": 1}, "secret", algorithm="HS256", headers={"kid": "unknown"})
+        self.assertEqual(self.logout(forged).status_code, status.HTTP_401_UNAUTHORIZED)
+        
+    def test_jwks_cache_headers(self):
+        """
+        Test case to ensure that the JWKS is cacheable
+        and revalidated with its ETag.
+        """
+        
+        self.use_keys(self.new_key, self.retire(self.old_key))
+        response = self.client.get(reverse("jwks"))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([key["kid"] for key in response.json()["keys"]], ["new", "old"])
+        self.assertIn("max-age=3600", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+        
+        response = self.client.get(reverse("jwks"), HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,148 @@
+# Python Imports
+from unittest import mock
+
+# Django Imports
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service.serializers import UserLoginObtainPairSerializer
+from authentication_service.services.throttling import buckets
+
+
+class LocalBucketBackendTestCase(SimpleTestCase):
+    """
+    Test case for the in-process token buckets
+    """
+
+    def test_bucket_refills(self):
+        """
+        Test case to ensure that a bucket rejects requests once empty,
+        and accepts them again as it refills.
+        """
+
+        backend = buckets.LocalBucketBackend(shards=4, maxsize=100)
+
+        with mock.patch("time.monotonic", return_value=1000.0):
+            self.assertEqual([backend.consume("key", 3, 1.0) for _ in range(3)], [0.0, 0.0, 0.0])
+            self.assertAlmostEqual(backend.consume("key", 3, 1.0), 1.0)
+
+            # Other keys have buckets of their own
+            self.assertEqual(backend.consume("other", 3, 1.0), 0.0)
+
+        with mock.patch("time.monotonic", return_value=1001.0):
+            self.assertEqual(backend.consume("key", 3, 1.0), 0.0)
+            self.assertGreater(backend.consume("key", 3, 1.0), 0.0)
+
+    def test_least_recently_used_buckets_are_dropped(self):
+        backend = buckets.LocalBucketBackend(shards=1, maxsize=2)
+
+        for key in ("a", "b", "c"):
+            backend.consume(key, 1, 1.0)
+
+        self.assertEqual(list(backend.shards[0].buckets), ["b", "c"])
+
+
+class CacheBucketBackendTestCase(SimpleTestCase):
+    """
+    Test case for the token buckets shared through the cache
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_rejected_keys_skip_the_cache(self):
+        """
+        Test case to ensure that a key over its rate is rejected, and
+        then turned away locally until it may retry.
+        """
+
+        backend = buckets.CacheBucketBackend(alias="default")
+
+        with mock.patch("time.time", return_value=6000.0):
+            self.assertEqual([backend.consume("key", 2, 2 / 60) for _ in range(2)], [0.0, 0.0])
+
+            # Half of the next minute has to go by for one request to fit again
+            wait = backend.consume("key", 2, 2 / 60)
+            self.assertAlmostEqual(wait, 90.0)
+
+            with mock.patch.object(cache, "incr") as incr:
+                self.assertEqual(backend.consume("key", 2, 2 / 60), wait)
+                incr.assert_not_called()
+
+        with mock.patch("time.time", return_value=6000.0 + wait):
+            self.assertEqual(backend.consume("key", 2, 2 / 60), 0.0)
+            self.assertGreater(backend.consume("key", 2, 2 / 60), 0.0)
+
+
+class EndpointThrottlingTestCase(TestCase):
+    """
+    Test case for the throttles of the login and email sending endpoints
+    """
+
+    def setUp(self) -> None:
+        self.addCleanup(buckets.configure, backend=buckets.bucket_backend, rates=buckets.throttle_rates)
+        buckets.configure(
+            backend=buckets.LocalBucketBackend(),
+            rates={"login_ip": "2/min", "login_account": None, "reset_password_account": "1/hour"},
+        )
+
+    def test_login_is_throttled_before_validation(self):
+        """
+        Test case to ensure that a client over its rate gets a 429,
+        without its credentials being checked.
+        """
+
+        url = reverse("authentication_service:login")
+        payload = {"email": "israelabraham@email.com", "password": "wrong"}
+
+        for _ in range(2):
+            self.assertEqual(self.client.post(url, data=payload).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with mock.patch.object(UserLoginObtainPairSerializer, "validate") as validate:
+            response = self.client.post(url, data=payload)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+        validate.assert_not_called()
+
+        # Other clients are not throttled
+        response = self.client.post(url, data=payload, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_forwarded_for_is_not_trusted(self):
+        """
+        Test case to ensure that a client can't get a fresh bucket
+        by sending another X-Forwarded-For on every request.
+        """
+
+        url = reverse("authentication_service:login")
+        payload = {"email": "israelabraham@email.com", "password": "wrong"}
+
+        responses = [
+            self.client.post(url, data=payload, HTTP_X_FORWARDED_FOR=f"198.51.100.{index}")
+            for index in range(3)
+        ]
+        self.assertEqual(responses[-1].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_reset_password_is_throttled_per_account(self):
+        """
+        Test case to ensure that the emails sent to an account are
+        limited, whichever address the requests come from.
+        """
+
+        url = reverse("authentication_service:reset_password")
+
+        response = self.client.post(url, data={"email": "Someone@email.com"}, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(url, data={"email": "someone@email.com "}, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.post(url, data={"email": "another@email.com"}, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
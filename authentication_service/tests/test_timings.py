@@ -0,0 +1,94 @@
+# Python Imports
+import json
+
+# Django Imports
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+
+# Rest Framework Imports
+from rest_framework import status
+
+# Own Imports
+from authentication_service.models import AccountUser
+from authentication_service.services.instrumentation import timings
+
+
+class ServerTimingTestCase(TestCase):
+    """
+    Test case for the timings of the API requests
+    """
+
+    password = "someawfully_strongpassword_2022"
+
+    def setUp(self) -> None:
+        self.addCleanup(
+            timings.configure,
+            sample_rate=timings.server_timing_sample_rate,
+            header=timings.server_timing_header,
+        )
+        timings.configure(sample_rate=1.0, header=True)
+
+        user = AccountUser.objects.create(
+            username="israelabraham", email="israelabraham@email.com", is_active=True
+        )
+        user.set_password(self.password)
+        user.save()
+
+    def login(self):
+        return self.client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+        )
+
+    def test_login_timings(self):
+        """
+        Test case to ensure that a timed request reports its database
+        queries and password hashing, in its header and in a log line.
+        """
+
+        with self.assertLogs("authentication_service.timings", level="INFO") as logs:
+            response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        entries = {entry.split(";")[0]: entry for entry in response["Server-Timing"].split(", ")}
+        self.assertEqual(list(entries)[:3], ["total", "db", "hash"])
+        self.assertIn('desc="1"', entries["hash"])
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["route"], "api/v1/login/")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["hash_count"], 1)
+        self.assertGreaterEqual(record["db_count"], 1)
+        self.assertGreaterEqual(record["total_ms"], record["hash_ms"])
+
+    def test_sampling(self):
+        """
+        Test case to ensure that only a sample of the API requests
+        are timed, and that the header can be left out.
+        """
+
+        timings.configure(sample_rate=0.0)
+        self.assertNotIn("Server-Timing", self.login())
+
+        timings.configure(sample_rate=1.0, header=False)
+        with self.assertLogs("authentication_service.timings", level="INFO"):
+            self.assertNotIn("Server-Timing", self.login())
+
+        timings.configure(header=True)
+        self.assertNotIn("Server-Timing", self.client.get(reverse("jwks")))
+
+    async def test_async_login_timings(self):
+        """
+        Test case to ensure that the parts of an async view run
+        in threads are timed as well.
+        """
+
+        response = await AsyncClient().post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": self.password},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="\d+", hash;dur=')
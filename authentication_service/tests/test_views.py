@@ -1,4 +1,12 @@
+# Python Imports
+import json
+import time
+
 # Django Imports
+from django.conf import settings
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.contrib.auth.tokens import default_token_generator
@@ -11,8 +19,19 @@ from rest_framework import status
 # Simple JWT Imports
 from rest_framework_simplejwt.tokens import RefreshToken
 
+# JWT Imports
+import jwt
+from jwt.algorithms import RSAAlgorithm
+
+# Cryptography Imports
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# HTTPX Imports
+import httpx
+
 # Own Imports
 from authentication_service.models import AccountUser
+from authentication_service.services.oauth2 import google
 
 
 # initialize api client
@@ -134,6 +153,42 @@ class RegisterTestCase(BaseTestCase):
         response = client.post(url, data=self.invalid_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
+    def test_register_inserts_user_once(self):
+        """
+        Test case to ensure that a signup hashes the password 
+        and writes the user row with a single insert.
+        """
+        url = reverse("authentication_service:register")
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(url, data=self.valid_payload, format="json")
+        
+        users_queries = [query["sql"] for query in queries if '"users"' in query["sql"]]
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(users_queries), 1)
+        self.assertTrue(users_queries[0].startswith('INSERT INTO "users"'))
+        self.assertTrue(
+            AccountUser.objects.get(email="abraham@email.com").check_password(self.valid_payload["password"])
+        )
+        
+    def test_duplicate_register(self):
+        """
+        Test case to ensure that we can't create a user 
+        with an existing email or username in another case.
+        """
+        url = reverse("authentication_service:register")
+        
+        for payload in (
+            {**self.valid_payload, "email": "IsraelAbraham@Email.com"},
+            {**self.valid_payload, "username": "IsraelAbraham"},
+        ):
+            response = client.post(url, data=payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            
+        self.assertFalse(AccountUser.objects.filter(username="abram").exists())
+        
+
 
 class RequestVerifyEmailTestCase(BaseTestCase):
     """
@@ -330,7 +385,184 @@ class SuspendUserTestCase(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     
+class CountingKeySource(google.StaticKeySource):
+    """A local key set that counts how often it is fetched"""
+    
+    fetches = 0
+    
+    def fetch(self):
+        self.fetches += 1
+        return self.jwks, 3600
+
+
+class FailingKeySource(CountingKeySource):
+    """A key source whose fetches fail, as during an outage of Google"""
+    
+    def fetch(self):
+        self.fetches += 1
+        raise httpx.ConnectTimeout("timed out")
+
+
 class GoogleOAuthLoginTestCase(BaseTestCase):
     
+    def setUp(self) -> None:
+        super().setUp()
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        
+        jwk = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        self.key_source = CountingKeySource({"keys": [{**jwk, "kid": "google-1", "alg": "RS256"}]})
+        
+        key_set = google.google_key_set
+        self.addCleanup(setattr, google, "google_key_set", key_set)
+        google.configure(key_source=self.key_source)
+        
+    def make_id_token(self, kid="google-1", **claims):
+        now = int(time.time())
+        claims = {
+            "iss": "https://accounts.google.com",
+            "aud": settings.GOOGLE_OAUTH2_CLIENT_ID,
+            "sub": "1234567890",
+            "email": "googleuser@gmail.com",
+            "email_verified": True,
+            "given_name": "Google",
+            "family_name": "User",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": kid})
+    
+    def google_login(self, id_token):
+        return client.post(reverse("authentication_service:google_oauth2_login"), data={"id_token": id_token})
+    
     def test_google_oauth_login(self):
-        return ...
\ No newline at end of file
+        """
+        Test case to ensure that a verified id_token
+        logs the user in, without calling Google.
+        """
+        
+        response = self.google_login(self.make_id_token())
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data["data"])
+        self.assertTrue(AccountUser.objects.filter(email="googleuser@gmail.com", is_active=True).exists())
+        
+        self.assertEqual(self.google_login(self.make_id_token()).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.key_source.fetches, 1)
+        
+    def test_invalid_google_id_token(self):
+        """
+        Test case to ensure that tokens with a wrong audience, issuer,
+        signature or expiry are rejected.
+        """
+        
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        
+        invalid_tokens = [
+            self.make_id_token(aud="another-client-id"),
+            self.make_id_token(iss="https://accounts.example.com"),
+            self.make_id_token(exp=int(time.time()) - 60),
+            self.make_id_token(email_verified=False),
+            jwt.encode({"aud": settings.GOOGLE_OAUTH2_CLIENT_ID}, other_key, algorithm="RS256", headers={"kid": "google-1"}),
+            "not-a-token",
+        ]
+        
+        for id_token in invalid_tokens:
+            self.assertEqual(self.google_login(id_token).status_code, status.HTTP_400_BAD_REQUEST)
+            
+        self.assertFalse(AccountUser.objects.filter(email="googleuser@gmail.com").exists())
+        
+    def test_unknown_kid_refreshes_keys(self):
+        """
+        Test case to ensure that a token signed by a new key
+        refreshes the cached keys once.
+        """
+        
+        self.google_login(self.make_id_token())
+        
+        google.google_key_set.attempted_at -= google.MIN_REFRESH_INTERVAL
+        response = self.google_login(self.make_id_token(kid="google-2"))
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.key_source.fetches, 2)
+        
+        # Unknown kids don't refresh the keys again right away
+        self.google_login(self.make_id_token(kid="google-3"))
+        self.assertEqual(self.key_source.fetches, 2)
+        
+    def test_failing_key_source_keeps_cached_keys(self):
+        """
+        Test case to ensure that expired keys are still used while
+        they can't be refreshed, and that the refresh backs off.
+        """
+        
+        self.assertEqual(self.google_login(self.make_id_token()).status_code, status.HTTP_200_OK)
+        
+        key_source = FailingKeySource(self.key_source.jwks)
+        google.google_key_set.key_source = key_source
+        google.google_key_set.expires_at = 0.0
+        google.google_key_set.attempted_at -= google.MIN_REFRESH_INTERVAL
+        
+        for _ in range(2):
+            self.assertEqual(self.google_login(self.make_id_token()).status_code, status.HTTP_200_OK)
+        self.assertEqual(key_source.fetches, 1)
+        
+    def test_failing_key_source_without_keys(self):
+        """
+        Test case to ensure that logins are rejected while no key
+        could be fetched, without fetching on every request.
+        """
+        
+        key_source = FailingKeySource(self.key_source.jwks)
+        google.configure(key_source=key_source)
+        
+        for _ in range(2):
+            response = self.google_login(self.make_id_token())
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(key_source.fetches, 1)
+        
+
+class AsyncViewsTestCase(BaseTestCase):
+    """
+    Test case to ensure that the views are served natively under ASGI
+    """
+    
+    def setUp(self) -> None:
+        super().setUp()
+        self.active_user.set_password("someawfully_strongpassword_2022")
+        self.active_user.save(update_fields=["password"])
+        
+        # The async client sends its extra kwargs as plain headers
+        self.async_client = AsyncClient()
+        self.auth_headers = {"authorization": self.bearer_token["HTTP_AUTHORIZATION"]}
+    
+    async def test_async_login(self):
+        """
+        Test case to ensure that a user can login through the async stack.
+        """
+        
+        response = await self.async_client.post(
+            reverse("authentication_service:login"),
+            data={"email": "israelabraham@email.com", "password": "someawfully_strongpassword_2022"},
+            content_type="application/json",
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json()["data"])
+        
+    async def test_async_change_password(self):
+        """
+        Test case to ensure that the user can change 
+        their password through the async stack.
+        """
+        
+        response = await self.async_client.put(
+            reverse("authentication_service:change_password"),
+            data=self.valid_pwd_payload,
+            content_type="application/json",
+            **self.auth_headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        
+        user = await AccountUser.objects.aget(email="israelabraham@email.com")
+        self.assertTrue(await user.acheck_password(self.valid_pwd_payload["new_password"]))
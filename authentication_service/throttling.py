@@ -0,0 +1,72 @@
+# Python Imports
+import hashlib
+
+# Typing Imports
+from typing import Any, Optional
+
+# Rest Framework Imports
+from rest_framework import throttling
+from rest_framework.request import Request
+
+# Account Service Imports
+from authentication_service.managers import canonical_email
+from authentication_service.services.throttling.buckets import consume
+
+
+class TokenBucketThrottle(throttling.BaseThrottle):
+    """
+    Takes a token from the `<throttle_scope>_<key_type>` bucket of the
+    request. Throttles run before the serializer, so a throttled
+    request never reaches the password hasher or the email outbox.
+    """
+
+    key_type = None
+
+    def __init__(self) -> None:
+        self.wait_time = None
+
+    def get_ident_key(self, request:Request) -> Optional[str]:
+        raise NotImplementedError(".get_ident_key() must be overridden")
+
+    def allow_request(self, request:Request, view:Any) -> bool:
+        scope = getattr(view, "throttle_scope", None)
+        if scope is None:
+            return True
+
+        ident = self.get_ident_key(request)
+        if ident is None:
+            return True
+
+        # Keeps the keys short and free of the characters Memcached rejects
+        digest = hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()
+
+        self.wait_time = consume(f"{scope}_{self.key_type}", digest)
+        return self.wait_time == 0
+
+    def wait(self) -> Optional[float]:
+        return self.wait_time
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """Buckets per client IP, `NUM_PROXIES` tells which X-Forwarded-For address to trust"""
+
+    key_type = "ip"
+
+    def get_ident_key(self, request:Request) -> Optional[str]:
+        return self.get_ident(request)
+
+
+class AccountTokenBucketThrottle(TokenBucketThrottle):
+    """Buckets per account, named by the email of the request body"""
+
+    key_type = "account"
+
+    def get_ident_key(self, request:Request) -> Optional[str]:
+        try:
+            email = request.data.get("email")
+        except AttributeError:
+            return None
+
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return canonical_email(email)
@@ -1,11 +1,8 @@
 # Rest Framework Imports
 from rest_framework.request import Request
 
-# Django Imports
-from django.db.models import Q
-
 # Account Service Imports
-from authentication_service.models import AccountUser
+from authentication_service.services.users.identity import aget_user, get_user
 
 
 def get_inactive_user(request:Request, email:str):
@@ -19,10 +16,11 @@ def get_inactive_user(request:Request, email:str):
     :return: The user object is being returned.
     """
     
-    user = AccountUser.objects.filter(
-        Q(email__iexact=email) & Q(is_active=False)  
-    ).first()
-    return user
+    user = get_user(email=email)
+    
+    if user is not None and not user.is_active:
+        return user
+    return None
     
 
 def get_active_user(request:Request, email:str):
@@ -36,7 +34,44 @@ def get_active_user(request:Request, email:str):
     :return: The user object
     """
     
-    user = AccountUser.objects.filter(
-        Q(email__iexact=email) & Q(is_active=True)  
-    ).first()
-    return user
\ No newline at end of file
+    user = get_user(email=email)
+    
+    if user is not None and user.is_active:
+        return user
+    return None
+    
+
+async def aget_inactive_user(request:Request, email:str):
+    """
+    Same as `get_inactive_user`, for async views
+    
+    :param request: This is the request object that is passed to the view
+    :type request: Request
+    :param email: The email address of the user you want to get
+    :type email: str
+    :return: The user object is being returned.
+    """
+    
+    user = await aget_user(email=email)
+    
+    if user is not None and not user.is_active:
+        return user
+    return None
+
+
+async def aget_active_user(request:Request, email:str):
+    """
+    Same as `get_active_user`, for async views
+    
+    :param request: This is the request object that is passed to the view
+    :type request: Request
+    :param email: The email address of the user
+    :type email: str
+    :return: The user object
+    """
+    
+    user = await aget_user(email=email)
+    
+    if user is not None and user.is_active:
+        return user
+    return None
@@ -1,60 +1,74 @@
 # Rest Framework Imports
-from rest_framework import status, views, permissions
+from rest_framework import status, permissions, serializers
 from rest_framework.response import Response
 from rest_framework.request import Request
 
 # Djang Imports
-from django.contrib.auth import logout, hashers
+from django.contrib.auth import logout
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_decode
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
 from django.shortcuts import render
+from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_GET
 
 # DRF YASG Imports
 from drf_yasg.utils import swagger_auto_schema
 
 # SimpleJWT Imports
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
-from authentication_service.models import AccountUser
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.tokens import Token
 from authentication_service.permissions import CanSuspendUserPermission
 
 # Account Service Imports
+from authentication_service.async_views import AsyncAPIView, AsyncViewMixin
+from authentication_service.models import AccountUser
 from authentication_service.serializers import (
     RegisterUserSerializer,
     UserLoginObtainPairSerializer,
+    UserTokenRefreshSerializer,
     UserEmailSerializer,
     UserResetPasswordSerializer,
     UserChangePasswordSerializer,
     GoogleOAuth2Serializer
 )
 from authentication_service.services.emails.users import (
-    send_email_to_user, 
-    send_reset_password_email_to_user
+    queue_email_to_user, 
+    queue_reset_password_email_to_user
 )
 from authentication_service.services.generators.uid import generate_uid_token
-from authentication_service.services.oauth2.google import google_validate_id_token
+from authentication_service.services.instrumentation.metrics import can_read_metrics, render_metrics
+from authentication_service.services.instrumentation.profiling import sync_to_async
 from authentication_service.services.oauth2.jwt import jwt_login
+from authentication_service.services.tokens.jwt import RevocableRefreshToken
+from authentication_service.services.tokens.keys import get_key_ring
+from authentication_service.services.tokens.revocation import revoke_token
+from authentication_service.services.users.epochs import bump_credential_epoch
+from authentication_service.services.users.identity import aget_user
 from authentication_service.services.users.records import user_get_me, user_get_or_create
+from authentication_service.throttling import AccountTokenBucketThrottle, IPTokenBucketThrottle
 from authentication_service.utils import (
-    get_active_user, 
-    get_inactive_user
+    aget_active_user, 
+    aget_inactive_user
 )
 
 # Third Party Imports
 from rest_api_payload import success_response, error_response
 
 
-class RegisterAPIView(views.APIView):
+class RegisterAPIView(AsyncAPIView):
     serializer_class = RegisterUserSerializer
     permission_classes = [permissions.AllowAny]
     
     @swagger_auto_schema(request_body=RegisterUserSerializer)
-    def post(self, request:Request) -> Response:
+    async def post(self, request:Request) -> Response:
         """
         The function creates a user, generates a verification link, 
-        and sends an email to the user.
+        and queues an email to the user.
         
         :param request: The request object
         :type request: Request
@@ -64,20 +78,12 @@ class RegisterAPIView(views.APIView):
         
         if serializer.is_valid():
             
-            # get password from validated data
-            password = serializer.validated_data.get("password")
-            
-            # create user
-            user = AccountUser.objects.create(**serializer.validated_data)
-            user.set_password(password)
-            user.save()
-            
-            # generate verification link for user
-            uid, token = generate_uid_token(request=request, user=user)
-            
-            # send email to user
-            if uid and token:
-                send_email_to_user(request=request, user=user, uid=uid, token=token)
+            try:
+                await sync_to_async(self.register)(request, serializer)
+                        
+            except serializers.ValidationError as exc:
+                payload = error_response(status=False, message=exc.detail)
+                return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
             
             payload = success_response(
                 status=True, 
@@ -89,46 +95,121 @@ class RegisterAPIView(views.APIView):
         payload = error_response(status=False, message=serializer.errors)
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
+    def register(self, request:Request, serializer:RegisterUserSerializer) -> AccountUser:
+        """
+        Creates the user and queues its verification email in one transaction
+        
+        :param request: The request object
+        :type request: Request
+        :param serializer: The validated serializer
+        :return: The user created
+        """
+        with transaction.atomic():
+            
+            # create user with a hashed password in a single insert
+            user = serializer.save()
+            
+            # generate verification link for user
+            uid, token = generate_uid_token(request=request, user=user)
+            
+            # queue email to user
+            if uid and token:
+                queue_email_to_user(request=request, user=user, uid=uid, token=token)
+                
+        return user
+    
 
-class LoginAPIView(TokenObtainPairView):
+class LoginAPIView(AsyncViewMixin, TokenObtainPairView):
     """Inherits TokenObtainPairView from rest_framework simplejwt"""
 
     serializer_class = UserLoginObtainPairSerializer
+    throttle_classes = (IPTokenBucketThrottle, AccountTokenBucketThrottle)
+    throttle_scope = "login"
+    
+    async def post(self, request:Request, *args, **kwargs) -> Response:
+        """
+        Authenticates the user, in a thread, and returns a token pair
+        
+        :param request: The request object
+        :type request: Request
+        :return: A response object with the tokens of the user.
+        """
+        serializer = self.get_serializer(data=request.data)
+        
+        try:
+            await sync_to_async(serializer.is_valid)(raise_exception=True)
+        except TokenError as exc:
+            raise InvalidToken(exc.args[0])
+        
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
 
-
-class RefreshLoginAPIView(TokenRefreshView):
+class RefreshLoginAPIView(AsyncViewMixin, TokenRefreshView):
     """Inherits TokenRefreshView from rest_framework simplejwt"""
 
-    serializer_class = TokenRefreshSerializer
+    serializer_class = UserTokenRefreshSerializer
     
+    async def post(self, request:Request, *args, **kwargs) -> Response:
+        """
+        Checks the refresh token, in a thread, and returns a new access token
+        
+        :param request: The request object
+        :type request: Request
+        :return: A response object with the new access token.
+        """
+        serializer = self.get_serializer(data=request.data)
+        
+        try:
+            await sync_to_async(serializer.is_valid)(raise_exception=True)
+        except TokenError as exc:
+            raise InvalidToken(exc.args[0])
+        
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
     
-class LogoutAPIView(views.APIView):
+    
+class LogoutAPIView(AsyncAPIView):
     permission_classes = (permissions.IsAuthenticated, )
     
-    def post(self, request:Request) -> Response:
+    async def post(self, request:Request) -> Response:
         """
-        It logs out the user and returns a 204 status code
+        It logs out the user, revokes the access token of the request
+        and the refresh token in the body, and returns a 204 status code
         
         :param request: This is the request object that is passed to the view
         :type request: Request
         :return: A response object with a status code of 204 and no content.
         """
-        logout(request)
+        refresh = request.data.get("refresh")
+        
+        if refresh:
+            try:
+                # the token is checked against the revoked tokens when loaded
+                token = await sync_to_async(RevocableRefreshToken)(refresh)
+                await sync_to_async(revoke_token)(token)
+            except TokenError as exc:
+                payload = error_response(status=False, message=str(exc))
+                return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
+        
+        if isinstance(request.auth, Token):
+            await sync_to_async(revoke_token)(request.auth)
+        
+        await sync_to_async(logout)(request)
         payload = success_response(status=True, message="Logged out successful!", data={})
         return Response(data=payload, status=status.HTTP_204_NO_CONTENT)
     
     
-class RequestEmailUidTokenAPIView(views.APIView):
+class RequestEmailUidTokenAPIView(AsyncAPIView):
     permission_classes = (permissions.AllowAny, )
+    throttle_classes = (IPTokenBucketThrottle, AccountTokenBucketThrottle)
+    throttle_scope = "request_email"
     serializer_class = UserEmailSerializer
     
     @swagger_auto_schema(request_body=UserEmailSerializer)
-    def post(self, request:Request) -> Response:
+    async def post(self, request:Request) -> Response:
         """
         It takes in a request object, validates the email address, 
         gets the inactive user, generates a
-        uid and token, and sends an email to the user.
+        uid and token, and queues an email to the user.
         
         :param request: The request object
         :type request: Request
@@ -137,10 +218,10 @@ class RequestEmailUidTokenAPIView(views.APIView):
         
         serializer = self.serializer_class(data=request.data)
         
-        if serializer.is_valid():
+        if await sync_to_async(serializer.is_valid)():
             
-            # get inactive user
-            user = get_inactive_user(
+            # get inactive user, loaded by the serializer
+            user = await aget_inactive_user(
                 request=request, 
                 email=serializer.validated_data.get("email")
             )
@@ -148,9 +229,9 @@ class RequestEmailUidTokenAPIView(views.APIView):
             # generate verification link for user
             uid, token = generate_uid_token(request=request, user=user)
             
-            # send email to user if uid and token is generated
+            # queue email to user if uid and token is generated
             if uid and token:
-                send_email_to_user(request=request, user=user, uid=uid, token=token)
+                await sync_to_async(queue_email_to_user)(request=request, user=user, uid=uid, token=token)
             
             payload = success_response(
                 status=True, 
@@ -163,10 +244,10 @@ class RequestEmailUidTokenAPIView(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
 
-class VerifyEmailUidTokenAPIView(views.APIView):
+class VerifyEmailUidTokenAPIView(AsyncAPIView):
     permission_classes = (permissions.AllowAny, )
     
-    def post(self, request:Request, uidb64, token) -> Response:
+    async def post(self, request:Request, uidb64, token) -> Response:
         """
         It takes in a uidb64 and token, decodes the uidb64, 
         gets the user with the uid, checks if the
@@ -181,15 +262,16 @@ class VerifyEmailUidTokenAPIView(views.APIView):
         """
         try:
             uid = urlsafe_base64_decode(uidb64).decode()
-            user = AccountUser._default_manager.get(uuid=uid)
+            user = await aget_user(uuid=uid)
             
-        except(TypeError, ValueError, OverflowError, AccountUser.DoesNotExist):
+        except(TypeError, ValueError, OverflowError):
             user = None
             
         if user is not None and default_token_generator.check_token(user, token):
             user.is_email_active = True
             user.is_active = True
-            user.save(update_fields=["is_email_active", "is_active"])
+            # Model.asave arrives with Django 4.2, save in a thread until then
+            await sync_to_async(user.save)(update_fields=["is_email_active", "is_active"])
             
             payload = success_response(
                 status=True,
@@ -202,16 +284,18 @@ class VerifyEmailUidTokenAPIView(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
 
-class ResetPasswordAPIView(views.APIView):
+class ResetPasswordAPIView(AsyncAPIView):
     permission_classes = (permissions.AllowAny, )
+    throttle_classes = (IPTokenBucketThrottle, AccountTokenBucketThrottle)
+    throttle_scope = "reset_password"
     serializer_class = UserEmailSerializer
     
     @swagger_auto_schema(request_body=UserEmailSerializer)
-    def post(self, request:Request) -> Response:
+    async def post(self, request:Request) -> Response:
         """
         It takes in a request object, 
         validates the email address, 
-        generates a uid and token, and sends
+        generates a uid and token, and queues
         an email to the user.
         
         :param request: The request object
@@ -220,9 +304,10 @@ class ResetPasswordAPIView(views.APIView):
         """
         serializer = self.serializer_class(data=request.data)
         
-        if serializer.is_valid():
+        if await sync_to_async(serializer.is_valid)():
             
-            user = get_active_user(
+            # loaded by the serializer
+            user = await aget_active_user(
                 request=request, 
                 email=serializer.validated_data.get("email")
             )
@@ -230,9 +315,11 @@ class ResetPasswordAPIView(views.APIView):
             # generate verification link for user
             uid, token = generate_uid_token(request=request, user=user)
             
-            # send email to user
+            # queue email to user
             if uid and token:
-                send_reset_password_email_to_user(request=request, user=user, uid=uid, token=token)
+                await sync_to_async(queue_reset_password_email_to_user)(
+                    request=request, user=user, uid=uid, token=token
+                )
             
             payload = success_response(
                 status=True,
@@ -245,11 +332,11 @@ class ResetPasswordAPIView(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
 
-class VerifyResetPasswordUidToken(views.APIView):
+class VerifyResetPasswordUidToken(AsyncAPIView):
     permission_classes = (permissions.AllowAny, )
     serializer_class = UserResetPasswordSerializer
     
-    def get(self, request:Request, uidb64, token) -> Response:
+    async def get(self, request:Request, uidb64, token) -> Response:
         """
         It takes a uidb64 and token, 
         decodes the uidb64, 
@@ -263,9 +350,9 @@ class VerifyResetPasswordUidToken(views.APIView):
         """
         try:
             uid = urlsafe_base64_decode(uidb64).decode()
-            user = AccountUser._default_manager.get(uuid=uid)
+            user = await aget_user(uuid=uid)
             
-        except(TypeError, ValueError, OverflowError, AccountUser.DoesNotExist):
+        except(TypeError, ValueError, OverflowError):
             user = None
         
         if user is not None and default_token_generator.check_token(user, token):
@@ -280,7 +367,7 @@ class VerifyResetPasswordUidToken(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
     @swagger_auto_schema(request_body=UserResetPasswordSerializer)
-    def post(self, request:Request, uidb64, token) -> Response:
+    async def post(self, request:Request, uidb64, token) -> Response:
         """
         The function takes in a request, 
         decodes the base64 encoded user id, 
@@ -303,13 +390,13 @@ class VerifyResetPasswordUidToken(views.APIView):
             uid = urlsafe_base64_decode(uidb64).decode()
             
             # Get first user with id
-            user = AccountUser.objects.filter(uuid=uid).first()
+            user = await aget_user(uuid=uid)
             
             if user is not None:
             
                 # Update user password and save to database
-                user.set_password(new_password)
-                user.save()
+                await user.aset_password(new_password)
+                await sync_to_async(bump_credential_epoch)(user, update_fields=["password"])
                 
                 payload = success_response(
                     status=True,
@@ -325,12 +412,12 @@ class VerifyResetPasswordUidToken(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
         
     
-class ChangePasswordAPIView(views.APIView):
+class ChangePasswordAPIView(AsyncAPIView):
     permission_classes = (permissions.IsAuthenticated, )
     serializer_class = UserChangePasswordSerializer
     
     @swagger_auto_schema(request_body=UserChangePasswordSerializer)
-    def put(self, request:Request) -> Response:
+    async def put(self, request:Request) -> Response:
         """
         If the current password is correct, 
         and the new password equals the repeat new password,
@@ -342,9 +429,9 @@ class ChangePasswordAPIView(views.APIView):
         """
         serializer = self.serializer_class(data=request.data)
         
-        if serializer.is_valid():
+        if await sync_to_async(serializer.is_valid)():
             
-            user = get_active_user(request=request, email=serializer.validated_data.get("email"))
+            user = await aget_active_user(request=request, email=serializer.validated_data.get("email"))
             current_password = serializer.validated_data.get("current_password")
             new_password = serializer.validated_data.get("new_password")
             repeat_new_password = serializer.validated_data.get("repeat_new_password")
@@ -352,7 +439,7 @@ class ChangePasswordAPIView(views.APIView):
             # Confirms if the current inputted password equals to the user password
             can_change_password = (
                 True
-                if hashers.check_password(current_password, user.password)
+                if await user.acheck_password(current_password)
                 else False
             )
 
@@ -367,9 +454,8 @@ class ChangePasswordAPIView(views.APIView):
             
             # Update user password and save to database
             if password_message is True:
-                user.password = new_password
-                user.set_password(new_password)
-                user.save(update_fields=["password"])
+                await user.aset_password(new_password)
+                await sync_to_async(bump_credential_epoch)(user, update_fields=["password"])
 
             
             payload = success_response(
@@ -383,10 +469,10 @@ class ChangePasswordAPIView(views.APIView):
         return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
     
 
-class SuspendUserAPIView(views.APIView):
+class SuspendUserAPIView(AsyncAPIView):
     permission_classes = (CanSuspendUserPermission, )
     
-    def put(self, request:Request, user_email:str) -> Response:
+    async def put(self, request:Request, user_email:str) -> Response:
         """
         This function suspends a user
         
@@ -396,11 +482,11 @@ class SuspendUserAPIView(views.APIView):
         :type user_email: str
         :return: A response object with a payload of data and a status code.
         """
-        user = get_active_user(request=request, email=user_email)
+        user = await aget_active_user(request=request, email=user_email)
         
         if user is not None:
             user.is_suspended = True
-            user.save(update_fields=["is_suspended"])
+            await sync_to_async(bump_credential_epoch)(user, update_fields=["is_suspended"])
             
             payload = success_response(
                 status=True,
@@ -413,42 +499,100 @@ class SuspendUserAPIView(views.APIView):
         return Response(data=payload, status=status.HTTP_404_NOT_FOUND)
     
     
-class GoogleOAuth2LoginAPIView(views.APIView):
+class GoogleOAuth2LoginAPIView(AsyncAPIView):
     serializer_class = GoogleOAuth2Serializer
     
     @swagger_auto_schema(request_body=GoogleOAuth2Serializer)
-    def post(self, request:Request, *args, **kwargs) -> Response:
+    async def post(self, request:Request, *args, **kwargs) -> Response:
         """
-        We are validating the id_token that is sent in the header of the request. 
+        We are validating the id_token that is sent in the body, or the header, of the request. 
         
-        If the id_token is valid, we are creating a response object and then calling the jwt_login
-        function
+        If the id_token is valid, we get or create the user it identifies, 
+        create a response object and then call the jwt_login function
         
         :param request: This is the request object that is sent to the server
         :type request: Request
         :return: The response object is being returned.
         """
         
-        # The above code is validating the id_token 
-        # that is sent in the header of the request.
-        id_token = request.headers.get('id_token')
-        google_validate_id_token(id_token=id_token)
-    
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
+        
+        id_token = serializer.validated_data.get("id_token") or request.headers.get("Id-Token")
+        
+        # Imported here, so only the workers serving Google logins import httpx
+        from authentication_service.services.oauth2.google import google_validate_id_token
+        
+        # The signature and claims of the id_token are 
+        # verified locally with Google's signing keys
+        try:
+            claims = await sync_to_async(google_validate_id_token)(id_token=id_token)
+        except ValidationError as exc:
+            payload = error_response(status=False, message=exc.messages[0])
+            return Response(data=payload, status=status.HTTP_400_BAD_REQUEST)
 
         # We use get-or-create logic here for the sake of the example.
         # We don't have a sign-up flow.
-        user, _ = user_get_or_create(**serializer.validated_data)
+        user, _ = await sync_to_async(user_get_or_create)(
+            email=claims["email"],
+            username=claims["email"],
+            firstname=claims.get("given_name", ""),
+            lastname=claims.get("family_name", ""),
+        )
+        
+        if user.is_suspended is True:
+            payload = error_response(
+                status=False, 
+                message="Account suspended. Kindly reach out to the support team."
+            )
+            return Response(data=payload, status=status.HTTP_403_FORBIDDEN)
 
         # The above code is creating a response object and 
         # then calling the jwt_login function.
         response = Response(data=user_get_me(user=user))
-        response = jwt_login(response=response, user=user)
+        response = await sync_to_async(jwt_login)(response=response, user=user)
 
         return response
 
     
+# Signing Keys View
+@require_GET
+@condition(etag_func=lambda request: get_key_ring().jwks_etag)
+def jwks(request: HttpRequest) -> HttpResponse:
+    """
+    Publishes the public signing keys as a JSON Web Key Set, so other
+    services can verify the tokens without calling this service.
+    
+    :param request: The request object
+    :type request: HttpRequest
+    :return: The JWKS, with an ETag and cache headers.
+    """
+    response = HttpResponse(get_key_ring().jwks_body, content_type="application/jwk-set+json")
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.AUTHENTICATION_SERVICE.get("jwks_max_age", 3600),
+    )
+    return response
+
+
+# Metrics View
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Serves the metrics of every worker in the Prometheus text format,
+    to `metrics_allowed_ips` and the holders of the `metrics_token`.
+    
+    :param request: The request object
+    :type request: HttpRequest
+    :return: The metrics, summed over the workers.
+    """
+    if not can_read_metrics(request):
+        return HttpResponseForbidden()
+    
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # Email Template Views
 def verify_email_template(request: HttpRequest) -> HttpResponse:
     email_context = {
@@ -0,0 +1,21 @@
+"""
+Offline benchmarks for the authentication service.
+
+Run a benchmark from the project root, with the same environment
+as `manage.py`, e.g. `python -m benchmarks.email_rendering`.
+"""
+
+# Standard Library Imports
+import os
+
+# Django Imports
+import django
+
+
+def setup_django() -> None:
+    """Configures the project settings the same way `manage.py` does"""
+
+    from core.config.base import RUNTIME_ENVIRON
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", RUNTIME_ENVIRON)
+    django.setup()
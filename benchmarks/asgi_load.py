@@ -0,0 +1,139 @@
+"""
+Concurrent password changes served by the sync stack, one thread per
+in-flight request, and by the async stack, awaiting the password
+hashing pool on the event loop. Reports the throughput, the latencies,
+the threads used and the Python memory held at every concurrency level.
+
+    python -m benchmarks.asgi_load --concurrency 8 32 128 --requests 256
+"""
+
+# Standard Library Imports
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Django Imports
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+# Simple JWT Imports
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from benchmarks.utils import format_time
+
+
+EMAIL = "loadtest@email.com"
+PASSWORD = "someawfully_strongpassword_2022"
+
+# A wrong current password is verified on every request, without any write
+PAYLOAD = {
+    "email": EMAIL,
+    "current_password": "not_the_current_password",
+    "new_password": "someincredibly_awful_strong_password022",
+    "repeat_new_password": "someincredibly_awful_strong_password022",
+}
+
+
+def run_sync(url: str, token: str, *, concurrency: int, requests: int):
+    local = threading.local()
+
+    def request(_):
+        if not hasattr(local, "client"):
+            local.client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        started_at = time.perf_counter()
+        response = local.client.put(url, data=PAYLOAD, content_type="application/json")
+        assert response.status_code == 202, response.status_code
+        return time.perf_counter() - started_at
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(request, range(requests)))
+        threads = threading.active_count()
+
+    return latencies, threads
+
+
+def run_async(url: str, token: str, *, concurrency: int, requests: int):
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    threads = 0
+
+    async def request():
+        nonlocal threads
+
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.put(
+                url, data=PAYLOAD, content_type="application/json", authorization=f"Bearer {token}"
+            )
+            assert response.status_code == 202, response.status_code
+            threads = max(threads, threading.active_count())
+            return time.perf_counter() - started_at
+
+    async def main():
+        return await asyncio.gather(*(request() for _ in range(requests)))
+
+    return asyncio.run(main()), threads
+
+
+def measure(name: str, runner, url: str, token: str, *, concurrency: int, requests: int) -> None:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    latencies, threads = runner(url, token, concurrency=concurrency, requests=requests)
+
+    elapsed = time.perf_counter() - started_at
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    print(
+        f"{name:<7} {concurrency:>11} {requests / elapsed:>9.1f} "
+        f"{format_time(statistics.median(latencies)):>10} "
+        f"{format_time(latencies[int(len(latencies) * 0.99) - 1]):>10} "
+        f"{threads:>8} {peak / 2**20:>8.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128], help="In-flight requests.")
+    parser.add_argument("--requests", type=int, default=256, help="Requests per configuration.")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+
+    try:
+        user = AccountUser.objects.create_user(
+            firstname="Load", lastname="Test", username="loadtest", email=EMAIL, password=PASSWORD
+        )
+        user.is_active = True
+        user.save(update_fields=["is_active"])
+        token = str(RefreshToken.for_user(user).access_token)
+        url = reverse("authentication_service:change_password")
+
+        print(f"{'stack':<7} {'concurrency':>11} {'req/s':>9} {'p50':>10} {'p99':>10} {'threads':>8} {'peak':>12}")
+        for concurrency in args.concurrency:
+            for name, runner in (("sync", run_sync), ("async", run_async)):
+                measure(name, runner, url, token, concurrency=concurrency, requests=args.requests)
+
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == "__main__":
+    main()
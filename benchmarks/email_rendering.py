@@ -0,0 +1,63 @@
+"""
+Compares the precompiled email rendering pipeline with the previous
+`render_to_string` + `strip_tags` path.
+
+    python -m benchmarks.email_rendering --number 500
+"""
+
+# Standard Library Imports
+import argparse
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Django Imports
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.utils.html import strip_tags
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.services.emails.users import render_verify_email
+from benchmarks.utils import bench, print_result
+
+
+def render_with_strip_tags(request, user, uid, token):
+    """The rendering path used before the precompiled templates"""
+
+    email_context = {
+        "user": user,
+        "domain": request.get_host(),
+        "uid": uid,
+        "token": token,
+        "site_name": settings.AUTHENTICATION_SERVICE["site_name"],
+        "contact_email": settings.AUTHENTICATION_SERVICE["contact_email"],
+    }
+    html_content = render_to_string("emails/verify-email-template.html", email_context)
+    return strip_tags(html_content), html_content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    request = RequestFactory().get("/", HTTP_HOST="127.0.0.1")
+    user = AccountUser(username="israelabraham", email="israelabraham@email.com")
+    uid, token = "MTIzNDU2Nzg5MA", "bfz1xs-0123456789abcdef0123456789abcdef"
+
+    print_result(
+        "render_to_string + strip_tags",
+        bench(lambda: render_with_strip_tags(request, user, uid, token), number=args.number, repeat=args.repeat),
+    )
+    print_result(
+        "precompiled html + text templates",
+        bench(lambda: render_verify_email(request, user, uid, token), number=args.number, repeat=args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+Load test of the API endpoints. Seeds users in a test database, then
+drives each endpoint from concurrent clients through the ASGI stack,
+and reports its throughput, p50/p95/p99 latencies and the database
+queries per request.
+
+    python -m benchmarks.endpoints --requests 200 --concurrency 16
+    python -m benchmarks.endpoints --save benchmarks/baselines/endpoints.json
+    python -m benchmarks.endpoints --baseline benchmarks/baselines/endpoints.json --tolerance 0.25
+
+A run compared to a baseline exits with 1 when an endpoint got slower or
+issued more queries than in the baseline. It runs against the database
+of the settings: SQLite by default, or e.g. a local Postgres with
+`DJANGO_SETTINGS_MODULE=core.config.production DATABASE_URL=postgres://...`
+"""
+
+# Standard Library Imports
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Typing Imports
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from benchmarks import setup_django
+
+setup_django()
+
+# ASGI Imports
+from asgiref.sync import async_to_sync
+
+# Django Imports
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.tokens import default_token_generator
+from django.db import connection
+from django.test import AsyncClient, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.serializers import UserLoginObtainPairSerializer
+from authentication_service.services.throttling import buckets
+from benchmarks.utils import format_time
+
+
+PASSWORD = "someawfully_strongpassword_2022"
+NEW_PASSWORD = "someincredibly_awful_strong_password022"
+
+# method, path, JSON body and headers of a request
+Request = Tuple[str, str, Dict[str, Any], Dict[str, str]]
+
+
+class Scenario(NamedTuple):
+    seed: Callable[[str, int], Any]
+    build: Callable[[Any, int], Request]
+    status: int
+
+
+class QueryCounter:
+    """Counts the queries run on a connection, however many there are"""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def seed_users(prefix: str, count: int, *, is_active: bool = True) -> List[AccountUser]:
+    encoded = make_password(PASSWORD)
+
+    AccountUser.objects.bulk_create(
+        [
+            AccountUser(
+                firstname="Load",
+                lastname="Test",
+                username=f"{prefix}{i}",
+                email=f"{prefix}{i}@email.com",
+                password=encoded,
+                is_active=is_active,
+            )
+            for i in range(count)
+        ],
+        batch_size=500,
+    )
+    return list(AccountUser.objects.filter(username__startswith=prefix).order_by("id"))
+
+
+def seed_tokens(prefix: str, count: int) -> List[Tuple[AccountUser, Any]]:
+    return [(user, UserLoginObtainPairSerializer.get_token(user)) for user in seed_users(prefix, count)]
+
+
+def seed_uid_tokens(prefix: str, count: int) -> List[Tuple[str, str]]:
+    return [
+        (urlsafe_base64_encode(force_bytes(user.uuid)), default_token_generator.make_token(user))
+        for user in seed_users(prefix, count, is_active=False)
+    ]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "register": Scenario(
+        seed=lambda prefix, count: prefix,
+        build=lambda prefix, i: ("post", reverse("authentication_service:register"), {
+            "firstname": "Load",
+            "lastname": "Test",
+            "username": f"{prefix}{i}",
+            "email": f"{prefix}{i}@email.com",
+            "password": PASSWORD,
+        }, {}),
+        status=201,
+    ),
+    "login": Scenario(
+        seed=seed_users,
+        build=lambda users, i: ("post", reverse("authentication_service:login"), {
+            "email": users[i].email, "password": PASSWORD,
+        }, {}),
+        status=200,
+    ),
+    "refresh": Scenario(
+        seed=seed_tokens,
+        build=lambda tokens, i: ("post", reverse("authentication_service:login_refresh"), {
+            "refresh": str(tokens[i][1]),
+        }, {}),
+        status=200,
+    ),
+    "verify_email": Scenario(
+        seed=seed_uid_tokens,
+        build=lambda uid_tokens, i: ("post", reverse("authentication_service:verify_uidb64_token", kwargs={
+            "uidb64": uid_tokens[i][0], "token": uid_tokens[i][1],
+        }), {}, {}),
+        status=202,
+    ),
+    "reset_password": Scenario(
+        seed=seed_users,
+        build=lambda users, i: ("post", reverse("authentication_service:reset_password"), {
+            "email": users[i].email,
+        }, {}),
+        status=202,
+    ),
+    "change_password": Scenario(
+        seed=seed_tokens,
+        build=lambda tokens, i: ("put", reverse("authentication_service:change_password"), {
+            "email": tokens[i][0].email,
+            "current_password": PASSWORD,
+            "new_password": NEW_PASSWORD,
+            "repeat_new_password": NEW_PASSWORD,
+        }, {"authorization": f"Bearer {tokens[i][1].access_token}"}),
+        status=202,
+    ),
+}
+
+
+async def drive(scenario: Scenario, fixtures: Any, indexes: range, concurrency: int) -> Tuple[List[float], int]:
+    """Sends the requests of `indexes` with `concurrency` in flight, returns their latencies and errors"""
+
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def send(i: int) -> float:
+        nonlocal errors
+
+        method, path, data, headers = scenario.build(fixtures, i)
+
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await getattr(client, method)(path, data=data, content_type="application/json", **headers)
+            latency = time.perf_counter() - started_at
+
+        if response.status_code != scenario.status:
+            errors += 1
+        return latency
+
+    latencies = await asyncio.gather(*(send(i) for i in indexes))
+    return list(latencies), errors
+
+
+def run_scenario(name: str, *, requests: int, concurrency: int, warmup: int) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    fixtures = scenario.seed(f"load{name.replace('_', '')}", warmup + requests)
+
+    async_to_sync(drive)(scenario, fixtures, range(warmup), concurrency)
+
+    # Run from this thread, the views query the database on its connection
+    counter = QueryCounter()
+    started_at = time.perf_counter()
+
+    with connection.execute_wrapper(counter):
+        latencies, errors = async_to_sync(drive)(scenario, fixtures, range(warmup, warmup + requests), concurrency)
+
+    elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput": requests / elapsed,
+        "p50": percentiles[49],
+        "p95": percentiles[94],
+        "p99": percentiles[98],
+        "queries_per_request": counter.count / requests,
+        "errors": errors,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """The regressions of `results` against the baseline"""
+
+    regressions = []
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        if result["p95"] > base["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {format_time(result['p95'])} > {format_time(base['p95'])}")
+        if result["throughput"] < base["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['throughput']:.1f} req/s < {base['throughput']:.1f} req/s")
+        if result["queries_per_request"] > base["queries_per_request"] + 0.01:
+            regressions.append(
+                f"{name}: {result['queries_per_request']:.2f} queries/request > {base['queries_per_request']:.2f}"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "scenarios", nargs="*", metavar="endpoint", default=list(SCENARIOS), help=f"One of {', '.join(SCENARIOS)}."
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight.")
+    parser.add_argument("--warmup", type=int, default=10, help="Requests sent before measuring.")
+    parser.add_argument(
+        "--fast-hashing", action="store_true", help="Hash passwords with MD5 to measure everything but the hasher."
+    )
+    parser.add_argument("--save", type=Path, help="Writes the results to this JSON baseline.")
+    parser.add_argument("--baseline", type=Path, help="Fails when the results regress from this JSON baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Latency and throughput change allowed.")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+
+    # The load comes from a single client address
+    buckets.configure(rates={})
+
+    hashers = None
+    if args.fast_hashing:
+        hashers = override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+        hashers.enable()
+
+    try:
+        print(f"{'endpoint':<16} {'req/s':>9} {'p50':>10} {'p95':>10} {'p99':>10} {'queries':>8} {'errors':>7}")
+        results = {}
+
+        for name in args.scenarios:
+            result = run_scenario(name, requests=args.requests, concurrency=args.concurrency, warmup=args.warmup)
+            results[name] = result
+
+            print(
+                f"{name:<16} {result['throughput']:>9.1f} {format_time(result['p50']):>10} "
+                f"{format_time(result['p95']):>10} {format_time(result['p99']):>10} "
+                f"{result['queries_per_request']:>8.2f} {result['errors']:>7}"
+            )
+
+    finally:
+        if hashers is not None:
+            hashers.disable()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "environment": {
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "fast_hashing": args.fast_hashing,
+            },
+            "endpoints": results,
+        }, indent=2) + "\n")
+
+    failures = [
+        f"{name}: {result['errors']} unexpected responses" for name, result in results.items() if result["errors"]
+    ]
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        failures += compare(results, baseline["endpoints"], args.tolerance)
+
+    if failures:
+        print("\n" + "\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Micro-benchmarks of the functions run on every request, saved per commit
+so that a change of request latency can be traced back to the functions
+that caused it.
+
+    python -m benchmarks.hot_paths --save
+    git checkout <other commit> && python -m benchmarks.hot_paths --save
+    python -m benchmarks.hot_paths --compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+Each benchmark is calibrated to run for at least `--min-time` seconds,
+then timed over `--runs` runs after a warmup run. A change is reported
+as significant when it is larger than `--threshold` and than twice the
+standard error of the difference of the means.
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import math
+import platform
+import subprocess
+from pathlib import Path
+
+# Typing Imports
+from typing import Any, Callable, Dict, Optional
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Django Imports
+from django.contrib.auth.tokens import default_token_generator
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+# Rest Framework Imports
+from rest_framework.renderers import JSONRenderer
+
+# Third Party Imports
+from rest_api_payload import success_response
+
+# Account Service Imports
+from authentication_service.models import AccountUser
+from authentication_service.serializers import RegisterUserSerializer, UserLoginObtainPairSerializer
+from authentication_service.services.generators.uid import generate_uid_token
+from authentication_service.services.tokens.jwt import RevocableAccessToken
+from authentication_service.services.tokens.keys import token_backend
+from benchmarks.utils import bench, calibrate, format_time
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+PASSWORD = "someawfully_strongpassword_2022"
+
+
+def git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(("git", *args), capture_output=True, check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_benchmarks() -> Dict[str, Callable[[], object]]:
+    """The functions to time, bound to a seeded user"""
+
+    user = AccountUser.objects.create_user(
+        firstname="Micro", lastname="Benchmark", username="microbenchmark", email="micro@email.com", password=PASSWORD
+    )
+    user.is_active = True
+    user.save(update_fields=["is_active"])
+
+    request = RequestFactory().post("/api/v1/login/")
+    uid, token = generate_uid_token(request=request, user=user)
+
+    refresh = UserLoginObtainPairSerializer.get_token(user)
+    payload = refresh.access_token.payload
+    encoded = str(refresh.access_token)
+
+    login_data = UserLoginObtainPairSerializer(
+        data={"email": user.email, "password": PASSWORD}, context={"request": request}
+    )
+    login_data.is_valid(raise_exception=True)
+    response_payload = login_data.validated_data
+
+    register_data = {
+        "firstname": "Victory",
+        "lastname": "Abraham",
+        "username": "abram",
+        "email": "abraham@email.com",
+        "password": PASSWORD,
+    }
+
+    def login_validate():
+        serializer = UserLoginObtainPairSerializer(
+            data={"email": user.email, "password": PASSWORD}, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+
+    def register_validate():
+        RegisterUserSerializer(data=register_data).is_valid(raise_exception=True)
+
+    return {
+        "generate_uid_token": lambda: generate_uid_token(request=request, user=user),
+        "check_token": lambda: default_token_generator.check_token(user, token),
+        "jwt_encode": lambda: token_backend.encode(payload),
+        "jwt_decode": lambda: token_backend.decode(encoded),
+        "access_token_validation": lambda: RevocableAccessToken(encoded),
+        "login_serializer_validate": login_validate,
+        "register_serializer_validate": register_validate,
+        "success_response": lambda: success_response(
+            status=True, message="Login successful", data=response_payload["data"]
+        ),
+        "json_render": lambda: JSONRenderer().render(response_payload),
+    }
+
+
+def run(names, *, runs: int, min_time: float) -> Dict[str, Dict[str, Any]]:
+    benchmarks = build_benchmarks()
+    results = {}
+
+    unknown = set(names) - set(benchmarks)
+    if unknown:
+        raise SystemExit(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    for name in names or benchmarks:
+        func = benchmarks[name]
+        result = bench(func, number=calibrate(func, min_time=min_time), repeat=runs)
+        results[name] = result
+
+        print(
+            f"{name:<30} {format_time(result['mean']):>12} "
+            f"+- {format_time(result['stdev']):>10} (best {format_time(result['best'])})"
+        )
+
+    return results
+
+
+def is_significant(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> bool:
+    change = new["mean"] / old["mean"] - 1
+    standard_error = math.sqrt(
+        old["stdev"] ** 2 / len(old["timings"]) + new["stdev"] ** 2 / len(new["timings"])
+    )
+    return abs(change) >= threshold and abs(new["mean"] - old["mean"]) > 2 * standard_error
+
+
+def compare(old_path: Path, new_path: Path, threshold: float) -> None:
+    old, new = json.loads(old_path.read_text()), json.loads(new_path.read_text())
+
+    print(f"{'benchmark':<30} {old['commit'] or old_path.stem:>12} {new['commit'] or new_path.stem:>12} {'change':>9}")
+
+    for name, new_result in new["benchmarks"].items():
+        old_result = old["benchmarks"].get(name)
+        if old_result is None:
+            continue
+
+        change = new_result["mean"] / old_result["mean"] - 1
+        flag = "  significant" if is_significant(old_result, new_result, threshold) else ""
+        print(
+            f"{name:<30} {format_time(old_result['mean']):>12} {format_time(new_result['mean']):>12} "
+            f"{change:>+8.1%}{flag}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark", help="Benchmarks to run, all by default.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--min-time", type=float, default=0.1, help="Least seconds of a run.")
+    parser.add_argument(
+        "--fast-hashing", action="store_true", help="Hash passwords with MD5 to time everything but the hasher."
+    )
+    parser.add_argument(
+        "--save", nargs="?", type=Path, const=True,
+        help="Writes the results, to benchmarks/results/<commit>.json by default.",
+    )
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"), help="Compares two saved results.")
+    parser.add_argument("--threshold", type=float, default=0.05, help="Least relative change reported as significant.")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare, threshold=args.threshold)
+        return
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+
+    hashers = None
+    if args.fast_hashing:
+        hashers = override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+        hashers.enable()
+
+    try:
+        results = run(args.benchmarks, runs=args.runs, min_time=args.min_time)
+    finally:
+        if hashers is not None:
+            hashers.disable()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    if args.save:
+        commit = git("rev-parse", "--short", "HEAD")
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+
+        name = f"{commit or 'unknown'}{'-dirty' if dirty else ''}.json"
+        path = args.save if args.save is not True else RESULTS_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "commit": commit,
+            "dirty": dirty,
+            "python": platform.python_version(),
+            "fast_hashing": args.fast_hashing,
+            "benchmarks": results,
+        }, indent=2) + "\n")
+        print(f"\nSaved to {path}")
+
+
+if __name__ == "__main__":
+    main()
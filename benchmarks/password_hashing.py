@@ -0,0 +1,67 @@
+"""
+Login-heavy workload: concurrent request threads verifying passwords,
+with hashing in the calling thread and in process pools of growing size.
+
+    python -m benchmarks.password_hashing --threads 8 --logins 64
+"""
+
+# Standard Library Imports
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Account Service Imports
+from authentication_service.services.passwords import hashing
+
+
+def run_logins(encoded: str, password: str, *, threads: int, logins: int) -> float:
+    """Verifies `logins` passwords from `threads` request threads, returns logins per second"""
+
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda _: hashing.verify_password(password, encoded), range(logins)))
+
+    elapsed = time.perf_counter() - started_at
+    assert all(is_correct for is_correct, _ in results)
+    return logins / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent request threads.")
+    parser.add_argument("--logins", type=int, default=64, help="Logins per configuration.")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    password = "someawfully_strongpassword_2022"
+
+    hashing.configure(workers=0)
+    encoded = hashing.hash_password(password)
+
+    print(f"{'hashing workers':<20} {'logins/s':>10} {'speedup':>8}")
+
+    baseline = run_logins(encoded, password, threads=args.threads, logins=args.logins)
+    print(f"{'request thread':<20} {baseline:>10.1f} {1.0:>7.2f}x")
+
+    workers = 1
+    while workers <= args.max_workers:
+        hashing.configure(workers=workers)
+
+        # start the processes before timing
+        hashing.verify_password(password, encoded)
+
+        throughput = run_logins(encoded, password, threads=args.threads, logins=args.logins)
+        print(f"{workers:<20} {throughput:>10.1f} {throughput / baseline:>7.2f}x")
+        workers *= 2
+
+    hashing.shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Cold start of a worker: the time from spawning a fresh interpreter to
+the application being loaded, and to its first response.
+
+    python -m benchmarks.startup --runs 10
+    python -m benchmarks.startup --entrypoint asgi --save benchmarks/baselines/startup.json
+    python -m benchmarks.startup --baseline benchmarks/baselines/startup.json --tolerance 0.2
+
+Each run starts a new process, imports `core.wsgi` (or `core.asgi`) and
+sends it one request in-process, without a server. A run compared to a
+baseline exits with 1 when the median time to first response is slower
+than the baseline by more than the tolerance. `python manage.py
+import_time_report` shows which imports the time goes to.
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Typing Imports
+from typing import Any, Dict, List
+
+from benchmarks.utils import format_time
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Run in the fresh process, prints the wall clock time of each step
+CHILD = """
+import json, sys, time
+started_at = time.time()
+
+entrypoint, path = sys.argv[1:]
+
+if entrypoint == "asgi":
+    from core.asgi import application
+    loaded_at = time.time()
+
+    from asgiref.sync import async_to_sync
+    from asgiref.testing import ApplicationCommunicator
+
+    async def request():
+        communicator = ApplicationCommunicator(application, {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+            "headers": [(b"host", b"127.0.0.1")], "server": ("127.0.0.1", 80), "client": ("127.0.0.1", 5000),
+        })
+        await communicator.send_input({"type": "http.request", "body": b""})
+        response = await communicator.receive_output(timeout=30)
+        await communicator.wait(timeout=30)
+        return response["status"]
+
+    status = async_to_sync(request)()
+else:
+    from core.wsgi import application
+    loaded_at = time.time()
+
+    from wsgiref.util import setup_testing_defaults
+
+    environ = {"PATH_INFO": path, "REQUEST_METHOD": "GET"}
+    setup_testing_defaults(environ)
+    statuses = []
+    response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b"".join(response)
+    response.close()
+    status = int(statuses[0].split()[0])
+
+print(json.dumps({"started_at": started_at, "loaded_at": loaded_at, "responded_at": time.time(), "status": status}))
+"""
+
+
+def run_once(entrypoint: str, path: str) -> Dict[str, Any]:
+    spawned_at = time.time()
+    result = subprocess.run(
+        (sys.executable, "-c", CHILD, entrypoint, path),
+        capture_output=True, text=True, cwd=ROOT_DIR, env=os.environ, check=True,
+    )
+    child = json.loads(result.stdout.strip().splitlines()[-1])
+
+    return {
+        "interpreter": child["started_at"] - spawned_at,
+        "application": child["loaded_at"] - child["started_at"],
+        "first_request": child["responded_at"] - child["loaded_at"],
+        "time_to_first_response": child["responded_at"] - spawned_at,
+        "status": child["status"],
+    }
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = {}
+
+    for step in ("interpreter", "application", "first_request", "time_to_first_response"):
+        timings = [run[step] for run in runs]
+        summary[step] = {"median": statistics.median(timings), "min": min(timings), "max": max(timings)}
+
+    summary["status"] = runs[-1]["status"]
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Processes started.")
+    parser.add_argument("--entrypoint", choices=("wsgi", "asgi"), default="wsgi")
+    parser.add_argument("--path", default="/api/v1/login/", help="Path of the first request.")
+    parser.add_argument("--save", type=Path, help="Writes the results to this JSON baseline.")
+    parser.add_argument("--baseline", type=Path, help="Fails when the results regress from this JSON baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Slowdown of the time to first response allowed.")
+    args = parser.parse_args()
+
+    # The first run warms the disk cache
+    run_once(args.entrypoint, args.path)
+    summary = summarize([run_once(args.entrypoint, args.path) for _ in range(args.runs)])
+
+    print(f"{'step':<24} {'median':>10} {'min':>10} {'max':>10}")
+    for step in ("interpreter", "application", "first_request", "time_to_first_response"):
+        timings = summary[step]
+        print(
+            f"{step:<24} {format_time(timings['median']):>10} "
+            f"{format_time(timings['min']):>10} {format_time(timings['max']):>10}"
+        )
+    print(f"\n{args.entrypoint.upper()} {args.path} answered {summary['status']}")
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "environment": {"python": platform.python_version(), "machine": platform.machine()},
+            "entrypoint": args.entrypoint,
+            "path": args.path,
+            "startup": summary,
+        }, indent=2) + "\n")
+        print(f"Saved to {args.save}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["startup"]["time_to_first_response"]["median"]
+        median = summary["time_to_first_response"]["median"]
+
+        if median > baseline * (1 + args.tolerance):
+            print(f"Regression: time to first response {format_time(median)} > {format_time(baseline)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Per-request cost of the token bucket throttles: a request let through
+and a request turned away, with the in-process and the cache backends,
+and the throughput of the in-process buckets from concurrent threads
+as the number of shards grows.
+
+    python -m benchmarks.throttling --number 20000 --threads 8
+"""
+
+# Standard Library Imports
+import argparse
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Rest Framework Imports
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from rest_framework.parsers import JSONParser
+
+# Account Service Imports
+from authentication_service.services.throttling import buckets
+from authentication_service.throttling import AccountTokenBucketThrottle, IPTokenBucketThrottle
+from benchmarks.utils import bench, print_result
+
+
+# Rates no benchmark runs out of, and one every benchmark runs out of
+ALLOWED = (10**9, 10**9)
+REJECTED = (1, 1e-9)
+
+
+class LoginView:
+    throttle_scope = "login"
+
+
+def run_threads(backend, *, threads: int, number: int) -> float:
+    """Takes `number` tokens from distinct buckets in `threads` threads, returns tokens per second"""
+
+    keys = [uuid.uuid4().hex for _ in range(number)]
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda key: backend.consume(key, *ALLOWED), keys))
+
+    return number / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    for name, backend in (
+        ("local", buckets.LocalBucketBackend()),
+        ("cache", buckets.CacheBucketBackend(alias="default")),
+    ):
+        print_result(
+            f"{name} backend, let through",
+            bench(lambda: backend.consume("allowed", *ALLOWED), number=args.number, repeat=args.repeat),
+        )
+
+        backend.consume("rejected", *REJECTED)
+        print_result(
+            f"{name} backend, turned away",
+            bench(lambda: backend.consume("rejected", *REJECTED), number=args.number, repeat=args.repeat),
+        )
+
+    buckets.configure(
+        backend=buckets.LocalBucketBackend(),
+        rates={"login_ip": "1000000000/s", "login_account": "1000000000/s"},
+    )
+    request = Request(
+        APIRequestFactory().post("/", {"email": "israelabraham@email.com"}, format="json"),
+        parsers=[JSONParser()],
+    )
+    view = LoginView()
+
+    def throttle_request():
+        IPTokenBucketThrottle().allow_request(request, view)
+        AccountTokenBucketThrottle().allow_request(request, view)
+
+    print_result("login throttles per request", bench(throttle_request, number=args.number, repeat=args.repeat))
+
+    print(f"\n{'shards':<8} {'tokens/s':>12}  ({args.threads} threads)")
+    for shards in (1, 4, 16, 64):
+        backend = buckets.LocalBucketBackend(shards=shards)
+        print(f"{shards:<8} {run_threads(backend, threads=args.threads, number=args.number):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
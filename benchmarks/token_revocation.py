@@ -0,0 +1,88 @@
+"""
+False positive rate of the revoked tokens Bloom filter, and the
+per-request cost of a revocation check with and without it.
+
+    python -m benchmarks.token_revocation --revoked 10000 --number 2000
+"""
+
+# Standard Library Imports
+import argparse
+import uuid
+from datetime import timedelta
+
+from benchmarks import setup_django
+
+setup_django()
+
+# Django Imports
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+# Account Service Imports
+from authentication_service.models import RevokedToken
+from authentication_service.services.tokens import revocation
+from authentication_service.services.tokens.bloom import BloomFilter
+from benchmarks.utils import bench, print_result
+
+
+def measure_false_positives(*, capacity: int, error_rate: float, probes: int) -> None:
+    bloom = BloomFilter.for_capacity(capacity, error_rate)
+
+    for _ in range(capacity):
+        bloom.add(uuid.uuid4().hex)
+
+    false_positives = sum(uuid.uuid4().hex in bloom for _ in range(probes))
+    print(
+        f"{capacity:<10} {error_rate:<10} {false_positives / probes:<12.5f} "
+        f"{bloom.hashes:<8} {len(bloom.bits) / 1024:>8.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--revoked", type=int, default=10_000, help="Revoked tokens in the table.")
+    parser.add_argument("--probes", type=int, default=100_000, help="Valid jtis checked for false positives.")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'capacity':<10} {'target':<10} {'measured':<12} {'hashes':<8} {'size':>12}")
+    for error_rate in (0.01, 0.001, 0.0001):
+        measure_false_positives(capacity=args.revoked, error_rate=error_rate, probes=args.probes)
+    print()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+
+    try:
+        expires_at = timezone.now() + timedelta(days=1)
+        RevokedToken.objects.bulk_create(
+            [
+                RevokedToken(jti=uuid.uuid4().hex, token_type="access", expires_at=expires_at)
+                for _ in range(args.revoked)
+            ],
+            batch_size=1000,
+        )
+        revocation.revocation_filter.refresh()
+
+        print_result(
+            "database lookup per request",
+            bench(
+                lambda: RevokedToken.objects.filter(jti=uuid.uuid4().hex).exists(),
+                number=args.number, repeat=args.repeat,
+            ),
+        )
+        print_result(
+            "bloom filter check per request",
+            bench(lambda: revocation.is_token_revoked(uuid.uuid4().hex), number=args.number, repeat=args.repeat),
+        )
+        print(f"\n{revocation.revocation_stats()}")
+
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == "__main__":
+    main()
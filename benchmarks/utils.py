@@ -0,0 +1,64 @@
+# Standard Library Imports
+import statistics
+import time
+
+# Typing Imports
+from typing import Callable, Dict
+
+
+def bench(func: Callable[[], object], *, number: int = 1000, repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """
+    Times `func` in `repeat` runs of `number` loops and returns the
+    per-call mean, standard deviation and best time in seconds.
+    """
+
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+
+    timings = []
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started_at) / number)
+
+    return {
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "best": min(timings),
+        "timings": timings,
+    }
+
+
+def calibrate(func: Callable[[], object], *, min_time: float = 0.1) -> int:
+    """The number of loops `func` must run for a run to last at least `min_time` seconds"""
+
+    number = 1
+
+    while True:
+        started_at = time.perf_counter()
+        for _ in range(number):
+            func()
+
+        if time.perf_counter() - started_at >= min_time:
+            return number
+        number *= 2
+
+
+def format_time(seconds: float) -> str:
+    """Formats a duration with a readable unit"""
+
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def print_result(name: str, result: Dict[str, float]) -> None:
+    print(
+        f"{name:<40} {format_time(result['mean']):>12} "
+        f"+- {format_time(result['stdev']):>10} (best {format_time(result['best'])})"
+    )
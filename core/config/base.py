@@ -56,6 +56,14 @@ THIRD_PARTY_APPS = [
 INSTALLED_APPS = LOCAL_APPS + OWN_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    # Outermost, so that the timings cover the whole request
+    "authentication_service.middleware.ServerTimingMiddleware",
+    "authentication_service.middleware.RequestMetricsMiddleware",
+    "authentication_service.middleware.ProfilingMiddleware",
+    
+    # Before the sessions and the authentication, which may write
+    "authentication_service.middleware.DatabaseRoutingMiddleware",
+    
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     
@@ -67,14 +75,19 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    
+    # Account Service Middleware
+    "authentication_service.middleware.UserIdentityMapMiddleware",
 ]
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.coreapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.BasicAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication_service.authentication.CachedJWTAuthentication",
     ),
+    # Proxies in front of the service, 0 ignores the client supplied X-Forwarded-For
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
 }
 
 SIMPLE_JWT = {
@@ -96,7 +109,7 @@ SIMPLE_JWT = {
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
     "USER_AUTHENTICATION_RULE": "rest_framework_simplejwt.authentication.default_user_authentication_rule",
-    "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "AUTH_TOKEN_CLASSES": ("authentication_service.services.tokens.jwt.RevocableAccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
     "JTI_CLAIM": "jti",
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
@@ -133,11 +146,26 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "core.wsgi.application"
 
+# Reads go to the `database_replicas`, unless the request wrote or is in a transaction
+DATABASE_ROUTERS = ["authentication_service.routers.PrimaryReplicaRouter"]
+
+# Runs the tests without the login and email throttles
+TEST_RUNNER = "authentication_service.tests.runner.TestRunner"
+
 
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
+# Password hashers, tuned for the host by `python manage.py calibrate_hashers`
+PASSWORD_HASHERS = [
+    "authentication_service.hashers.CalibratedPBKDF2PasswordHasher",
+    "authentication_service.hashers.CalibratedArgon2PasswordHasher",
+    "authentication_service.hashers.CalibratedScryptPasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"
@@ -176,7 +204,7 @@ AUTH_USER_MODEL = "authentication_service.AccountUser"
 REGISTER_USER_MODEL = True
 
 # Email Backend Definition
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = "authentication_service.services.emails.backends.PooledSMTPEmailBackend"
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_USE_TLS = True
 EMAIL_PORT = 587
@@ -194,5 +222,103 @@ GOOGLE_OAUTH2_CLIENT_ID = config("GOOGLE_OAUTH2_CLIENT_ID")
 # Authentication Service Definition
 AUTHENTICATION_SERVICE = {
     "site_name": "Authentication Service",
-    "contact_email": "contact@authentication-service.com"
+    "contact_email": "contact@authentication-service.com",
+    
+    # Email outbox, delivered by `python manage.py process_email_outbox`
+    "email_outbox_batch_size": 50,
+    "email_outbox_max_attempts": 5,
+    "email_outbox_retry_delay": 30,  # seconds, doubled on every failed attempt
+    "email_outbox_max_retry_delay": 3600,
+    
+    # Pooled SMTP connections, used by the `PooledSMTPEmailBackend`
+    "email_pool_size": 4,
+    "email_pool_max_idle": 60,  # seconds before an idle connection is checked with NOOP
+    "email_pool_max_messages": 100,  # messages sent before a connection is retired
+    
+    # Password hashing processes, `None` uses one per core and `0` hashes in the request thread
+    "password_hashing_workers": None,
+    
+    # Hasher parameters written by `python manage.py calibrate_hashers`
+    "password_hasher_calibration": BASE_DIR / "hasher-calibration.json",
+    
+    # Users resolved by `CachedJWTAuthentication`
+    "auth_user_cache": "default",  # alias in CACHES
+    "auth_user_cache_timeout": 300,
+    "auth_user_cache_local_size": 1024,  # users kept in the per process LRU
+    "auth_user_cache_local_ttl": 5,  # seconds a process may miss another process's write
+    
+    # Seconds between the refreshes of the table read by `StatelessJWTAuthentication`
+    "credential_epoch_refresh_interval": 1,
+    "credential_epoch_unknown_user_ttl": 30,  # seconds an unknown user id isn't looked up again
+    
+    # Revoked tokens, purged by `python manage.py purge_revoked_tokens`
+    "token_revocation_refresh_interval": 1,  # seconds before a process sees another one's revocations
+    "token_revocation_capacity": 100_000,  # revoked tokens held by the Bloom filter before it is rebuilt
+    "token_revocation_error_rate": 0.001,  # share of the valid tokens checked against the database
+    "token_revocation_purge_batch_size": 1000,
+    
+    # Asymmetric JWT signing keys, the first one signs new tokens. Without
+    # keys, tokens are signed with the `SIMPLE_JWT` algorithm and key.
+    # e.g. [{"kid": "2022-10", "algorithm": "RS256", "private_key_path": "keys/2022-10.pem"}]
+    "jwt_signing_keys": [],
+    "jwks_max_age": 3600,  # seconds consumers may cache /.well-known/jwks.json
+    
+    # Class fetching the keys Google ID tokens are verified with
+    "google_oauth2_key_source": "authentication_service.services.oauth2.google.GoogleCertsKeySource",
+    
+    # Pooled HTTP client of the OAuth providers
+    "oauth_http_timeout": 5,  # seconds
+    "oauth_http_connect_timeout": 2,
+    "oauth_http_max_connections": 20,
+    "oauth_http_max_keepalive": 10,  # idle connections kept alive
+    "oauth_http_keepalive_expiry": 30,  # seconds before an idle connection is closed
+    "oauth_http_host_limits": {},  # e.g. {"www.googleapis.com": 10}
+    
+    # Token buckets of the login and email sending endpoints, per client IP and per account
+    "throttle_backend": "authentication_service.services.throttling.buckets.LocalBucketBackend",
+    "throttle_cache": "default",  # alias in CACHES, used by the `CacheBucketBackend`
+    "throttle_local_shards": 16,
+    "throttle_local_size": 100_000,  # buckets kept in memory by a process
+    "throttle_rates": {
+        "login_ip": "30/min",
+        "login_account": "10/min",
+        "request_email_ip": "10/min",
+        "request_email_account": "5/hour",
+        "reset_password_ip": "10/min",
+        "reset_password_account": "5/hour",
+    },
+    
+    # Requests timed by the `ServerTimingMiddleware`, logged to the
+    # "authentication_service.timings" logger and sent in a Server-Timing header
+    "server_timing_sample_rate": 0.1,  # share of the requests timed
+    "server_timing_header": True,  # False only logs the timings
+    "server_timing_path_prefix": "/api/v1/",
+    
+    # Directory the workers write their metrics to, served together at /metrics.
+    # Empty it before the workers start. Defaults to $PROMETHEUS_MULTIPROC_DIR,
+    # or a directory in the system's temporary directory.
+    "metrics_dir": None,
+    
+    # Clients allowed to read /metrics: the addresses and networks of `metrics_allowed_ips`,
+    # and the requests with an `Authorization: Bearer <metrics_token>` header
+    "metrics_allowed_ips": ["127.0.0.1", "::1"],
+    "metrics_token": config("METRICS_TOKEN", default=""),
+    
+    # Requests profiled by the `ProfilingMiddleware`: a sample of them, and the ones with
+    # an X-Profile-Request header from `python manage.py profiling_token`. Merge the
+    # profiles with `python manage.py merge_profiles`.
+    "profiling_sample_rate": 0.0,
+    "profiling_mode": "sampling",  # or "cprofile"
+    "profiling_interval": 0.005,  # seconds between two samples of the stack
+    "profiling_path_prefix": "/api/v1/",
+    "profiling_dir": None,  # defaults to a directory in the system's temporary directory
+    "profiling_max_files": 500,  # the oldest profiles are deleted beyond
+    "profiling_token_max_age": 3600,  # seconds a profiling token is valid
+    
+    # OpenAPI schema written by `python manage.py generate_api_schema`, e.g. at build time.
+    # Served until the URLconf changes, the schema is generated on the first request without it.
+    "api_schema_path": None,
+    
+    # Aliases in DATABASES the reads are sent to, e.g. from $DATABASE_REPLICA_URLS in production
+    "database_replicas": [],
 }
\ No newline at end of file
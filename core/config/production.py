@@ -1,4 +1,5 @@
 from core.config.base import * #noqa
+from decouple import Csv
 
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -11,4 +12,13 @@ ALLOWED_HOSTS = ["*"]
 
 DATABASES = {
     "default": dj_database_url.parse(config("DATABASE_URL")),
-}
\ No newline at end of file
+}
+
+# Read replicas, as a comma separated list of database URLs
+DATABASE_REPLICA_URLS = config("DATABASE_REPLICA_URLS", default="", cast=Csv())
+
+for index, url in enumerate(DATABASE_REPLICA_URLS):
+    # Tests read the replicas through the test database of the primary
+    DATABASES[f"replica_{index}"] = {**dj_database_url.parse(url), "TEST": {"MIRROR": "default"}}
+
+AUTHENTICATION_SERVICE["database_replicas"] = [f"replica_{index}" for index in range(len(DATABASE_REPLICA_URLS))]
@@ -0,0 +1,27 @@
+# DRF YASG Imports
+from drf_yasg import openapi
+
+# Rest Framework Imports
+from rest_framework import permissions
+
+# Account Service Imports
+from authentication_service.schema import get_cached_schema_view
+
+
+# Schema Definition, generated once per URLconf and served with an ETag
+schema_view = get_cached_schema_view(
+   openapi.Info(
+      title="Authentication Service Backend",
+      default_version='v1',
+      description="Handles storage of users and authentication of their identities.",
+      terms_of_service="https://www.google.com/policies/terms/",
+      contact=openapi.Contact(email="israelvictory87@gmail.com"),
+   ),
+   public=True,
+   permission_classes=(permissions.AllowAny,),
+)
+
+# api documentation views, imported on their first request by core.urls
+schema_json = schema_view.without_ui(cache_timeout=0)
+api_docs_swagger = schema_view.with_ui('swagger', cache_timeout=0)
+api_docs_redoc = schema_view.with_ui('redoc', cache_timeout=0)
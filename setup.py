@@ -11,7 +11,7 @@ os.chdir(os.path.normpath(os.path.join(os.path.abspath(__file__), os.pardir)))
 setup(
     name = 'django-authentication-service',
     version = '0.0.2',
-    packages = find_packages(exclude=["*tests", "core"]),
+    packages = find_packages(exclude=["*tests", "core", "benchmarks"]),
     include_package_data = True,
     license = 'CC0 1.0 Universal Public Domain Dedication',
     description = '🔐 Handles storage of users and authentication of their identities.',